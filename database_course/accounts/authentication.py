@@ -0,0 +1,30 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+
+from accounts.models import User
+from accounts.tokens import ACTIVE_STATUS, is_revoked
+from database_course.cache import cache_is_shared
+
+
+class ClaimsJWTAuthentication(JWTStatelessUserAuthentication):
+    """
+    Authenticates from the access token's claims alone: request.user is a
+    TokenUser exposing user_id, role and status, without a database query.
+    Users blocked or deleted since the token was issued are caught by the
+    short-lived revocation marks in the cache (see accounts.signals). Those
+    marks only reach every process through a shared cache; with a
+    per-process one the user's status is read from the database instead.
+    """
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        if validated_token.get("status") != ACTIVE_STATUS or not self.is_active(user.id):
+            raise AuthenticationFailed("User is inactive or blocked.", code="user_inactive")
+        return user
+
+    def is_active(self, user_id):
+        if cache_is_shared():
+            return not is_revoked(user_id)
+        return User.objects.filter(
+            pk=user_id, status__code=ACTIVE_STATUS, pending_delete=False
+        ).exists()
@@ -0,0 +1,240 @@
+import csv
+import io
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, make_password
+from django.db import connection, transaction
+from rest_framework import serializers
+
+from accounts.serializers import UserImportRowSerializer
+from accounts.tokens import ACTIVE_STATUS
+from dictionaries.lookups import dictionary_codes
+from dictionaries.models import Role, UserStatus
+
+
+COLUMNS = list(UserImportRowSerializer().fields)
+
+EMAIL_TAKEN = "user with this email already exists."
+EMAIL_REPEATED = "Email repeats the one on line {line}."
+
+# Dropped on commit. In COPY's csv format an empty cell is NULL, so
+# FORCE_NOT_NULL reads it as an empty string outside the nullable columns.
+STAGING_SQL = """
+CREATE TEMPORARY TABLE accounts_user_import (
+    line integer PRIMARY KEY,
+    email varchar(254) NOT NULL,
+    password_hash varchar(255) NOT NULL,
+    first_name varchar(150) NOT NULL,
+    last_name varchar(150) NOT NULL,
+    phone varchar(50) NOT NULL,
+    role_id integer NOT NULL,
+    status_id integer NOT NULL,
+    is_teacher boolean NOT NULL,
+    birth_date date,
+    education_level varchar(150) NOT NULL,
+    university varchar(150) NOT NULL,
+    faculty varchar(150) NOT NULL,
+    year_of_study integer,
+    scholarship boolean NOT NULL,
+    academic_degree varchar(150) NOT NULL,
+    experience_years integer,
+    specialization varchar(150) NOT NULL,
+    bio text NOT NULL,
+    first_line integer,
+    user_id integer
+) ON COMMIT DROP
+"""
+
+STAGING_COLUMNS = [
+    "line", "email", "password_hash", "first_name", "last_name", "phone",
+    "role_id", "status_id", "is_teacher", "birth_date", "education_level",
+    "university", "faculty", "year_of_study", "scholarship", "academic_degree",
+    "experience_years", "specialization", "bio",
+]
+NULLABLE_COLUMNS = {"birth_date", "year_of_study", "experience_years"}
+
+COPY_SQL = "COPY accounts_user_import ({}) FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL ({}))".format(
+    ", ".join(STAGING_COLUMNS),
+    ", ".join(column for column in STAGING_COLUMNS if column not in NULLABLE_COLUMNS),
+)
+
+# Later lines repeating an address (in any casing) point at its first line.
+MARK_REPEATS_SQL = """
+UPDATE accounts_user_import AS s
+SET first_line = f.line
+FROM (
+    SELECT lower(email) AS email_lower, min(line) AS line
+    FROM accounts_user_import
+    GROUP BY 1
+    HAVING count(*) > 1
+) AS f
+WHERE lower(s.email) = f.email_lower AND s.line > f.line
+"""
+
+# Existing addresses, including ones committed concurrently, are skipped by
+# the lower(email) unique index and leave user_id NULL.
+INSERT_USERS_SQL = """
+WITH inserted AS (
+    INSERT INTO accounts_user (
+        email, password_hash, first_name, last_name, phone, date_registered,
+        last_login, pending_delete, role_id, status_id
+    )
+    SELECT email, password_hash, first_name, last_name, phone, now(),
+        NULL, false, role_id, status_id
+    FROM accounts_user_import
+    WHERE first_line IS NULL
+    ORDER BY line
+    ON CONFLICT ((lower(email))) DO NOTHING
+    RETURNING user_id, lower(email) AS email_lower
+)
+UPDATE accounts_user_import AS s
+SET user_id = i.user_id
+FROM inserted AS i
+WHERE lower(s.email) = i.email_lower AND s.first_line IS NULL
+"""
+
+INSERT_STUDENTS_SQL = """
+INSERT INTO accounts_student (
+    student_id, birth_date, education_level, university, faculty,
+    year_of_study, scholarship
+)
+SELECT user_id, birth_date, education_level, university, faculty,
+    year_of_study, scholarship
+FROM accounts_user_import
+WHERE user_id IS NOT NULL AND NOT is_teacher
+"""
+
+INSERT_TEACHERS_SQL = """
+INSERT INTO accounts_teacher (
+    teacher_id, academic_degree, experience_years, specialization, bio
+)
+SELECT user_id, academic_degree, experience_years, specialization, bio
+FROM accounts_user_import
+WHERE user_id IS NOT NULL AND is_teacher
+"""
+
+REJECTED_SQL = """
+SELECT line, first_line FROM accounts_user_import WHERE user_id IS NULL ORDER BY line
+"""
+
+
+def _chunks(rows, size):
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _hash_passwords(passwords):
+    """
+    Hashes the given passwords on a thread pool (PBKDF2 releases the GIL).
+    Each hash takes a few hundred milliseconds, so imports that leave
+    passwords blank, and let users set them later, are much faster.
+    """
+    if not passwords:
+        return []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(make_password, passwords))
+
+
+def _staging_rows(chunk, role_ids, status_ids):
+    passwords = _hash_passwords([data["password"] for _, data in chunk if data.get("password")])
+    hashed = iter(passwords)
+    for line, data in chunk:
+        # Without a password the account gets an unusable one, as from
+        # make_password(None) but without drawing 40 random characters each.
+        if data.get("password"):
+            password_hash = next(hashed)
+        else:
+            password_hash = UNUSABLE_PASSWORD_PREFIX + secrets.token_hex(20)
+        yield [
+            line, data["email"], password_hash, data["first_name"], data["last_name"],
+            data["phone"], role_ids[data["role"]], status_ids[data["status"]],
+            data["role"] == "teacher", data["birth_date"], data["education_level"],
+            data["university"], data["faculty"], data["year_of_study"], data["scholarship"],
+            data["academic_degree"], data["experience_years"], data["specialization"],
+            data["bio"],
+        ]
+
+
+def _copy_rows(cursor, rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(COPY_SQL, buffer)
+
+
+def _read_rows(lines):
+    """
+    Yields (line number, row dict) for a CSV with a header line. Unknown
+    columns are rejected up front; blank cells are dropped so defaults apply.
+    """
+    reader = csv.DictReader(lines)
+    if reader.fieldnames is None or "email" not in reader.fieldnames:
+        raise serializers.ValidationError({"file": ["The CSV needs a header line with an email column."]})
+    unknown = sorted(set(reader.fieldnames) - set(COLUMNS))
+    if unknown:
+        raise serializers.ValidationError({"file": [f"Unknown columns: {', '.join(unknown)}."]})
+    for row in reader:
+        yield reader.line_num, {
+            column: value for column, value in row.items() if value not in ("", None)
+        }
+
+
+def import_users(lines):
+    """
+    Imports users with their student or teacher profiles from CSV lines.
+    Rows are validated in chunks of IMPORT_CHUNK_SIZE and COPY-ed into a
+    temporary staging table; users and profiles are then inserted with one
+    statement each. Rows with invalid fields, an address already taken or
+    repeated within the file are reported by line and skipped; the rest are
+    imported together in one transaction.
+    """
+    chunk_size = getattr(settings, "IMPORT_CHUNK_SIZE", 5000)
+    # Looked up once here instead of per user, as UserCreateSerializer does.
+    for code, name in (("student", "Student"), ("teacher", "Teacher")):
+        Role.objects.get_or_create(code=code, defaults={"name": name})
+    UserStatus.objects.get_or_create(code=ACTIVE_STATUS, defaults={"name": "Active"})
+    role_ids = {code: pk for pk, code in dictionary_codes(Role).items()}
+    status_ids = {code: pk for pk, code in dictionary_codes(UserStatus).items()}
+
+    # One instance validates every row; building a serializer per row would
+    # deep-copy its declared fields each time.
+    validator = UserImportRowSerializer(context={"status_codes": set(status_ids)})
+    errors = {}
+    total = 0
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(STAGING_SQL)
+        for chunk in _chunks(_read_rows(lines), chunk_size):
+            total += len(chunk)
+            valid = []
+            for line, row in chunk:
+                try:
+                    valid.append((line, validator.run_validation(row)))
+                except serializers.ValidationError as exc:
+                    errors[line] = exc.detail
+            _copy_rows(cursor, _staging_rows(valid, role_ids, status_ids))
+
+        cursor.execute("ANALYZE accounts_user_import")
+        cursor.execute(MARK_REPEATS_SQL)
+        cursor.execute(INSERT_USERS_SQL)
+        created = cursor.rowcount
+        cursor.execute(INSERT_STUDENTS_SQL)
+        cursor.execute(INSERT_TEACHERS_SQL)
+        cursor.execute(REJECTED_SQL)
+        for line, first_line in cursor.fetchall():
+            message = EMAIL_REPEATED.format(line=first_line) if first_line else EMAIL_TAKEN
+            errors[line] = {"email": [message]}
+
+        # The inserts bypass the post_save receivers, which is fine: new
+        # users have no tokens, courses or enrollments on any cached page.
+
+    return {
+        "created": created,
+        "failed": len(errors),
+        "errors": [{"line": line, "errors": errors[line]} for line in sorted(errors)],
+        "total": total,
+    }
@@ -0,0 +1,99 @@
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection
+
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 1000
+
+# Never moves last_login backwards, e.g. when another process flushed a newer
+# login for the same user first.
+FLUSH_SQL = """
+UPDATE accounts_user AS u
+SET last_login = v.last_login
+FROM (VALUES {values}) AS v(user_id, last_login)
+WHERE u.user_id = v.user_id
+    AND (u.last_login IS NULL OR u.last_login < v.last_login)
+"""
+
+
+class LastLoginBuffer:
+    """
+    Collects last_login touches in process and writes them behind in one
+    UPDATE ... FROM (VALUES ...) per batch. A background thread flushes every
+    LAST_LOGIN_FLUSH_INTERVAL seconds, which bounds how stale a stored
+    last_login can be; reaching LAST_LOGIN_MAX_PENDING users flushes early,
+    and whatever is left is flushed when the interpreter exits.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.wake = threading.Event()
+        self.thread = None
+
+    def record(self, user_id, moment):
+        with self.lock:
+            self._merge({user_id: moment})
+            size = len(self.pending)
+            if self.thread is None:
+                self._start()
+        if size >= getattr(settings, "LAST_LOGIN_MAX_PENDING", 5000):
+            self.wake.set()
+
+    def _merge(self, touches):
+        for user_id, moment in touches.items():
+            current = self.pending.get(user_id)
+            if current is None or moment > current:
+                self.pending[user_id] = moment
+
+    def _start(self):
+        self.thread = threading.Thread(target=self._run, name="last-login-flush", daemon=True)
+        self.thread.start()
+        atexit.register(self.flush)
+
+    def _run(self):
+        interval = getattr(settings, "LAST_LOGIN_FLUSH_INTERVAL", 5)
+        while True:
+            self.wake.wait(interval)
+            self.wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Flushing buffered last_login values failed")
+            finally:
+                connection.close()
+
+    def flush(self):
+        """
+        Writes every pending touch and returns the number of users written.
+        On failure the touches go back into the buffer for the next attempt.
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        # Sorted, so concurrent flushes from several processes lock rows in
+        # the same order.
+        items = sorted(pending.items())
+        try:
+            for start in range(0, len(items), FLUSH_BATCH_SIZE):
+                batch = items[start:start + FLUSH_BATCH_SIZE]
+                values = ", ".join(["(%s::integer, %s::timestamptz)"] * len(batch))
+                params = [value for item in batch for value in item]
+                with connection.cursor() as cursor:
+                    cursor.execute(FLUSH_SQL.format(values=values), params)
+        except Exception:
+            with self.lock:
+                self._merge(pending)
+            raise
+        return len(items)
+
+
+last_login_buffer = LastLoginBuffer()
+
+
+def touch_last_login(user_id, moment):
+    last_login_buffer.record(user_id, moment)
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from accounts.models import User
+from database_course.benchmarking import explain, rolled_back, seq_scans, timed
+
+
+SEED_USERS = """
+INSERT INTO accounts_user (
+    email, password_hash, first_name, last_name, phone,
+    date_registered, pending_delete, role_id, status_id
+)
+SELECT
+    'Bench.User' || i || '@Example.invalid', '!', '', '', '', now(), false,
+    (SELECT MIN(role_id) FROM dictionaries_role),
+    (SELECT MIN(status_id) FROM dictionaries_userstatus)
+FROM generate_series(1, %(users)s) AS i
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds synthetic users inside a rolled-back transaction and checks that "
+        "the case-insensitive email lookup stays an index scan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10_000_000)
+
+    def handle(self, *args, **options):
+        users = options["users"]
+        with rolled_back():
+            with connection.cursor() as cursor:
+                with timed(self.stdout, f"seed {users} users"):
+                    cursor.execute(SEED_USERS, {"users": users})
+                cursor.execute("ANALYZE accounts_user")
+
+            probe = f"bench.user{users // 2}@EXAMPLE.invalid"
+            cases = [
+                ("by_email, differently cased", User.objects.by_email(probe)),
+                ("by_email, missing address", User.objects.by_email("nobody@example.invalid")),
+                ("email__iexact (UPPER, not indexed)", User.objects.filter(email__iexact=probe)),
+            ]
+            for label, queryset in cases:
+                elapsed, plan = explain(queryset)
+                self.stdout.write(
+                    f"{label}: {elapsed} ms, "
+                    f"{'seq scan' if seq_scans(plan, 'accounts_user') else 'index'} on accounts_user"
+                )
+                if options["verbosity"] > 1:
+                    self.stdout.write(plan)
@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from accounts.models import User
+from database_course.benchmarking import explain, rolled_back, seq_scans, timed
+from database_course.pagination import estimated_count
+from dictionaries.models import Role, UserStatus
+
+
+# Roles and statuses cycle over the existing rows; registrations spread over
+# about three years, and every 1000th user gets a rare name.
+SEED_USERS = """
+INSERT INTO accounts_user (
+    email, password_hash, first_name, last_name, phone,
+    date_registered, pending_delete, role_id, status_id
+)
+SELECT
+    'dir.user' || i || '@example.invalid', '!',
+    CASE WHEN i %% 1000 = 0 THEN 'Rareson' ELSE 'User' || (i %% 50000) END,
+    'Bench', '',
+    now() - (i %% 1000000) * interval '90 seconds', false,
+    roles.ids[1 + i %% array_length(roles.ids, 1)],
+    statuses.ids[1 + (i / 7) %% array_length(statuses.ids, 1)]
+FROM generate_series(1, %(users)s) AS i,
+    (SELECT array_agg(role_id ORDER BY role_id) AS ids FROM dictionaries_role) AS roles,
+    (SELECT array_agg(status_id ORDER BY status_id) AS ids FROM dictionaries_userstatus) AS statuses
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds synthetic users inside a rolled-back transaction and explains the "
+        "user directory's filter combinations and its estimated count."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=2_000_000)
+
+    def handle(self, *args, **options):
+        users = options["users"]
+        with rolled_back():
+            with connection.cursor() as cursor:
+                with timed(self.stdout, f"seed {users} users"):
+                    cursor.execute(SEED_USERS, {"users": users})
+                cursor.execute("ANALYZE accounts_user")
+
+            directory = User.objects.filter(pending_delete=False).order_by(
+                "-date_registered", "-user_id"
+            )
+            role_id = Role.objects.order_by("pk").values_list("pk", flat=True).last()
+            status_id = UserStatus.objects.order_by("pk").values_list("pk", flat=True).last()
+            since = timezone.now() - timedelta(days=30)
+            cases = [
+                ("unfiltered page", directory),
+                ("role", directory.filter(role_id=role_id)),
+                ("status", directory.filter(status_id=status_id)),
+                ("role + status", directory.filter(role_id=role_id, status_id=status_id)),
+                ("registered in the last 30 days", directory.filter(date_registered__gte=since)),
+                ("name prefix", directory.prefix_search("rareso")),
+                ("email prefix", directory.prefix_search("dir.user12345")),
+            ]
+            for label, queryset in cases:
+                elapsed, plan = explain(queryset[:20])
+                self.stdout.write(
+                    f"{label}: {elapsed} ms, "
+                    f"{'seq scan' if seq_scans(plan, 'accounts_user') else 'index'} on accounts_user"
+                )
+                if options["verbosity"] > 1:
+                    self.stdout.write(plan)
+
+            with timed(self.stdout, "exact COUNT(*)"):
+                exact = directory.count()
+            with timed(self.stdout, "estimated count"):
+                estimate, _ = estimated_count(directory, 1000)
+            self.stdout.write(f"exact {exact}, estimated {estimate}")
@@ -0,0 +1,36 @@
+import io
+
+from django.core.management.base import BaseCommand
+
+from accounts.imports import import_users
+from database_course.benchmarking import rolled_back, timed
+
+
+HEADER = "email,first_name,last_name,role,birth_date,university,year_of_study,academic_degree\n"
+
+
+def synthetic_csv(rows):
+    lines = [HEADER]
+    for i in range(rows):
+        if i % 10 == 0:
+            lines.append(f"bench.import{i}@example.invalid,Teacher,{i},teacher,,,,PhD\n")
+        else:
+            lines.append(f"bench.import{i}@example.invalid,Student,{i},student,2004-05-06,NURE,{i % 5 + 1},\n")
+    return io.StringIO("".join(lines))
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports a synthetic CSV of students and teachers without passwords "
+        "inside a rolled-back transaction and reports the time taken."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100_000)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        with rolled_back():
+            with timed(self.stdout, f"import {rows} rows"):
+                report = import_users(synthetic_csv(rows))
+        self.stdout.write(f"created {report['created']}, failed {report['failed']}")
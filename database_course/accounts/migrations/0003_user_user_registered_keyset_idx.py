@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_role'),
+        ('dictionaries', '0007_auto_20260117_1421'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['-date_registered', '-user_id'], name='user_registered_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_name_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='pending_delete',
+            field=models.BooleanField(default=False),
+        ),
+    ]
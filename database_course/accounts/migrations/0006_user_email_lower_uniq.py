@@ -0,0 +1,26 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:41
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_user_pending_delete'),
+        ('dictionaries', '0007_auto_20260117_1421'),
+    ]
+
+    # Creating the index fails if addresses differing only in case already
+    # exist; those accounts have to be merged by hand first.
+    operations = [
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='user_email_lower_uniq'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(max_length=254),
+        ),
+    ]
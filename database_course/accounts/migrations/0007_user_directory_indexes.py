@@ -0,0 +1,28 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:44
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_user_email_lower_uniq'),
+        ('dictionaries', '0007_auto_20260117_1421'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('pending_delete', False)), fields=['role', '-date_registered', '-user_id'], name='user_role_registered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('pending_delete', False)), fields=['status', '-date_registered', '-user_id'], name='user_status_registered_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Lower('email'), name='text_pattern_ops'), name='user_email_prefix_idx'),
+        ),
+    ]
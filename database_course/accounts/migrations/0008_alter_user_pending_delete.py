@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_user_directory_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='pending_delete',
+            field=models.BooleanField(db_default=False, default=False),
+        ),
+    ]
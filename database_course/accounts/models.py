@@ -1,11 +1,39 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import Q, Value
+from django.db.models.functions import Lower, Upper
 
 from dictionaries.models import Role, UserStatus
 
 
+class UserQuerySet(models.QuerySet):
+    def by_email(self, email):
+        """
+        Case-insensitive match served by the unique lower(email) index; the
+        stored address keeps the casing it was registered with.
+        """
+        return self.alias(email_lower=Lower("email")).filter(email_lower=Lower(Value(email)))
+
+    def prefix_search(self, text):
+        """
+        Every word has to start the email, first name or last name. Served by
+        user_email_prefix_idx and the name trigram indexes, which istartswith
+        can use because it compiles to UPPER(col) LIKE 'TERM%'.
+        """
+        queryset = self.alias(email_lower=Lower("email"))
+        for term in text.split():
+            queryset = queryset.filter(
+                Q(email_lower__startswith=term.lower())
+                | Q(first_name__istartswith=term)
+                | Q(last_name__istartswith=term)
+            )
+        return queryset
+
+
 class User(models.Model):
     user_id = models.AutoField(primary_key=True)
-    email = models.EmailField(unique=True)
+    # Unique regardless of case, see user_email_lower_uniq.
+    email = models.EmailField()
     password_hash = models.CharField(max_length=255)
     first_name = models.CharField(max_length=150, blank=True)
     last_name = models.CharField(max_length=150, blank=True)
@@ -14,6 +42,48 @@ class User(models.Model):
     last_login = models.DateTimeField(null=True, blank=True)
     role = models.ForeignKey(Role, on_delete=models.PROTECT)
     status = models.ForeignKey(UserStatus, on_delete=models.PROTECT)
+    # Set while a deletion job removes the user; such users are hidden.
+    pending_delete = models.BooleanField(default=False, db_default=False)
+
+    objects = UserQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(Lower("email"), name="user_email_lower_uniq"),
+        ]
+        indexes = [
+            models.Index(
+                fields=["-date_registered", "-user_id"], name="user_registered_keyset_idx"
+            ),
+            # The directory lists visible users newest first; these serve its
+            # role and status filters in that order without a sort.
+            models.Index(
+                fields=["role", "-date_registered", "-user_id"],
+                name="user_role_registered_idx",
+                condition=Q(pending_delete=False),
+            ),
+            models.Index(
+                fields=["status", "-date_registered", "-user_id"],
+                name="user_status_registered_idx",
+                condition=Q(pending_delete=False),
+            ),
+            # text_pattern_ops lets LIKE 'prefix%' use the index under any
+            # collation, which user_email_lower_uniq cannot.
+            models.Index(
+                OpClass(Lower("email"), name="text_pattern_ops"),
+                name="user_email_prefix_idx",
+            ),
+            # icontains compiles to UPPER(col) LIKE UPPER(%s), so the trigram
+            # indexes are built on the same expression.
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="user_first_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="user_last_name_trgm_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.email
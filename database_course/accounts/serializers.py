@@ -1,6 +1,13 @@
+from django.contrib.auth.hashers import make_password
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 
 from accounts.models import Student, Teacher, User
+from accounts.tokens import ACTIVE_STATUS, can_log_in, issue_tokens, verify_password
+from dictionaries.lookups import dictionary_codes
 from dictionaries.models import Role, UserStatus
 
 
@@ -23,8 +30,16 @@ class UserCreateSerializer(serializers.ModelSerializer):
             "last_login",
         ]
         read_only_fields = ["user_id", "date_registered", "last_login"]
+        # Takes the plain password; only its hash is stored.
+        extra_kwargs = {"password_hash": {"write_only": True}}
+
+    def validate_email(self, value):
+        if User.objects.by_email(value).exists():
+            raise serializers.ValidationError("user with this email already exists.")
+        return value
 
     def create(self, validated_data):
+        validated_data["password_hash"] = make_password(validated_data["password_hash"])
         role, _ = Role.objects.get_or_create(
             code="student", defaults={"name": "Student"}
         )
@@ -41,7 +56,52 @@ class UserLoginSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
-        fields = ["user_id", "email", "password_hash", "status_id"]
+        fields = ["user_id", "email", "status_id"]
+
+
+LOGIN_FAILED = "No active account found with the given credentials."
+
+
+class TokenObtainSerializer(serializers.Serializer):
+    email = serializers.EmailField(write_only=True)
+    password = serializers.CharField(write_only=True, trim_whitespace=False)
+
+    def validate(self, attrs):
+        user = (
+            User.objects.select_related("role", "status")
+            .by_email(attrs["email"])
+            .first()
+        )
+        if user is None:
+            # Hash anyway so unknown emails take as long as wrong passwords.
+            make_password(attrs["password"])
+            raise AuthenticationFailed(LOGIN_FAILED, code="no_active_account")
+        if not verify_password(user, attrs["password"]) or not can_log_in(user):
+            raise AuthenticationFailed(LOGIN_FAILED, code="no_active_account")
+        return {"user": user, **issue_tokens(user)}
+
+
+class TokenRefreshSerializer(serializers.Serializer):
+    """
+    Issues a new access token after re-reading the user, so role and status
+    changes reach the claims and blocked users cannot refresh.
+    """
+
+    refresh = serializers.CharField(write_only=True)
+
+    def validate(self, attrs):
+        try:
+            refresh = RefreshToken(attrs["refresh"])
+        except TokenError as exc:
+            raise AuthenticationFailed(str(exc), code="token_not_valid")
+        user = (
+            User.objects.select_related("role", "status")
+            .filter(user_id=refresh[api_settings.USER_ID_CLAIM])
+            .first()
+        )
+        if user is None or not can_log_in(user):
+            raise AuthenticationFailed(LOGIN_FAILED, code="no_active_account")
+        return {"access": issue_tokens(user)["access"]}
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
@@ -71,7 +131,9 @@ class UserUpdateSerializer(serializers.ModelSerializer):
 
 
 class UserListSerializer(serializers.ModelSerializer):
-    status_code = serializers.CharField(source="status.code", read_only=True)
+    # Looked up in the cached {status_id: code} map passed by the view, so
+    # pages need no join with the statuses table.
+    status_code = serializers.SerializerMethodField()
 
     class Meta:
         model = User
@@ -85,6 +147,43 @@ class UserListSerializer(serializers.ModelSerializer):
             "last_login",
         ]
 
+    def get_status_code(self, obj):
+        return self.context["status_codes"].get(obj.status_id)
+
+
+class UserDirectoryQuerySerializer(serializers.Serializer):
+    """
+    ?role=teacher&status=active&registered_after=...&registered_before=...&q=ann
+    Role and status codes are resolved to ids here, so the filters hit the
+    (role|status, date_registered) indexes directly.
+    """
+
+    role = serializers.CharField(required=False)
+    status = serializers.CharField(required=False)
+    registered_after = serializers.DateTimeField(required=False)
+    registered_before = serializers.DateTimeField(required=False)
+    q = serializers.CharField(required=False)
+
+    def _code_to_id(self, model, code):
+        ids = {value: pk for pk, value in dictionary_codes(model).items()}
+        if code not in ids:
+            raise serializers.ValidationError(f"Unknown code {code!r}.")
+        return ids[code]
+
+    def validate_role(self, value):
+        return self._code_to_id(Role, value)
+
+    def validate_status(self, value):
+        return self._code_to_id(UserStatus, value)
+
+    def validate(self, attrs):
+        after, before = attrs.get("registered_after"), attrs.get("registered_before")
+        if after and before and after > before:
+            raise serializers.ValidationError(
+                {"registered_before": "Must not be earlier than registered_after."}
+            )
+        return attrs
+
 
 class UserStatusUpdateSerializer(serializers.ModelSerializer):
     status_id = serializers.PrimaryKeyRelatedField(
@@ -206,3 +305,46 @@ class TeacherUpdateSerializer(serializers.ModelSerializer):
             "specialization",
             "bio",
         ]
+
+
+# Range of the staging table's integer columns.
+INTEGER_MIN, INTEGER_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+class UserImportRowSerializer(serializers.Serializer):
+    """
+    One CSV row of a user import. Blank cells count as missing; student or
+    teacher profile columns are read according to ``role``.
+    """
+
+    # Limits match the staging table in accounts.imports, so a row that
+    # passes validation always fits its COPY.
+    email = serializers.EmailField(max_length=254)
+    password = serializers.CharField(required=False, trim_whitespace=False)
+    first_name = serializers.CharField(max_length=150, required=False, default="")
+    last_name = serializers.CharField(max_length=150, required=False, default="")
+    phone = serializers.CharField(max_length=50, required=False, default="")
+    role = serializers.ChoiceField(choices=["student", "teacher"], default="student")
+    status = serializers.CharField(required=False, default=ACTIVE_STATUS)
+
+    birth_date = serializers.DateField(required=False, default=None)
+    education_level = serializers.CharField(max_length=150, required=False, default="")
+    university = serializers.CharField(max_length=150, required=False, default="")
+    faculty = serializers.CharField(max_length=150, required=False, default="")
+    year_of_study = serializers.IntegerField(
+        min_value=INTEGER_MIN, max_value=INTEGER_MAX, required=False, default=None
+    )
+    scholarship = serializers.BooleanField(required=False, default=False)
+
+    academic_degree = serializers.CharField(max_length=150, required=False, default="")
+    experience_years = serializers.IntegerField(
+        min_value=INTEGER_MIN, max_value=INTEGER_MAX, required=False, default=None
+    )
+    specialization = serializers.CharField(max_length=150, required=False, default="")
+    bio = serializers.CharField(required=False, default="")
+
+    def validate_status(self, value):
+        codes = self.context.get("status_codes") or dictionary_codes(UserStatus).values()
+        if value not in codes:
+            raise serializers.ValidationError(f"Unknown code {value!r}.")
+        return value
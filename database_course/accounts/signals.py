@@ -0,0 +1,36 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.models import User
+from accounts.tokens import ACTIVE_STATUS, restore_user_tokens, revoke_user_tokens
+from database_course.cache import invalidate_tags
+from dictionaries.lookups import dictionary_codes
+from dictionaries.models import Role
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    # Pages rendering this user carry their student:/teacher: tag; course
+    # lists, which embed and search teacher names, only the "courses" one.
+    tags = [f"student:{instance.user_id}", f"teacher:{instance.user_id}"]
+    if dictionary_codes(Role).get(instance.role_id) == "teacher":
+        tags.append("courses")
+    invalidate_tags(*tags)
+
+
+@receiver(post_save, sender=User)
+def sync_token_revocation(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    if instance.status.code == ACTIVE_STATUS and not instance.pending_delete:
+        restore_user_tokens(instance.user_id)
+    else:
+        revoke_user_tokens(instance.user_id)
+
+
+@receiver(post_delete, sender=User)
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    revoke_user_tokens(instance.user_id)
@@ -1,3 +1,36 @@
 from django.test import TestCase
+from rest_framework.test import APIRequestFactory
 
-# Create your tests here.
+from accounts.authentication import ClaimsJWTAuthentication
+from accounts.imports import import_users
+from accounts.models import User
+from accounts.tokens import issue_tokens, restore_user_tokens
+from courses.tests import create_user
+
+
+class UserImportTests(TestCase):
+    def test_over_long_email_is_reported_by_line(self):
+        long_email = "a" * 300 + "@example.com"
+        report = import_users([
+            "email,first_name,role\n",
+            f"{long_email},Ann,student\n",
+            "bob@example.com,Bob,student\n",
+        ])
+
+        self.assertEqual(report["created"], 1)
+        self.assertEqual(report["failed"], 1)
+        self.assertEqual(report["errors"][0]["line"], 2)
+        self.assertIn("email", report["errors"][0]["errors"])
+        self.assertTrue(User.objects.filter(email="bob@example.com").exists())
+
+
+class ClaimsJWTAuthenticationTests(TestCase):
+    def test_default_cache_authenticates_without_queries(self):
+        user = create_user("reader@example.com", "student")
+        access = issue_tokens(user)["access"]
+        restore_user_tokens(user.pk)
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {access}")
+
+        with self.assertNumQueries(0):
+            token_user, _ = ClaimsJWTAuthentication().authenticate(request)
+        self.assertEqual(str(token_user.id), str(user.pk))
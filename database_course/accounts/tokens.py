@@ -0,0 +1,71 @@
+from django.contrib.auth.hashers import (
+    check_password,
+    identify_hasher,
+    is_password_usable,
+    make_password,
+)
+from django.core.cache import cache
+from django.utils.crypto import constant_time_compare
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+
+
+ACTIVE_STATUS = "active"
+REVOKED_KEY = "jwt-revoked:{}"
+
+
+def verify_password(user, password):
+    """
+    Checks a password against the stored hash. Rows written before passwords
+    were hashed hold the plain value; on a match it is replaced by a proper
+    hash, as are hashes from an outdated hasher.
+    """
+    def upgrade(raw_password):
+        User.objects.filter(pk=user.pk).update(password_hash=make_password(raw_password))
+
+    if not is_password_usable(user.password_hash):
+        # Imported accounts that have not set a password yet.
+        return False
+    try:
+        identify_hasher(user.password_hash)
+    except ValueError:
+        if not constant_time_compare(password, user.password_hash):
+            return False
+        upgrade(password)
+        return True
+    return check_password(password, user.password_hash, setter=upgrade)
+
+
+def can_log_in(user):
+    return user.status.code == ACTIVE_STATUS and not user.pending_delete
+
+
+def issue_tokens(user):
+    """
+    Returns a refresh/access pair whose claims (user_id, role, status) are all
+    ClaimsJWTAuthentication needs, so authenticated requests skip the user row.
+    """
+    refresh = RefreshToken.for_user(user)
+    refresh["role"] = user.role.code
+    refresh["status"] = user.status.code
+    return {"refresh": str(refresh), "access": str(refresh.access_token)}
+
+
+def _revocation_timeout():
+    # Once every access token issued before the block has expired, refreshing
+    # re-reads the user row, so the mark is no longer needed.
+    return int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+
+
+def revoke_user_tokens(user_id):
+    cache.set(REVOKED_KEY.format(user_id), True, _revocation_timeout())
+
+
+def restore_user_tokens(user_id):
+    cache.delete(REVOKED_KEY.format(user_id))
+
+
+def is_revoked(user_id):
+    return cache.get(REVOKED_KEY.format(user_id), False)
@@ -4,7 +4,10 @@ from accounts import views
 
 
 urlpatterns = [
+    path("token/", views.TokenObtainView.as_view(), name="token-obtain"),
+    path("token/refresh/", views.TokenRefreshView.as_view(), name="token-refresh"),
     path("users/", views.UserCreateView.as_view(), name="user-create"),
+    path("users/import/", views.UserImportView.as_view(), name="user-import"),
     path("users/list/", views.UserListView.as_view(), name="user-list"),
     path("users/by-email/<str:email>/", views.UserByEmailView.as_view(), name="user-by-email"),
     path(
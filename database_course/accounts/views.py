@@ -1,22 +1,34 @@
-from django.db import transaction
+from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from rest_framework import generics
+from rest_framework import generics, status
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 import io
 from datetime import datetime
 from django.http import HttpResponse
 
+from accounts.imports import import_users
+from accounts.last_login import touch_last_login
 from accounts.models import Student, Teacher, User
+from database_course.pagination import EstimatedCountPagination
+from jobs.mixins import ScheduledDestroyMixin
+from dictionaries.lookups import dictionary_codes
+from dictionaries.models import UserStatus
+from jobs.models import DeletionJob
 from accounts.serializers import (
     StudentCreateSerializer,
     StudentProfileSerializer,
     StudentUpdateSerializer,
+    TokenObtainSerializer,
+    TokenRefreshSerializer,
     TeacherCreateSerializer,
     TeacherProfileSerializer,
     TeacherUpdateSerializer,
     UserCreateSerializer,
+    UserDirectoryQuerySerializer,
     UserListSerializer,
     UserLoginSerializer,
     UserProfileSerializer,
@@ -30,10 +42,34 @@ class UserCreateView(generics.CreateAPIView):
     serializer_class = UserCreateSerializer
 
 
+class UserImportView(APIView):
+    """
+    Imports a CSV of users with their student or teacher profiles, uploaded
+    as the multipart field ``file``, and reports every rejected line.
+    """
+
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response({"file": ["No file was submitted."]}, status=status.HTTP_400_BAD_REQUEST)
+        report = import_users(io.TextIOWrapper(upload, encoding="utf-8-sig", newline=""))
+        if not report["failed"]:
+            response_status = status.HTTP_201_CREATED
+        elif not report["created"]:
+            response_status = status.HTTP_400_BAD_REQUEST
+        else:
+            response_status = status.HTTP_207_MULTI_STATUS
+        return Response(report, status=response_status)
+
+
 class UserByEmailView(generics.RetrieveAPIView):
     queryset = User.objects.all()
     serializer_class = UserLoginSerializer
-    lookup_field = "email"
+
+    def get_object(self):
+        return get_object_or_404(self.get_queryset().by_email(self.kwargs["email"]))
 
 
 class UserLastLoginUpdateView(generics.UpdateAPIView):
@@ -42,15 +78,56 @@ class UserLastLoginUpdateView(generics.UpdateAPIView):
     lookup_field = "user_id"
 
     def update(self, request, *args, **kwargs):
+        # Buffered and written behind; see accounts.last_login.
         instance = self.get_object()
         instance.last_login = timezone.now()
-        instance.save(update_fields=["last_login"])
+        touch_last_login(instance.user_id, instance.last_login)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
 
+class TokenViewBase(generics.GenericAPIView):
+    # A stale Authorization header must not prevent logging in again.
+    authentication_classes = []
+
+    def get_authenticate_header(self, request):
+        # Lets failed logins answer 401 rather than 403.
+        return 'Bearer realm="api"'
+
+
+class TokenObtainView(TokenViewBase):
+    """
+    Verifies email and password server-side and returns an access/refresh
+    token pair carrying user_id, role and status claims.
+    """
+
+    serializer_class = TokenObtainSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data["user"]
+        touch_last_login(user.user_id, timezone.now())
+        return Response({
+            "user_id": user.user_id,
+            "role": user.role.code,
+            "status": user.status.code,
+            "access": serializer.validated_data["access"],
+            "refresh": serializer.validated_data["refresh"],
+        })
+
+
+class TokenRefreshView(TokenViewBase):
+    serializer_class = TokenRefreshSerializer
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(serializer.validated_data)
+
+
 class UserProfileView(generics.RetrieveAPIView):
-    queryset = User.objects.select_related("status")
+    queryset = User.objects.filter(pending_delete=False).select_related("status")
     serializer_class = UserProfileSerializer
     lookup_field = "user_id"
 
@@ -62,8 +139,37 @@ class UserUpdateView(generics.UpdateAPIView):
 
 
 class UserListView(generics.ListAPIView):
-    queryset = User.objects.select_related("status").order_by("-date_registered")
+    """
+    User directory, newest registrations first, filterable by role, status,
+    registration date range and a name/email prefix (?q=). ?count=estimate
+    replaces the exact COUNT(*) with the planner's estimate.
+    """
+
     serializer_class = UserListSerializer
+    pagination_class = EstimatedCountPagination
+
+    def get_queryset(self):
+        query = UserDirectoryQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        filters = query.validated_data
+
+        queryset = User.objects.filter(pending_delete=False).order_by(
+            "-date_registered", "-user_id"
+        )
+        if "role" in filters:
+            queryset = queryset.filter(role_id=filters["role"])
+        if "status" in filters:
+            queryset = queryset.filter(status_id=filters["status"])
+        if "registered_after" in filters:
+            queryset = queryset.filter(date_registered__gte=filters["registered_after"])
+        if "registered_before" in filters:
+            queryset = queryset.filter(date_registered__lt=filters["registered_before"])
+        if filters.get("q"):
+            queryset = queryset.prefix_search(filters["q"])
+        return queryset
+
+    def get_serializer_context(self):
+        return {**super().get_serializer_context(), "status_codes": dictionary_codes(UserStatus)}
 
 
 class UserStatusUpdateView(generics.UpdateAPIView):
@@ -104,88 +210,12 @@ class TeacherDetailView(generics.RetrieveUpdateAPIView):
         return super().get_serializer_class()
 
 
-class UserDeleteView(generics.DestroyAPIView):
+class UserDeleteView(ScheduledDestroyMixin, generics.DestroyAPIView):
     queryset = User.objects.all()
     lookup_field = "user_id"
+    deletion_target = DeletionJob.TARGET_USER
 
-    def perform_destroy(self, instance):
-        # Удаляем связанные профили до удаления пользователя
-        # Так как они используют OneToOneField, они будут удалены автоматически при удалении пользователя
-        # Но сначала удалим данные, которые ссылаются на студенческий или преподавательский профиль
-
-        # Проверяем, является ли пользователь студентом
-        try:
-            student_profile = instance.student_profile
-            # Удаляем все записи, связанные со студентом
-
-            # Удаляем сабмиты
-            from submissions.models import Submission
-            Submission.objects.filter(student=student_profile).delete()
-
-            # Профиль студента будет удален автоматически при удалении пользователя
-        except AttributeError:
-            # У пользователя нет студенческого профиля
-            pass
-
-        # Проверяем, является ли пользователь преподавателем
-        try:
-            teacher_profile = instance.teacher_profile
-            # Удаляем курсы, созданные преподавателем
-            from courses.models import Course
-            Course.objects.filter(teacher=teacher_profile).delete()
-
-            # Профиль преподавателя будет удален автоматически при удалении пользователя
-        except AttributeError:
-            # У пользователя нет преподавательского профиля
-            pass
-
-        # Удаляем самого пользователя (и связанные OneToOne профили)
-        # Оборачиваем в отдельную транзакцию для изоляции ошибки
-        try:
-            with transaction.atomic():
-                instance.delete()
-        except Exception as e:
-            # Если возникает ошибка из-за таблицы отзывов или других связей, логируем и продолжаем
-            # Это позволяет удалить пользователя, даже если есть проблемы с каскадным удалением
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error deleting user {instance.user_id}: {str(e)}")
-            # Попробуем удалить вручную, учитывая правильный порядок зависимостей
-            from django.db import connection
-            with transaction.atomic():  # Новая транзакция для ручного удаления
-                with connection.cursor() as cursor:
-                    # Проверяем, является ли пользователь студентом
-                    try:
-                        student_profile = instance.student_profile
-                        # Удаляем сабмиты студента
-                        cursor.execute("DELETE FROM submissions_submission WHERE student_id = %s", [instance.user_id])
-
-                        # Удаляем энролменты студента (это может вызвать проблемы с отзывами, но мы продолжаем)
-                        cursor.execute("DELETE FROM learning_enrollment WHERE student_id = %s", [instance.user_id])
-
-                        # Удаляем студенческий профиль
-                        cursor.execute("DELETE FROM accounts_student WHERE student_id = %s", [instance.user_id])
-                    except AttributeError:
-                        # У пользователя нет студенческого профиля
-                        pass
-
-                    # Проверяем, является ли пользователь преподавателем
-                    try:
-                        teacher_profile = instance.teacher_profile
-                        # Удаляем курсы преподавателя
-                        cursor.execute("DELETE FROM courses_course WHERE teacher_id = %s", [instance.user_id])
-
-                        # Удаляем преподавательский профиль
-                        cursor.execute("DELETE FROM accounts_teacher WHERE teacher_id = %s", [instance.user_id])
-                    except AttributeError:
-                        # У пользователя нет преподавательского профиля
-                        pass
-
-                    # Удаляем пользователя
-                    cursor.execute("DELETE FROM accounts_user WHERE user_id = %s", [instance.user_id])
 
-
-from rest_framework.views import APIView
 from django.http import Http404
 
 
@@ -0,0 +1,136 @@
+import logging
+import threading
+import zlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+
+from analytics.models import AnalyticsSnapshot, RevenueCube
+
+
+logger = logging.getLogger(__name__)
+
+REVENUE_CUBE = "revenue_cube"
+
+# In GROUPING() order: the first dimension is the most significant bit.
+DIMENSIONS = ["category", "level", "language", "teacher"]
+MEASURES = {
+    "total_courses": "course_count",
+    "total_enrollments": "enrollment_count",
+    "total_completions": "completed_count",
+    "total_revenue": "revenue",
+}
+LABELS = {
+    "category": F("category__name"),
+    "level": F("level__name"),
+    "language": F("language__name"),
+    "teacher": Concat(
+        F("teacher__user__first_name"), Value(" "), F("teacher__user__last_name")
+    ),
+}
+
+LOCK_KEY = zlib.crc32(REVENUE_CUBE.encode())
+
+# Enrollment counts come from the maintained CourseStats rows, so the refresh
+# reads one row per course instead of scanning enrollments.
+REFRESH_SQL = """
+INSERT INTO analytics_revenuecube (
+    "grouping", category_id, level_id, language_id, teacher_id,
+    course_count, enrollment_count, completed_count, revenue
+)
+SELECT GROUPING(c.category_id, c.level_id, c.language_id, c.teacher_id),
+       c.category_id, c.level_id, c.language_id, c.teacher_id,
+       count(*),
+       coalesce(sum(s.enrollment_count), 0),
+       coalesce(sum(s.completed_count), 0),
+       coalesce(sum(c.price * s.enrollment_count), 0)
+FROM courses_course c
+LEFT JOIN courses_coursestats s ON s.course_id = c.course_id
+WHERE NOT c.pending_delete
+GROUP BY CUBE (c.category_id, c.level_id, c.language_id, c.teacher_id)
+"""
+
+_refreshing = threading.Lock()
+
+
+def grouping_mask(dimensions):
+    """GROUPING() value of the grouping set that keeps only the given dimensions."""
+    mask = 0
+    for position, dimension in enumerate(DIMENSIONS):
+        if dimension not in dimensions:
+            mask |= 1 << (len(DIMENSIONS) - 1 - position)
+    return mask
+
+
+def refresh_revenue_cube():
+    """
+    Rebuilds the cube in one transaction; readers keep seeing the previous
+    cube until it commits. Returns the row count, or None when another
+    process is already refreshing.
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_xact_lock(%s)", [LOCK_KEY])
+            if not cursor.fetchone()[0]:
+                return None
+            cursor.execute("DELETE FROM analytics_revenuecube")
+            cursor.execute(REFRESH_SQL)
+            count = cursor.rowcount
+        AnalyticsSnapshot.objects.update_or_create(
+            name=REVENUE_CUBE,
+            defaults={"payload": {"rows": count}, "generated_at": timezone.now()},
+        )
+    return count
+
+
+def _refresh_in_thread():
+    try:
+        refresh_revenue_cube()
+    except Exception:
+        logger.exception("Revenue cube refresh failed")
+    finally:
+        _refreshing.release()
+        connection.close()
+
+
+def ensure_revenue_cube():
+    """
+    Builds the cube synchronously if it has never been built. A cube older
+    than REVENUE_CUBE_MAX_AGE seconds keeps being served while a background
+    thread rebuilds it. Returns the time the current cube was generated.
+    """
+    snapshot = AnalyticsSnapshot.objects.filter(name=REVENUE_CUBE).first()
+    if snapshot is None:
+        refresh_revenue_cube()
+        return timezone.now()
+    max_age = timedelta(seconds=getattr(settings, "REVENUE_CUBE_MAX_AGE", 900))
+    if snapshot.generated_at < timezone.now() - max_age and _refreshing.acquire(blocking=False):
+        threading.Thread(target=_refresh_in_thread, daemon=True).start()
+    return snapshot.generated_at
+
+
+def revenue_slice(group_by=(), filters=None, order_by="-total_revenue"):
+    """
+    Rows of the cube grouped by the given dimensions, restricted to
+    {dimension: [ids]}. Filtered dimensions are read from the grouping set
+    that keeps them and summed away unless they are grouped by too.
+    """
+    filters = filters or {}
+    rows = RevenueCube.objects.filter(grouping=grouping_mask({*group_by, *filters}))
+    for dimension, ids in filters.items():
+        rows = rows.filter(**{f"{dimension}_id__in": ids})
+    totals = {name: Sum(field) for name, field in MEASURES.items()}
+    if not group_by:
+        # A bare values() would group by the row id and return raw cube rows.
+        return [rows.aggregate(**totals)]
+    fields = [f"{dimension}_id" for dimension in group_by]
+    labels = {f"{dimension}_name": LABELS[dimension] for dimension in group_by}
+    return list(
+        rows.values(*fields)
+        .annotate(**labels, **totals)
+        .order_by(order_by, *fields)
+    )
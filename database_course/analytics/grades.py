@@ -0,0 +1,181 @@
+import math
+
+from django.db import connection, transaction
+
+from analytics.models import GradeStats
+
+
+BUCKETS = 100
+# Final grades are recorded as percentages.
+FINAL_GRADE_SCALE = 100
+QUANTILES = {"p25": 0.25, "median": 0.5, "p75": 0.75, "p90": 0.9}
+
+MOMENTS_SQL = {
+    GradeStats.SCOPE_COURSE: """
+        SELECT course_id, final_grade::float / %(scale)s AS grade
+        FROM learning_enrollment
+        WHERE final_grade IS NOT NULL
+    """,
+    GradeStats.SCOPE_ASSIGNMENT: """
+        SELECT s.assignment_id, s.score::float / nullif(a.max_score, 0) AS grade
+        FROM submissions_submission s
+        JOIN courses_assignment a ON a.assignment_id = s.assignment_id
+        WHERE s.score IS NOT NULL AND a.max_score > 0
+    """,
+}
+
+# var_pop * n is the M2 Welford's algorithm would have reached.
+REBUILD_SQL = """
+WITH grades (scope_id, grade) AS ({grades}),
+buckets AS (
+    SELECT scope_id, least(greatest(floor(grade * %(buckets)s)::int, 0), %(buckets)s - 1) AS bucket,
+           count(*) AS n
+    FROM grades
+    GROUP BY 1, 2
+)
+SELECT g.scope_id, count(*), avg(g.grade), var_pop(g.grade) * count(*),
+       (SELECT array_agg(coalesce(b.n, 0) ORDER BY i)
+        FROM generate_series(0, %(buckets)s - 1) i
+        LEFT JOIN buckets b ON b.scope_id = g.scope_id AND b.bucket = i)
+FROM grades g
+GROUP BY g.scope_id
+"""
+
+
+def _bucket(grade):
+    return min(max(int(grade * BUCKETS), 0), BUCKETS - 1)
+
+
+def _push(stats, grade):
+    stats.count += 1
+    delta = grade - stats.mean
+    stats.mean += delta / stats.count
+    stats.m2 += delta * (grade - stats.mean)
+    stats.histogram[_bucket(grade)] += 1
+
+
+def _discard(stats, grade):
+    if stats.count <= 1:
+        stats.count, stats.mean, stats.m2 = 0, 0.0, 0.0
+    else:
+        # Welford's update run backwards.
+        stats.count -= 1
+        delta = grade - stats.mean
+        stats.mean -= delta / stats.count
+        stats.m2 = max(stats.m2 - delta * (grade - stats.mean), 0.0)
+    bucket = _bucket(grade)
+    stats.histogram[bucket] = max(stats.histogram[bucket] - 1, 0)
+
+
+def normalise_final_grade(final_grade):
+    return None if final_grade is None else float(final_grade) / FINAL_GRADE_SCALE
+
+
+def normalise_score(score, max_score):
+    return None if score is None or not max_score else score / max_score
+
+
+def apply_grade_change(scope, scope_id, before=None, after=None):
+    """
+    Replaces one normalised grade of a course or assignment: ``before`` is
+    removed and ``after`` added (either may be None). The stats row is
+    locked, so concurrent grade writes serialise on it.
+    """
+    if scope_id is None or before == after or (before is None and after is None):
+        return
+    with transaction.atomic():
+        GradeStats.objects.bulk_create(
+            [GradeStats(scope=scope, scope_id=scope_id, histogram=[0] * BUCKETS)],
+            ignore_conflicts=True,
+        )
+        stats = GradeStats.objects.select_for_update().get(scope=scope, scope_id=scope_id)
+        if before is not None:
+            _discard(stats, before)
+        if after is not None:
+            _push(stats, after)
+        stats.save(update_fields=["count", "mean", "m2", "histogram"])
+
+
+def _rebuilt_rows(scope, grades, params=None):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            REBUILD_SQL.format(grades=grades),
+            {"scale": FINAL_GRADE_SCALE, "buckets": BUCKETS, **(params or {})},
+        )
+        return [
+            GradeStats(
+                scope=scope, scope_id=scope_id, count=count, mean=mean,
+                m2=m2, histogram=histogram,
+            )
+            for scope_id, count, mean, m2, histogram in cursor.fetchall()
+        ]
+
+
+def rebuild_grade_stats():
+    """
+    Recomputes all stats rows from the source tables. Returns the number of
+    rows written per scope.
+    """
+    written = {}
+    with transaction.atomic():
+        GradeStats.objects.all().delete()
+        for scope, grades in MOMENTS_SQL.items():
+            rows = _rebuilt_rows(scope, grades)
+            GradeStats.objects.bulk_create(rows, batch_size=1000)
+            written[scope] = len(rows)
+    return written
+
+
+def rebuild_scope_grade_stats(scope, scope_id):
+    """
+    Recomputes one course's or assignment's stats row from the source tables,
+    e.g. after the assignment's max_score changed and every grade with it.
+    """
+    grades = (
+        f"SELECT * FROM ({MOMENTS_SQL[scope]}) AS g (scope_id, grade) "
+        "WHERE scope_id = %(scope_id)s"
+    )
+    with transaction.atomic():
+        GradeStats.objects.filter(scope=scope, scope_id=scope_id).delete()
+        GradeStats.objects.bulk_create(_rebuilt_rows(scope, grades, {"scope_id": scope_id}))
+
+
+def histogram_quantile(histogram, q):
+    """
+    Approximate quantile from the bucket counts, interpolating linearly inside
+    the bucket it falls in; the error is at most one bucket width.
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+    target = q * total
+    seen = 0
+    for bucket, count in enumerate(histogram):
+        if count and seen + count >= target:
+            return (bucket + (target - seen) / count) / BUCKETS
+        seen += count
+    return 1.0
+
+
+def describe_grades(stats, buckets=10):
+    """
+    Summary of a stats row: count, mean, standard deviation, quantiles and the
+    histogram merged down to ``buckets`` bins (must divide BUCKETS).
+    """
+    histogram = stats.histogram if stats else [0] * BUCKETS
+    count = stats.count if stats else 0
+    width = BUCKETS // buckets
+    return {
+        "count": count,
+        "mean": stats.mean if count else None,
+        "stddev": math.sqrt(stats.m2 / count) if count else None,
+        **{name: histogram_quantile(histogram, q) for name, q in QUANTILES.items()},
+        "histogram": [
+            {
+                "lower": start / BUCKETS,
+                "upper": (start + width) / BUCKETS,
+                "count": sum(histogram[start:start + width]),
+            }
+            for start in range(0, BUCKETS, width)
+        ],
+    }
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from analytics.grades import rebuild_grade_stats
+from database_course.benchmarking import timed
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the per-course and per-assignment grade statistics from the "
+        "graded rows, e.g. as a backfill."
+    )
+
+    def handle(self, *args, **options):
+        with timed(self.stdout, "rebuild"):
+            written = rebuild_grade_stats()
+        for scope, count in written.items():
+            self.stdout.write(self.style.SUCCESS(f"{scope}: {count} rows"))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from analytics.rollups import rebuild_rollups
+from database_course.benchmarking import timed
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the daily enrollment/completion/review/revenue rollups from "
+        "the source tables (backfill, or to re-derive revenue after price changes)."
+    )
+
+    def handle(self, *args, **options):
+        with timed(self.stdout, "rebuild"):
+            count = rebuild_rollups()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {count} rollup rows."))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from analytics.snapshots import refresh_course_analytics
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the precomputed analytics snapshots (run from cron)."
+
+    def handle(self, *args, **options):
+        snapshot = refresh_course_analytics()
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {snapshot.name} at {snapshot.generated_at}")
+        )
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from analytics.cube import refresh_revenue_cube
+from database_course.benchmarking import timed
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the category/level/language/teacher revenue cube (run from cron)."
+
+    def handle(self, *args, **options):
+        with timed(self.stdout, "refresh"):
+            count = refresh_revenue_cube()
+        if count is None:
+            self.stdout.write("Another refresh is running; skipped.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Wrote {count} cube rows."))
@@ -0,0 +1,34 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_user_pending_delete'),
+        ('analytics', '0002_dailyrollup'),
+        ('dictionaries', '0007_auto_20260117_1421'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevenueCube',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('grouping', models.SmallIntegerField()),
+                ('course_count', models.IntegerField()),
+                ('enrollment_count', models.IntegerField()),
+                ('completed_count', models.IntegerField()),
+                ('revenue', models.DecimalField(decimal_places=2, max_digits=16)),
+                ('category', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='dictionaries.category')),
+                ('language', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='dictionaries.language')),
+                ('level', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='dictionaries.courselevel')),
+                ('teacher', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='accounts.teacher')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['grouping'], name='revenue_cube_grouping_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:36
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_revenuecube'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GradeStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('course', 'Course'), ('assignment', 'Assignment')], max_length=10)),
+                ('scope_id', models.IntegerField()),
+                ('count', models.IntegerField(default=0)),
+                ('mean', models.FloatField(default=0)),
+                ('m2', models.FloatField(default=0)),
+                ('histogram', django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField())),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('scope', 'scope_id'), name='unique_grade_stats_scope')],
+            },
+        ),
+    ]
@@ -0,0 +1,114 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class AnalyticsSnapshot(models.Model):
+    name = models.CharField(max_length=100, primary_key=True)
+    payload = models.JSONField(encoder=JSONEncoder)
+    generated_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.name}@{self.generated_at:%Y-%m-%d %H:%M:%S}"
+
+
+class DailyRollup(models.Model):
+    """
+    Per-day activity of one course, category or teacher, kept up to date by
+    ``analytics.signals`` and rebuilt from the source tables by
+    ``rebuild_rollups``.
+    """
+
+    SCOPE_COURSE = "course"
+    SCOPE_CATEGORY = "category"
+    SCOPE_TEACHER = "teacher"
+    SCOPE_CHOICES = [
+        (SCOPE_COURSE, "Course"),
+        (SCOPE_CATEGORY, "Category"),
+        (SCOPE_TEACHER, "Teacher"),
+    ]
+
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES)
+    scope_id = models.IntegerField()
+    day = models.DateField()
+    enrollments = models.IntegerField(default=0)
+    completions = models.IntegerField(default=0)
+    reviews = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            # Also the index behind series lookups.
+            models.UniqueConstraint(
+                fields=["scope", "scope_id", "day"], name="unique_rollup_scope_day"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.scope}:{self.scope_id}@{self.day}"
+
+
+class RevenueCube(models.Model):
+    """
+    Course, enrollment and revenue totals for every combination of category,
+    level, language and teacher (GROUP BY CUBE), rebuilt by
+    ``analytics.cube.refresh_revenue_cube``. A NULL dimension means "all";
+    ``grouping`` is the SQL GROUPING() bitmask of the rolled-up dimensions.
+    """
+
+    grouping = models.SmallIntegerField()
+    # No database constraints: the cube is a rebuilt snapshot and must not
+    # block deleting the rows it was computed from.
+    category = models.ForeignKey(
+        "dictionaries.Category", on_delete=models.DO_NOTHING, db_constraint=False,
+        null=True, related_name="+",
+    )
+    level = models.ForeignKey(
+        "dictionaries.CourseLevel", on_delete=models.DO_NOTHING, db_constraint=False,
+        null=True, related_name="+",
+    )
+    language = models.ForeignKey(
+        "dictionaries.Language", on_delete=models.DO_NOTHING, db_constraint=False,
+        null=True, related_name="+",
+    )
+    teacher = models.ForeignKey(
+        "accounts.Teacher", on_delete=models.DO_NOTHING, db_constraint=False,
+        null=True, related_name="+",
+    )
+    course_count = models.IntegerField()
+    enrollment_count = models.IntegerField()
+    completed_count = models.IntegerField()
+    revenue = models.DecimalField(max_digits=16, decimal_places=2)
+
+    class Meta:
+        indexes = [models.Index(fields=["grouping"], name="revenue_cube_grouping_idx")]
+
+
+class GradeStats(models.Model):
+    """
+    Streaming statistics of normalised grades (0..1) of one course (final
+    grades) or assignment (submission scores): Welford's count/mean/M2 and a
+    fixed-bucket histogram for approximate quantiles. See ``analytics.grades``.
+    """
+
+    SCOPE_COURSE = "course"
+    SCOPE_ASSIGNMENT = "assignment"
+    SCOPE_CHOICES = [
+        (SCOPE_COURSE, "Course"),
+        (SCOPE_ASSIGNMENT, "Assignment"),
+    ]
+
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES)
+    scope_id = models.IntegerField()
+    count = models.IntegerField(default=0)
+    mean = models.FloatField(default=0)
+    m2 = models.FloatField(default=0)
+    histogram = ArrayField(models.IntegerField())
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["scope", "scope_id"], name="unique_grade_stats_scope")
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.scope}:{self.scope_id} (n={self.count})"
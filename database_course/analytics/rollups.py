@@ -0,0 +1,193 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+
+from analytics.models import DailyRollup
+
+
+METRICS = ["enrollments", "completions", "reviews", "revenue"]
+EVENT_METRICS = ["enrollments", "completions", "reviews"]
+
+# Turns events (course_id, moment, enrollments, completions, reviews) into
+# rollup rows: each event counts for its course and the course's category and
+# teacher on its day in TIME_ZONE, and revenue is the enrollments at the
+# course's current price. Both the incremental upsert and the rebuild go
+# through it, so they always attribute events alike.
+ATTRIBUTION_SQL = """
+per_course AS (
+    SELECT c.course_id, c.category_id, c.teacher_id, ev.day,
+           sum(ev.enrollments) AS enrollments,
+           sum(ev.completions) AS completions,
+           sum(ev.reviews) AS reviews,
+           sum(ev.enrollments) * c.price AS revenue
+    FROM (
+        SELECT course_id, (moment AT TIME ZONE %(tz)s)::date AS day,
+               enrollments, completions, reviews
+        FROM events
+    ) AS ev
+    JOIN courses_course c ON c.course_id = ev.course_id
+    GROUP BY c.course_id, ev.day
+),
+attributed AS (
+    SELECT 'course' AS scope, course_id AS scope_id, day,
+           enrollments, completions, reviews, revenue
+    FROM per_course
+    UNION ALL
+    SELECT 'category', category_id, day,
+           sum(enrollments), sum(completions), sum(reviews), sum(revenue)
+    FROM per_course
+    GROUP BY category_id, day
+    UNION ALL
+    SELECT 'teacher', teacher_id, day,
+           sum(enrollments), sum(completions), sum(reviews), sum(revenue)
+    FROM per_course
+    GROUP BY teacher_id, day
+)
+"""
+
+SOURCE_EVENTS_SQL = """
+SELECT course_id, enroll_date AS moment, 1 AS enrollments, 0 AS completions, 0 AS reviews
+FROM learning_enrollment
+UNION ALL
+SELECT course_id, completion_date, 0, 1, 0
+FROM learning_enrollment
+WHERE completion_date IS NOT NULL
+UNION ALL
+SELECT e.course_id, r.created_at, 0, 0, 1
+FROM reviews_review r
+JOIN learning_enrollment e ON e.enrollment_id = r.enrollment_id
+"""
+
+INSERT_SQL = """
+INSERT INTO analytics_dailyrollup (
+    scope, scope_id, day, enrollments, completions, reviews, revenue
+)
+SELECT * FROM attributed
+"""
+
+INCREMENT_SQL = INSERT_SQL + """
+ON CONFLICT (scope, scope_id, day) DO UPDATE SET
+    enrollments = analytics_dailyrollup.enrollments + EXCLUDED.enrollments,
+    completions = analytics_dailyrollup.completions + EXCLUDED.completions,
+    reviews = analytics_dailyrollup.reviews + EXCLUDED.reviews,
+    revenue = analytics_dailyrollup.revenue + EXCLUDED.revenue
+"""
+
+UPSERT_SQL = (
+    "WITH events (course_id, moment, enrollments, completions, reviews) AS (VALUES {values}),"
+    + ATTRIBUTION_SQL
+    + INCREMENT_SQL
+)
+
+REBUILD_SQL = (
+    f"WITH events AS ({SOURCE_EVENTS_SQL}),"
+    + ATTRIBUTION_SQL
+    + INSERT_SQL
+)
+
+COURSE_REBUILD_SQL = (
+    f"WITH events AS (SELECT * FROM ({SOURCE_EVENTS_SQL}) AS source WHERE course_id = %(course_id)s),"
+    + ATTRIBUTION_SQL
+    + INCREMENT_SQL
+)
+
+# Takes a course's rows out of the rollups, including what they added to the
+# given category and teacher.
+DETACH_COURSE_SQL = """
+WITH removed AS (
+    DELETE FROM analytics_dailyrollup
+    WHERE scope = 'course' AND scope_id = %(course_id)s
+    RETURNING day, enrollments, completions, reviews, revenue
+)
+UPDATE analytics_dailyrollup AS r
+SET enrollments = r.enrollments - d.enrollments,
+    completions = r.completions - d.completions,
+    reviews = r.reviews - d.reviews,
+    revenue = r.revenue - d.revenue
+FROM removed d
+WHERE r.day = d.day AND (
+    (r.scope = 'category' AND r.scope_id = %(category_id)s)
+    OR (r.scope = 'teacher' AND r.scope_id = %(teacher_id)s)
+)
+"""
+
+TRUNCATE = {
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+
+
+def apply_rollup_deltas(events):
+    """
+    events is a Counter of (course_id, moment, metric) -> delta. They are
+    attributed by ATTRIBUTION_SQL, as in the rebuild, and all affected rows of
+    all three scopes are incremented by a single INSERT ... ON CONFLICT.
+    """
+    events = {key: delta for key, delta in events.items() if delta and key[1] is not None}
+    if not events:
+        return
+    params = {"tz": settings.TIME_ZONE}
+    values = []
+    for index, ((course_id, moment, metric), delta) in enumerate(events.items()):
+        params.update({
+            f"course_{index}": course_id,
+            f"moment_{index}": moment,
+            **{f"{name}_{index}": delta if metric == name else 0 for name in EVENT_METRICS},
+        })
+        values.append(
+            f"(%(course_{index})s::integer, %(moment_{index})s::timestamptz, "
+            + ", ".join(f"%({name}_{index})s::integer" for name in EVENT_METRICS)
+            + ")"
+        )
+    with connection.cursor() as cursor:
+        cursor.execute(UPSERT_SQL.replace("{values}", ", ".join(values)), params)
+
+
+def rebuild_course_rollups(course_id, category_id, teacher_id):
+    """
+    Re-attributes one course's events after its category, teacher or price
+    changed: its rows, and what they added to the previous category_id and
+    teacher_id, are taken out and then recomputed from the source tables.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(DETACH_COURSE_SQL, {
+            "course_id": course_id, "category_id": category_id, "teacher_id": teacher_id,
+        })
+        cursor.execute(COURSE_REBUILD_SQL, {"course_id": course_id, "tz": settings.TIME_ZONE})
+
+
+def rebuild_rollups():
+    """
+    Recomputes every rollup row from the source tables in one statement.
+    Revenue is re-derived from current course prices.
+    """
+    with transaction.atomic():
+        DailyRollup.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(REBUILD_SQL, {"tz": settings.TIME_ZONE})
+            return cursor.rowcount
+
+
+def rollup_series(scope, scope_id, granularity="day", start=None, end=None):
+    """
+    Returns [{period, enrollments, completions, reviews, revenue}] for the
+    inclusive date range, summing the daily rows into weeks (starting on
+    Monday) or months as requested. Periods without activity are omitted.
+    """
+    end = end or timezone.localdate()
+    start = start or end - timedelta(days=365)
+    rows = DailyRollup.objects.filter(
+        scope=scope, scope_id=scope_id, day__gte=start, day__lte=end
+    )
+    if granularity == "day":
+        return list(rows.order_by("day").values(*METRICS, period=F("day")))
+    return list(
+        rows.annotate(period=TRUNCATE[granularity]("day"))
+        .values("period")
+        .annotate(**{metric: Sum(metric) for metric in METRICS})
+        .order_by("period")
+    )
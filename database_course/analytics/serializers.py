@@ -0,0 +1,74 @@
+from rest_framework import serializers
+
+from analytics.cube import DIMENSIONS, MEASURES
+from analytics.grades import BUCKETS
+
+
+class RollupSeriesQuerySerializer(serializers.Serializer):
+    granularity = serializers.ChoiceField(choices=["day", "week", "month"], default="day")
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        if attrs.get("start") and attrs.get("end") and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError({"start": ["Must not be after end."]})
+        return attrs
+
+
+class RollupPointSerializer(serializers.Serializer):
+    period = serializers.DateField()
+    enrollments = serializers.IntegerField()
+    completions = serializers.IntegerField()
+    reviews = serializers.IntegerField()
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class RevenueCubeQuerySerializer(serializers.Serializer):
+    """
+    ?group_by=category&group_by=teacher&language=2&language=3&order=-total_revenue
+    """
+
+    group_by = serializers.ListField(
+        child=serializers.ChoiceField(choices=DIMENSIONS), required=False, default=list
+    )
+    category = serializers.ListField(child=serializers.IntegerField(), required=False)
+    level = serializers.ListField(child=serializers.IntegerField(), required=False)
+    language = serializers.ListField(child=serializers.IntegerField(), required=False)
+    teacher = serializers.ListField(child=serializers.IntegerField(), required=False)
+    order = serializers.ChoiceField(
+        choices=[prefix + measure for measure in MEASURES for prefix in ("", "-")],
+        default="-total_revenue",
+    )
+
+    def validate(self, attrs):
+        return {
+            "group_by": list(dict.fromkeys(attrs["group_by"])),
+            "filters": {
+                dimension: attrs[dimension] for dimension in DIMENSIONS if attrs.get(dimension)
+            },
+            "order_by": attrs["order"],
+        }
+
+
+class GradeStatsQuerySerializer(serializers.Serializer):
+    buckets = serializers.ChoiceField(
+        choices=[size for size in range(1, BUCKETS + 1) if BUCKETS % size == 0],
+        default=10,
+    )
+
+
+class HistogramBucketSerializer(serializers.Serializer):
+    lower = serializers.FloatField()
+    upper = serializers.FloatField()
+    count = serializers.IntegerField()
+
+
+class GradeStatsSerializer(serializers.Serializer):
+    count = serializers.IntegerField()
+    mean = serializers.FloatField(allow_null=True)
+    stddev = serializers.FloatField(allow_null=True)
+    p25 = serializers.FloatField(allow_null=True)
+    median = serializers.FloatField(allow_null=True)
+    p75 = serializers.FloatField(allow_null=True)
+    p90 = serializers.FloatField(allow_null=True)
+    histogram = HistogramBucketSerializer(many=True)
@@ -0,0 +1,163 @@
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from analytics.grades import (
+    apply_grade_change,
+    normalise_final_grade,
+    normalise_score,
+    rebuild_scope_grade_stats,
+)
+from analytics.models import GradeStats
+from analytics.rollups import apply_rollup_deltas, rebuild_course_rollups
+from courses.models import Assignment, Course
+from courses.signals import previous_state, review_course_id
+from learning.models import Enrollment
+from reviews.models import Review
+from submissions.models import Submission
+
+
+def _enrollment_events(course_id, enroll_date, completion_date):
+    return Counter({
+        (course_id, enroll_date, "enrollments"): 1,
+        (course_id, completion_date, "completions"): 1,
+    })
+
+
+def _move_grade(scope, before, after):
+    """before/after are (scope_id, normalised grade) pairs or None."""
+    before_id, before_grade = before or (None, None)
+    after_id, after_grade = after or (None, None)
+    if before_id == after_id:
+        apply_grade_change(scope, after_id, before_grade, after_grade)
+        return
+    apply_grade_change(scope, before_id, before=before_grade)
+    apply_grade_change(scope, after_id, after=after_grade)
+
+
+@receiver(post_save, sender=Enrollment)
+def roll_up_enrollment_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    after = _enrollment_events(
+        instance.course_id, instance.enroll_date, instance.completion_date
+    )
+    before = previous_state(instance)
+    if before:
+        after.subtract(_enrollment_events(
+            before["course_id"], before["enroll_date"], before["completion_date"]
+        ))
+    apply_rollup_deltas(after)
+    _move_grade(
+        GradeStats.SCOPE_COURSE,
+        before and (before["course_id"], normalise_final_grade(before["final_grade"])),
+        (instance.course_id, normalise_final_grade(instance.final_grade)),
+    )
+
+
+@receiver(post_delete, sender=Enrollment)
+def roll_up_enrollment_delete(sender, instance, **kwargs):
+    events = _enrollment_events(
+        instance.course_id, instance.enroll_date, instance.completion_date
+    )
+    apply_rollup_deltas(Counter({key: -delta for key, delta in events.items()}))
+    apply_grade_change(
+        GradeStats.SCOPE_COURSE,
+        instance.course_id,
+        before=normalise_final_grade(instance.final_grade),
+    )
+
+
+@receiver(post_save, sender=Review)
+def roll_up_review_save(sender, instance, raw=False, **kwargs):
+    # Editing a review resets created_at, which moves it to another day.
+    if raw:
+        return
+    events = Counter({(review_course_id(instance), instance.created_at, "reviews"): 1})
+    before = previous_state(instance)
+    if before:
+        events[before["course_id"], before["created_at"], "reviews"] -= 1
+    apply_rollup_deltas(events)
+
+
+@receiver(post_delete, sender=Review)
+def roll_up_review_delete(sender, instance, **kwargs):
+    apply_rollup_deltas(
+        Counter({(review_course_id(instance), instance.created_at, "reviews"): -1})
+    )
+
+
+@receiver(post_save, sender=Course)
+def reattribute_course_rollups(sender, instance, raw=False, **kwargs):
+    """A course's events follow it to its new category and teacher, at its new price."""
+    before = previous_state(instance)
+    if raw or not before:
+        return
+    if (before["category_id"], before["teacher_id"], before["price"]) != (
+        instance.category_id, instance.teacher_id, instance.price
+    ):
+        rebuild_course_rollups(instance.pk, before["category_id"], before["teacher_id"])
+
+
+# Submission scores, normalised by the assignment's max_score
+
+
+def _submission_grade(assignment_id, score):
+    max_score = (
+        Assignment.objects.filter(pk=assignment_id).values_list("max_score", flat=True).first()
+    )
+    return assignment_id, normalise_score(score, max_score)
+
+
+@receiver(pre_save, sender=Submission)
+def remember_submission_grade(sender, instance, raw=False, **kwargs):
+    instance._grade_before = None
+    if raw or instance._state.adding:
+        return
+    row = (
+        Submission.objects.filter(pk=instance.pk)
+        .values_list("assignment_id", "score", "assignment__max_score")
+        .first()
+    )
+    if row:
+        instance._grade_before = (row[0], normalise_score(row[1], row[2]))
+
+
+@receiver(post_save, sender=Submission)
+def update_grades_on_submission_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    before = getattr(instance, "_grade_before", None)
+    if before is None and instance.score is None:
+        return
+    _move_grade(
+        GradeStats.SCOPE_ASSIGNMENT,
+        before,
+        _submission_grade(instance.assignment_id, instance.score),
+    )
+
+
+@receiver(post_delete, sender=Submission)
+def update_grades_on_submission_delete(sender, instance, **kwargs):
+    if instance.score is not None:
+        _move_grade(
+            GradeStats.SCOPE_ASSIGNMENT,
+            _submission_grade(instance.assignment_id, instance.score),
+            None,
+        )
+
+
+@receiver(post_save, sender=Assignment)
+def rescale_assignment_grades(sender, instance, raw=False, **kwargs):
+    # Submission grades are normalised by max_score, so all of them move.
+    before = previous_state(instance)
+    if not raw and before and before["max_score"] != instance.max_score:
+        rebuild_scope_grade_stats(GradeStats.SCOPE_ASSIGNMENT, instance.pk)
+
+
+@receiver(post_delete, sender=Course)
+@receiver(post_delete, sender=Assignment)
+def drop_grade_stats(sender, instance, **kwargs):
+    scope = GradeStats.SCOPE_COURSE if sender is Course else GradeStats.SCOPE_ASSIGNMENT
+    GradeStats.objects.filter(scope=scope, scope_id=instance.pk).delete()
@@ -0,0 +1,208 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Count, Avg, Sum, Case, When, IntegerField, FloatField
+from django.db.models.functions import Cast
+from django.utils import timezone
+
+from analytics.cube import ensure_revenue_cube, revenue_slice
+from analytics.models import AnalyticsSnapshot
+
+
+COURSE_ANALYTICS = "course_analytics"
+
+
+def build_course_analytics():
+    """
+    Runs the full set of aggregate queries behind the course analytics dashboard.
+    """
+    from accounts.models import Student
+    from courses.models import Assignment, Course, CourseStats
+    from courses.serializers import CourseAnalyticsSerializer
+    from courses.stats import bayesian_score_expression
+    from learning.models import Enrollment
+
+    # Basic analytics
+    total_courses = Course.objects.count()
+    total_students = Student.objects.count()
+    avg_price = Course.objects.aggregate(avg_price=Avg('price'))['avg_price'] or 0
+    total_assignments = Assignment.objects.count()
+
+    # Enhanced analytics
+    # 1. Top performing teachers by Bayesian-average course rating, summed
+    # from the maintained per-course counters instead of the review rows
+    top_teachers = []
+    try:
+        top_teachers = Course.objects.values(
+            'teacher_id'
+        ).annotate(
+            teacher_user_first_name=F('teacher__user__first_name'),
+            teacher_user_last_name=F('teacher__user__last_name'),
+            review_count=Sum('stats__review_count'),
+            rating_sum=Sum('stats__rating_sum'),
+            course_count=Count('course_id')
+        ).filter(
+            review_count__gt=0
+        ).annotate(
+            avg_rating=Cast('rating_sum', FloatField()) / F('review_count'),
+            bayesian_score=bayesian_score_expression()
+        ).order_by('-bayesian_score')[:5]
+    except Exception as e:
+        print(f"Error in top_teachers query: {e}")
+
+    # 2. Most popular courses by enrollment count
+    popular_courses = []
+    try:
+        popular_courses = CourseStats.objects.values(
+            'course_id',
+            'enrollment_count',
+            title=F('course__title'),
+            teacher_user_first_name=F('course__teacher__user__first_name'),
+            teacher_user_last_name=F('course__teacher__user__last_name'),
+            category_name=F('course__category__name'),
+        ).order_by('-enrollment_count')[:5]
+    except Exception as e:
+        print(f"Error in popular_courses query: {e}")
+
+    # 3. Student success rates by course completion
+    course_completion_stats = []
+    try:
+        course_completion_stats = Enrollment.objects.values(
+            'course_id'
+        ).annotate(
+            course_title=F('course__title'),
+            total_enrollments=Count('enrollment_id'),
+            completed_count=Count(Case(
+                When(final_grade__isnull=False, then=1),
+                output_field=IntegerField()
+            )),
+            completion_rate=Avg(Case(
+                When(final_grade__isnull=False, then=100),
+                default=0,
+                output_field=IntegerField()
+            ))
+        ).order_by('-completion_rate')[:5]
+    except Exception as e:
+        print(f"Error in course_completion_stats query: {e}")
+
+    # 4. Assignment completion statistics
+    assignment_stats = []
+    try:
+        assignment_stats = Assignment.objects.values(
+            'lesson__course_id'
+        ).annotate(
+            course_title=F('lesson__course__title'),
+            total_assignments=Count('assignment_id'),
+            submitted_count=Count('submissions'),
+            submission_rate=Avg(Case(
+                When(submissions__isnull=False, then=100),
+                default=0,
+                output_field=IntegerField()
+            ))
+        ).order_by('-submission_rate')
+    except Exception as e:
+        print(f"Error in assignment_stats query: {e}")
+
+    # 5. Revenue analytics by course category, from enrollments at course prices
+    revenue_by_category = []
+    try:
+        ensure_revenue_cube()
+        revenue_by_category = [
+            {
+                'category_id': row['category_id'],
+                'category_name': row['category_name'],
+                'total_revenue': row['total_revenue'],
+                'course_count': row['total_courses'],
+                'enrollment_count': row['total_enrollments'],
+            }
+            for row in revenue_slice(group_by=['category'])
+        ]
+    except Exception as e:
+        print(f"Error in revenue_by_category query: {e}")
+
+    # 6. Course completion rates
+    overall_completion_rate = Enrollment.objects.aggregate(
+        completion_percentage=Avg(Case(
+            When(final_grade__isnull=False, then=100),
+            default=0,
+            output_field=IntegerField()
+        ))
+    )['completion_percentage'] or 0
+
+    # 7. Teacher activity metrics
+    teacher_activity = []
+    try:
+        teacher_activity = Course.objects.select_related('teacher__user').values(
+            'teacher_id'
+        ).annotate(
+            teacher_user_first_name=F('teacher__user__first_name'),
+            teacher_user_last_name=F('teacher__user__last_name'),
+            course_count=Count('course_id'),
+            total_students=Count('enrollments__student_id', distinct=True),
+            avg_course_rating=Avg('enrollments__reviews__rating')
+        ).order_by('-course_count')
+    except Exception as e:
+        print(f"Error in teacher_activity query: {e}")
+
+    data = {
+        'total_courses': total_courses,
+        'total_students': total_students,
+        'average_course_price': round(float(avg_price), 2),
+        'total_assignments': total_assignments,
+
+        # Enhanced analytics
+        'top_teachers': list(top_teachers),
+        'popular_courses': list(popular_courses),
+        'course_completion_stats': list(course_completion_stats),
+        'assignment_stats': list(assignment_stats),
+        'revenue_by_category': list(revenue_by_category),
+        'overall_completion_rate': round(float(overall_completion_rate), 2),
+        'teacher_activity': list(teacher_activity),
+    }
+
+    return CourseAnalyticsSerializer(data).data
+
+
+def refresh_course_analytics():
+    snapshot, _ = AnalyticsSnapshot.objects.update_or_create(
+        name=COURSE_ANALYTICS,
+        defaults={
+            "payload": build_course_analytics(),
+            "generated_at": timezone.now(),
+        },
+    )
+    return snapshot
+
+
+def _lock_refresh(name, wait):
+    """
+    Takes the transaction-scoped advisory lock guarding a snapshot's refresh;
+    without ``wait`` returns False at once if another request holds it.
+    """
+    with connection.cursor() as cursor:
+        if wait:
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [name])
+            return True
+        cursor.execute("SELECT pg_try_advisory_xact_lock(hashtext(%s))", [name])
+        return cursor.fetchone()[0]
+
+
+def get_course_analytics():
+    """
+    Returns the stored snapshot. Once it is older than ANALYTICS_SNAPSHOT_MAX_AGE
+    seconds, one request rebuilds it while concurrent ones keep returning the
+    stale row; only a missing snapshot makes them wait for the rebuild.
+    """
+    max_age = timedelta(seconds=getattr(settings, "ANALYTICS_SNAPSHOT_MAX_AGE", 300))
+    snapshot = AnalyticsSnapshot.objects.filter(name=COURSE_ANALYTICS).first()
+    if snapshot is not None and snapshot.generated_at >= timezone.now() - max_age:
+        return snapshot
+    with transaction.atomic():
+        if not _lock_refresh(COURSE_ANALYTICS, wait=snapshot is None):
+            return snapshot
+        # Whoever held the lock before may have just refreshed it.
+        current = AnalyticsSnapshot.objects.filter(name=COURSE_ANALYTICS).first()
+        if current is not None and current.generated_at >= timezone.now() - max_age:
+            return current
+        return refresh_course_analytics()
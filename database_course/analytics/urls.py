@@ -0,0 +1,35 @@
+from django.urls import path
+
+from analytics import views
+from analytics.models import DailyRollup, GradeStats
+from courses.models import Assignment, Course
+
+
+urlpatterns = [
+    path("revenue/", views.RevenueCubeView.as_view(), name="revenue-cube"),
+    path(
+        "courses/<int:scope_id>/series/",
+        views.RollupSeriesView.as_view(scope=DailyRollup.SCOPE_COURSE),
+        name="course-series",
+    ),
+    path(
+        "categories/<int:scope_id>/series/",
+        views.RollupSeriesView.as_view(scope=DailyRollup.SCOPE_CATEGORY),
+        name="category-series",
+    ),
+    path(
+        "teachers/<int:scope_id>/series/",
+        views.RollupSeriesView.as_view(scope=DailyRollup.SCOPE_TEACHER),
+        name="teacher-series",
+    ),
+    path(
+        "courses/<int:scope_id>/grades/",
+        views.GradeStatsView.as_view(scope=GradeStats.SCOPE_COURSE, model=Course),
+        name="course-grades",
+    ),
+    path(
+        "assignments/<int:scope_id>/grades/",
+        views.GradeStatsView.as_view(scope=GradeStats.SCOPE_ASSIGNMENT, model=Assignment),
+        name="assignment-grades",
+    ),
+]
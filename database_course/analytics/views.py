@@ -0,0 +1,69 @@
+from django.shortcuts import get_object_or_404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from analytics.cube import ensure_revenue_cube, revenue_slice
+from analytics.grades import describe_grades
+from analytics.models import GradeStats
+from analytics.rollups import rollup_series
+from analytics.serializers import (
+    GradeStatsQuerySerializer,
+    GradeStatsSerializer,
+    RevenueCubeQuerySerializer,
+    RollupPointSerializer,
+    RollupSeriesQuerySerializer,
+)
+
+
+class RollupSeriesView(APIView):
+    """
+    Enrollments, completions, reviews and revenue of one course, category or
+    teacher over time (?granularity=day|week|month&start=&end=, last year by
+    default), summed from the daily rollups.
+    """
+
+    scope = None
+
+    def get(self, request, scope_id, *args, **kwargs):
+        query = RollupSeriesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        points = rollup_series(self.scope, scope_id, **query.validated_data)
+        return Response(RollupPointSerializer(points, many=True).data)
+
+
+class RevenueCubeView(APIView):
+    """
+    Courses, enrollments, completions and revenue sliced by any combination of
+    category, level, language and teacher, read from the precomputed cube.
+    A stale cube is served while it is rebuilt in the background.
+    """
+
+    def get(self, request, *args, **kwargs):
+        query = RevenueCubeQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        generated_at = ensure_revenue_cube()
+        return Response({
+            "generated_at": generated_at,
+            "results": revenue_slice(**query.validated_data),
+        })
+
+
+class GradeStatsView(APIView):
+    """
+    Grade distribution of a course (final grades, as a share of 100) or an
+    assignment (scores as a share of max_score): count, mean, standard
+    deviation, approximate quartiles/p90 and a histogram (?buckets=10).
+    Served from the streaming stats, without reading the graded rows.
+    """
+
+    scope = None
+    model = None
+
+    def get(self, request, scope_id, *args, **kwargs):
+        query = GradeStatsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        get_object_or_404(self.model, pk=scope_id)
+        stats = GradeStats.objects.filter(scope=self.scope, scope_id=scope_id).first()
+        return Response(
+            GradeStatsSerializer(describe_grades(stats, **query.validated_data)).data
+        )
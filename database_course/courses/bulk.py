@@ -0,0 +1,161 @@
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+
+from courses.models import Assignment, Course, Lesson
+from courses.serializers import AssignmentBulkItemSerializer, LessonBulkItemSerializer
+from courses.signals import course_content_changed
+from courses.stats import apply_course_stats_delta
+from database_course.cache import invalidate_tags
+from dictionaries.models import AssignmentType
+
+
+MAX_BATCH_SIZE = 1000
+INSERT_ATTEMPTS = 3
+
+DOES_NOT_EXIST = serializers.PrimaryKeyRelatedField.default_error_messages["does_not_exist"]
+ORDER_TAKEN = "Lesson order {lesson_order} is already used in course {course_id}."
+
+
+def _validate_items(serializer_class, items):
+    """
+    Validates every item on its own without touching the database. Returns the
+    valid items by index and the field errors of the rejected ones.
+    """
+    if not isinstance(items, list):
+        raise serializers.ValidationError(
+            {"non_field_errors": ["Expected a list of items."]}
+        )
+    if len(items) > MAX_BATCH_SIZE:
+        raise serializers.ValidationError(
+            {"non_field_errors": [f"A batch may contain at most {MAX_BATCH_SIZE} items."]}
+        )
+
+    valid, errors = {}, {}
+    for index, item in enumerate(items):
+        serializer = serializer_class(data=item)
+        if serializer.is_valid():
+            valid[index] = serializer.validated_data
+        else:
+            errors[index] = serializer.errors
+    return valid, errors
+
+
+def _check_exists(valid, errors, field, existing):
+    for index, data in valid.items():
+        if data[field] not in existing:
+            errors.setdefault(index, {})[field] = [
+                DOES_NOT_EXIST.format(pk_value=data[field])
+            ]
+
+
+def _drop_rejected(valid, errors):
+    for index in errors:
+        valid.pop(index, None)
+
+
+def _results(count, errors, created, serializer_class):
+    results = []
+    for index in range(count):
+        if index in errors:
+            results.append({"index": index, "errors": errors[index]})
+        else:
+            results.append({"index": index, **serializer_class(created[index]).data})
+    return results
+
+
+def bulk_create_lessons(items):
+    """
+    Creates a batch of lessons. Courses are checked in one query and lesson
+    orders in another; items that collide with an existing lesson or with an
+    earlier item of the same batch are reported instead of aborting the batch.
+    """
+    valid, errors = _validate_items(LessonBulkItemSerializer, items)
+
+    with transaction.atomic():
+        # Locking the courses serialises concurrent batches for the same course.
+        course_ids = set(
+            Course.objects.select_for_update()
+            .filter(course_id__in={data["course_id"] for data in valid.values()})
+            .values_list("course_id", flat=True)
+        )
+        _check_exists(valid, errors, "course_id", course_ids)
+        _drop_rejected(valid, errors)
+
+        for attempt in range(INSERT_ATTEMPTS):
+            taken = set(
+                Lesson.objects.filter(course_id__in=course_ids).values_list(
+                    "course_id", "lesson_order"
+                )
+            )
+            for index, data in sorted(valid.items()):
+                key = (data["course_id"], data["lesson_order"])
+                if key in taken:
+                    errors[index] = {"lesson_order": [ORDER_TAKEN.format(**data)]}
+                else:
+                    taken.add(key)
+            _drop_rejected(valid, errors)
+
+            indexes = sorted(valid)
+            try:
+                with transaction.atomic():
+                    lessons = Lesson.objects.bulk_create(
+                        [Lesson(**valid[index]) for index in indexes]
+                    )
+                break
+            except IntegrityError:
+                # A single-lesson create took one of the orders in the meantime;
+                # re-read the orders and report it per item.
+                if attempt == INSERT_ATTEMPTS - 1:
+                    raise
+
+        # bulk_create() sends no signals, so do what the receivers would do.
+        per_course = Counter(lesson.course_id for lesson in lessons)
+        for course_id, count in per_course.items():
+            apply_course_stats_delta(course_id, lesson_count=count)
+        invalidate_tags(*(f"course:{course_id}" for course_id in per_course))
+        if per_course:
+            course_content_changed.send(sender=Lesson, course_ids=set(per_course))
+
+    created = dict(zip(indexes, lessons))
+    return _results(len(items), errors, created, LessonBulkItemSerializer)
+
+
+def bulk_create_assignments(items):
+    """
+    Creates a batch of assignments, checking lessons and assignment types with
+    one query each.
+    """
+    valid, errors = _validate_items(AssignmentBulkItemSerializer, items)
+
+    lesson_courses = dict(
+        Lesson.objects.filter(
+            lesson_id__in={data["lesson_id"] for data in valid.values()}
+        ).values_list("lesson_id", "course_id")
+    )
+    type_ids = set(
+        AssignmentType.objects.filter(
+            type_id__in={data["type_id"] for data in valid.values()}
+        ).values_list("type_id", flat=True)
+    )
+    _check_exists(valid, errors, "lesson_id", lesson_courses)
+    _check_exists(valid, errors, "type_id", type_ids)
+    _drop_rejected(valid, errors)
+
+    indexes = sorted(valid)
+    with transaction.atomic():
+        assignments = Assignment.objects.bulk_create(
+            [Assignment(**valid[index]) for index in indexes]
+        )
+
+        per_course = Counter(lesson_courses[assignment.lesson_id] for assignment in assignments)
+        for course_id, count in per_course.items():
+            apply_course_stats_delta(course_id, assignment_count=count)
+        invalidate_tags(
+            *(f"course:{course_id}" for course_id in per_course),
+            *{f"lesson:{assignment.lesson_id}" for assignment in assignments},
+        )
+
+    created = dict(zip(indexes, assignments))
+    return _results(len(items), errors, created, AssignmentBulkItemSerializer)
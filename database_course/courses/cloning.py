@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.shortcuts import get_object_or_404
+
+from courses.models import Course, Lesson
+from courses.signals import course_content_changed
+from courses.stats import apply_course_stats_delta
+
+
+COPY_LESSONS_SQL = """
+INSERT INTO courses_lesson (
+    course_id, title, content, video_url, duration_minutes, lesson_order, updated_at
+)
+SELECT %(target)s, title, content, video_url, duration_minutes, lesson_order, now()
+FROM courses_lesson
+WHERE course_id = %(source)s
+"""
+
+# Lessons are matched by lesson_order, which is unique per course.
+COPY_ASSIGNMENTS_SQL = """
+INSERT INTO courses_assignment (
+    lesson_id, title, description, deadline, max_score, type_id, updated_at
+)
+SELECT new_lesson.lesson_id, a.title, a.description, a.deadline + %(shift)s,
+       a.max_score, a.type_id, now()
+FROM courses_assignment a
+JOIN courses_lesson old_lesson ON old_lesson.lesson_id = a.lesson_id
+JOIN courses_lesson new_lesson
+    ON new_lesson.course_id = %(target)s
+    AND new_lesson.lesson_order = old_lesson.lesson_order
+WHERE old_lesson.course_id = %(source)s
+"""
+
+
+def clone_course(course_id, teacher=None, title=None, deadline_shift=None):
+    """
+    Copies a course with all its lessons and assignments. The number of
+    statements is fixed: one per table plus the stats update, whatever the
+    size of the course.
+    """
+    source = get_object_or_404(Course, course_id=course_id)
+    with transaction.atomic():
+        clone = Course.objects.create(
+            title=title or source.title,
+            description=source.description,
+            level_id=source.level_id,
+            price=source.price,
+            duration_hours=source.duration_hours,
+            language_id=source.language_id,
+            category_id=source.category_id,
+            teacher=teacher or source.teacher,
+        )
+        params = {
+            "source": source.course_id,
+            "target": clone.course_id,
+            "shift": deadline_shift or timedelta(0),
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(COPY_LESSONS_SQL, params)
+            lesson_count = cursor.rowcount
+            cursor.execute(COPY_ASSIGNMENTS_SQL, params)
+            assignment_count = cursor.rowcount
+        # The raw inserts bypass the lesson/assignment signals.
+        apply_course_stats_delta(
+            clone.course_id, lesson_count=lesson_count, assignment_count=assignment_count
+        )
+        course_content_changed.send(sender=Lesson, course_ids={clone.course_id})
+    return clone
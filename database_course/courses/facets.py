@@ -0,0 +1,92 @@
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from database_course.cache import versioned_key
+
+
+FACET_PARAMS = [
+    "category_id",
+    "level_id",
+    "language_id",
+    "teacher_id",
+    "teacher_full_name",
+    "q",
+]
+
+FACETS_SQL = """
+SELECT
+    c.category_id, cat.name,
+    c.level_id, lvl.code, lvl.name,
+    c.language_id, lang.code, lang.name,
+    COUNT(*)
+FROM courses_course c
+JOIN dictionaries_category cat ON cat.category_id = c.category_id
+JOIN dictionaries_courselevel lvl ON lvl.level_id = c.level_id
+JOIN dictionaries_language lang ON lang.language_id = c.language_id
+{where}
+GROUP BY GROUPING SETS (
+    (c.category_id, cat.name),
+    (c.level_id, lvl.code, lvl.name),
+    (c.language_id, lang.code, lang.name)
+)
+"""
+
+
+def compute_course_facets(queryset):
+    """
+    Counts the courses matched by the queryset per category, level and language
+    in one grouped query.
+    """
+    where, params = "", []
+    if queryset.query.has_filters():
+        subquery, params = queryset.order_by().values("course_id").query.sql_with_params()
+        where = f"WHERE c.course_id IN ({subquery})"
+
+    facets = {"categories": [], "levels": [], "languages": []}
+    with connection.cursor() as cursor:
+        cursor.execute(FACETS_SQL.format(where=where), params)
+        for (
+            category_id, category_name,
+            level_id, level_code, level_name,
+            language_id, language_code, language_name,
+            count,
+        ) in cursor.fetchall():
+            # Course FKs are NOT NULL, so a non-null id identifies the grouping set.
+            if category_id is not None:
+                facets["categories"].append(
+                    {"category_id": category_id, "name": category_name, "count": count}
+                )
+            elif level_id is not None:
+                facets["levels"].append(
+                    {"level_id": level_id, "code": level_code, "name": level_name, "count": count}
+                )
+            elif language_id is not None:
+                facets["languages"].append(
+                    {
+                        "language_id": language_id,
+                        "code": language_code,
+                        "name": language_name,
+                        "count": count,
+                    }
+                )
+    for values in facets.values():
+        values.sort(key=lambda row: -row["count"])
+    return facets
+
+
+def get_course_facets(queryset, query_params):
+    """
+    Cached per filter combination under the "courses" tag, which is bumped
+    whenever a course is saved or deleted and retires every combination at once.
+    """
+    filters = {name: query_params.get(name) for name in FACET_PARAMS if query_params.get(name)}
+    key = versioned_key("course-facets", ["courses"], json.dumps(filters, sort_keys=True))
+    facets = cache.get(key)
+    if facets is None:
+        facets = compute_course_facets(queryset)
+        cache.set(key, facets, getattr(settings, "COURSE_FACETS_CACHE_TIMEOUT", 300))
+    return facets
+
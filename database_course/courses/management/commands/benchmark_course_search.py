@@ -0,0 +1,119 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from courses.models import Course
+from courses.search import filter_by_teacher_name, search_courses
+from database_course.benchmarking import explain, rolled_back, seq_scans, timed
+
+
+WORDS = [
+    "python", "django", "data", "science", "design", "marketing", "business",
+    "devops", "sql", "postgres", "machine", "learning", "web", "mobile",
+    "security", "cloud", "analytics", "algorithms", "networks", "statistics",
+]
+FIRST_NAMES = ["Olena", "Andrii", "Maria", "Taras", "Iryna", "Dmytro", "Sofia", "Oleh"]
+LAST_NAMES = ["Shevchenko", "Kovalenko", "Bondarenko", "Tkachenko", "Kravchenko", "Melnyk"]
+
+SEED_TEACHERS = """
+WITH new_users AS (
+    INSERT INTO accounts_user (
+        email, password_hash, first_name, last_name, phone,
+        date_registered, pending_delete, role_id, status_id
+    )
+    SELECT
+        'bench-teacher-' || i || '@example.invalid', '!',
+        (%(first)s::text[])[1 + i %% cardinality(%(first)s::text[])],
+        (%(last)s::text[])[1 + (i / 8) %% cardinality(%(last)s::text[])] || i,
+        '', now(), false,
+        (SELECT MIN(role_id) FROM dictionaries_role),
+        (SELECT MIN(status_id) FROM dictionaries_userstatus)
+    FROM generate_series(1, %(teachers)s) AS i
+    RETURNING user_id
+)
+INSERT INTO accounts_teacher (teacher_id, academic_degree, specialization, bio)
+SELECT user_id, '', '', '' FROM new_users
+"""
+
+SEED_COURSES = """
+INSERT INTO courses_course (
+    title, description, level_id, price, duration_hours, language_id,
+    category_id, created_at, updated_at, pending_delete, teacher_id
+)
+SELECT
+    w[1 + i %% cardinality(w)] || ' ' || w[1 + (i / 7) %% cardinality(w)] || ' ' || i,
+    'Course about ' || w[1 + (i / 3) %% cardinality(w)]
+        || ' and ' || w[1 + (i / 11) %% cardinality(w)],
+    lv[1 + i %% cardinality(lv)],
+    (i %% 200) + 9.99,
+    10 + i %% 50,
+    lg[1 + i %% cardinality(lg)],
+    ct[1 + i %% cardinality(ct)],
+    now() - make_interval(mins => i),
+    now() - make_interval(mins => i),
+    false,
+    t[1 + i %% cardinality(t)]
+FROM generate_series(1, %(courses)s) AS i,
+    (SELECT %(words)s::text[] AS w) words,
+    (SELECT array_agg(level_id) AS lv FROM dictionaries_courselevel) levels,
+    (SELECT array_agg(language_id) AS lg FROM dictionaries_language) languages,
+    (SELECT array_agg(category_id) AS ct FROM dictionaries_category) categories,
+    (SELECT array_agg(teacher_id) AS t FROM accounts_teacher) teachers
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Seeds a synthetic catalog inside a rolled-back transaction and compares "
+        "the old LIKE-based filters with the indexed full-text/trigram search."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--courses", type=int, default=1_000_000)
+        parser.add_argument("--teachers", type=int, default=2_000)
+        parser.add_argument("--query", default="python data")
+        parser.add_argument("--typo", default="pyhton")
+        parser.add_argument("--teacher-name", default="Kovalenko")
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            with connection.cursor() as cursor:
+                with timed(self.stdout, f"seed {options['teachers']} teachers"):
+                    cursor.execute(SEED_TEACHERS, {
+                        "first": FIRST_NAMES,
+                        "last": LAST_NAMES,
+                        "teachers": options["teachers"],
+                    })
+                with timed(self.stdout, f"seed {options['courses']} courses (trigger included)"):
+                    cursor.execute(SEED_COURSES, {
+                        "courses": options["courses"],
+                        "words": WORDS,
+                    })
+                cursor.execute("ANALYZE accounts_user")
+                cursor.execute("ANALYZE courses_course")
+
+            courses = Course.objects.select_related(
+                "level", "language", "category", "teacher__user"
+            ).order_by("-created_at", "-course_id")
+            name = options["teacher_name"]
+            cases = [
+                (
+                    "teacher_full_name, old queryset | queryset",
+                    courses.filter(teacher__user__first_name__icontains=name)
+                    | courses.filter(teacher__user__last_name__icontains=name),
+                ),
+                ("teacher_full_name, indexed", filter_by_teacher_name(courses, name)),
+                (
+                    f"title icontains {options['typo']!r} (LIKE baseline)",
+                    courses.filter(title__icontains=options["typo"]),
+                ),
+                (f"q={options['query']!r}", search_courses(courses, options["query"])),
+                (f"q={options['typo']!r} (typo)", search_courses(courses, options["typo"])),
+            ]
+            for label, queryset in cases:
+                elapsed, plan = explain(queryset[:20])
+                self.stdout.write(
+                    f"{label}: {elapsed} ms, "
+                    f"{'seq scan' if seq_scans(plan, 'courses_course') else 'index'} on courses_course"
+                )
+                if options["verbosity"] > 1:
+                    self.stdout.write(plan)
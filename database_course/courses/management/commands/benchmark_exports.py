@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from courses.management.commands.benchmark_course_search import (
+    FIRST_NAMES,
+    LAST_NAMES,
+    SEED_COURSES,
+    SEED_TEACHERS,
+    WORDS,
+)
+from courses.views import CourseExportView
+from database_course.benchmarking import rolled_back, timed
+from database_course.export import encode_rows
+from learning.views import EnrollmentExportView
+from reviews.views import ReviewExportView
+from submissions.views import SubmissionExportView
+
+
+EXPORTS = [CourseExportView, EnrollmentExportView, SubmissionExportView, ReviewExportView]
+
+
+def _counted(rows, counter):
+    for row in rows:
+        counter[0] += 1
+        yield row
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures rows/sec and output size of the streaming exports in every "
+        "format, optionally on a synthetic catalog inside a rolled-back transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--courses", type=int, default=0, help="Synthetic courses to seed.")
+        parser.add_argument("--teachers", type=int, default=200)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            if options["courses"]:
+                with connection.cursor() as cursor:
+                    with timed(self.stdout, f"seed {options['courses']} courses"):
+                        cursor.execute(SEED_TEACHERS, {
+                            "first": FIRST_NAMES,
+                            "last": LAST_NAMES,
+                            "teachers": options["teachers"],
+                        })
+                        cursor.execute(SEED_COURSES, {
+                            "courses": options["courses"],
+                            "words": WORDS,
+                        })
+
+            for view_class in EXPORTS:
+                for output in ("ndjson", "csv"):
+                    for compress in (False, True):
+                        self.run_export(view_class(), output, compress)
+
+    def run_export(self, view, output, compress):
+        counter = [0]
+        columns, rows = view.get_export_rows()
+        started = time.perf_counter()
+        size = sum(
+            len(chunk)
+            for chunk in encode_rows(_counted(rows, counter), columns, output, compress)
+        )
+        elapsed = time.perf_counter() - started
+        rate = counter[0] / elapsed if elapsed else 0
+        self.stdout.write(
+            f"{view.export_name} {output}{' gzip' if compress else ''}: "
+            f"{counter[0]} rows in {elapsed * 1000:.1f} ms, "
+            f"{rate:,.0f} rows/sec, {size / 1024:.1f} KiB"
+        )
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from courses.stats import rebuild_course_stats
+
+
+class Command(BaseCommand):
+    help = "Recomputes CourseStats from the source tables and reports drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--course",
+            type=int,
+            action="append",
+            dest="course_ids",
+            help="Only rebuild the given course id (may be repeated).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drift without writing the corrected counters.",
+        )
+
+    def handle(self, *args, **options):
+        drift = rebuild_course_stats(options["course_ids"], dry_run=options["dry_run"])
+        for course_id, field, stored, actual in drift:
+            self.stdout.write(f"course {course_id}: {field} stored={stored} actual={actual}")
+
+        courses = len({course_id for course_id, *_ in drift})
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("No drift found."))
+        elif options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Drift found in {courses} course(s)."))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {courses} course(s)."))
@@ -0,0 +1,56 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+POPULATE_COURSE_STATS = """
+INSERT INTO courses_coursestats (
+    course_id, enrollment_count, completed_count, review_count,
+    rating_sum, lesson_count, assignment_count
+)
+SELECT
+    c.course_id,
+    (SELECT COUNT(*) FROM learning_enrollment e WHERE e.course_id = c.course_id),
+    (SELECT COUNT(*) FROM learning_enrollment e
+        WHERE e.course_id = c.course_id AND e.final_grade IS NOT NULL),
+    (SELECT COUNT(*) FROM reviews_review r
+        JOIN learning_enrollment e ON e.enrollment_id = r.enrollment_id
+        WHERE e.course_id = c.course_id),
+    (SELECT COALESCE(SUM(r.rating), 0) FROM reviews_review r
+        JOIN learning_enrollment e ON e.enrollment_id = r.enrollment_id
+        WHERE e.course_id = c.course_id),
+    (SELECT COUNT(*) FROM courses_lesson l WHERE l.course_id = c.course_id),
+    (SELECT COUNT(*) FROM courses_assignment a
+        JOIN courses_lesson l ON l.lesson_id = a.lesson_id
+        WHERE l.course_id = c.course_id)
+FROM courses_course c
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0001_initial'),
+        ('learning', '0001_initial'),
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseStats',
+            fields=[
+                ('course', models.OneToOneField(db_column='course_id', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='courses.course')),
+                ('enrollment_count', models.IntegerField(default=0)),
+                ('completed_count', models.IntegerField(default=0)),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('lesson_count', models.IntegerField(default=0)),
+                ('assignment_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['-enrollment_count'], name='course_stats_popularity_idx')],
+            },
+        ),
+        migrations.RunSQL(POPULATE_COURSE_STATS, reverse_sql=migrations.RunSQL.noop),
+    ]
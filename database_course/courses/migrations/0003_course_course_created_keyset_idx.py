@@ -0,0 +1,19 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_user_registered_keyset_idx'),
+        ('courses', '0002_coursestats'),
+        ('dictionaries', '0007_auto_20260117_1421'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['-created_at', '-course_id'], name='course_created_keyset_idx'),
+        ),
+    ]
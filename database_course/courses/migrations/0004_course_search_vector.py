@@ -0,0 +1,92 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:15
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE OR REPLACE FUNCTION courses_course_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A')
+        || setweight(to_tsvector('simple', coalesce(
+            (SELECT name FROM dictionaries_category
+             WHERE category_id = NEW.category_id), '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(
+            (SELECT first_name || ' ' || last_name FROM accounts_user
+             WHERE user_id = NEW.teacher_id), '')), 'B')
+        || setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER courses_course_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, category_id, teacher_id
+    ON courses_course
+    FOR EACH ROW EXECUTE FUNCTION courses_course_search_vector_update();
+
+CREATE OR REPLACE FUNCTION courses_category_search_vector_refresh() RETURNS trigger AS $$
+BEGIN
+    UPDATE courses_course SET title = title WHERE category_id = NEW.category_id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER courses_category_search_vector_trigger
+    AFTER UPDATE OF name ON dictionaries_category
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION courses_category_search_vector_refresh();
+
+CREATE OR REPLACE FUNCTION courses_teacher_search_vector_refresh() RETURNS trigger AS $$
+BEGIN
+    UPDATE courses_course SET title = title WHERE teacher_id = NEW.user_id;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER courses_teacher_search_vector_trigger
+    AFTER UPDATE OF first_name, last_name ON accounts_user
+    FOR EACH ROW WHEN (
+        OLD.first_name IS DISTINCT FROM NEW.first_name
+        OR OLD.last_name IS DISTINCT FROM NEW.last_name
+    )
+    EXECUTE FUNCTION courses_teacher_search_vector_refresh();
+
+UPDATE courses_course SET title = title;
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS courses_teacher_search_vector_trigger ON accounts_user;
+DROP FUNCTION IF EXISTS courses_teacher_search_vector_refresh();
+DROP TRIGGER IF EXISTS courses_category_search_vector_trigger ON dictionaries_category;
+DROP FUNCTION IF EXISTS courses_category_search_vector_refresh();
+DROP TRIGGER IF EXISTS courses_course_search_vector_trigger ON courses_course;
+DROP FUNCTION IF EXISTS courses_course_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_user_name_trgm_indexes'),
+        ('courses', '0003_course_course_created_keyset_idx'),
+        ('dictionaries', '0007_auto_20260117_1421'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='course_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='course_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER, reverse_sql=DROP_SEARCH_VECTOR_TRIGGER),
+    ]
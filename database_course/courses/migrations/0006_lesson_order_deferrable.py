@@ -0,0 +1,39 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:23
+
+import django.db.models.constraints
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0005_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='lesson',
+            name='unique_lesson_order_per_course',
+        ),
+        migrations.AddConstraint(
+            model_name='lesson',
+            constraint=models.UniqueConstraint(deferrable=django.db.models.constraints.Deferrable['IMMEDIATE'], fields=('course', 'lesson_order'), name='unique_lesson_order_per_course'),
+        ),
+        # Spread existing orders out so lessons can be inserted in between
+        # without renumbering their neighbours.
+        migrations.RunSQL(
+            """
+            UPDATE courses_lesson AS l
+            SET lesson_order = ranked.position * 1024
+            FROM (
+                SELECT lesson_id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY course_id ORDER BY lesson_order, lesson_id
+                       ) AS position
+                FROM courses_lesson
+            ) AS ranked
+            WHERE l.lesson_id = ranked.lesson_id
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_lesson_order_deferrable'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='pending_delete',
+            field=models.BooleanField(default=False),
+        ),
+    ]
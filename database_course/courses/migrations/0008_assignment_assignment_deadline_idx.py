@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0007_course_pending_delete'),
+        ('dictionaries', '0007_auto_20260117_1421'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assignment',
+            index=models.Index(fields=['deadline', 'assignment_id'], name='assignment_deadline_idx'),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:37
+
+from django.db import migrations, models
+
+
+# Uses the default prior (RATING_PRIOR_MEAN=3.0, RATING_PRIOR_WEIGHT=10);
+# rebuild_course_stats recomputes the scores with the configured one.
+POPULATE_RATINGS = """
+UPDATE courses_coursestats s
+SET rating_1 = r.rating_1,
+    rating_2 = r.rating_2,
+    rating_3 = r.rating_3,
+    rating_4 = r.rating_4,
+    rating_5 = r.rating_5
+FROM (
+    SELECT e.course_id,
+           COUNT(*) FILTER (WHERE rv.rating = 1) AS rating_1,
+           COUNT(*) FILTER (WHERE rv.rating = 2) AS rating_2,
+           COUNT(*) FILTER (WHERE rv.rating = 3) AS rating_3,
+           COUNT(*) FILTER (WHERE rv.rating = 4) AS rating_4,
+           COUNT(*) FILTER (WHERE rv.rating = 5) AS rating_5
+    FROM reviews_review rv
+    JOIN learning_enrollment e ON e.enrollment_id = rv.enrollment_id
+    GROUP BY e.course_id
+) r
+WHERE r.course_id = s.course_id;
+
+UPDATE courses_coursestats
+SET bayesian_score = (3.0 * 10 + rating_sum)::float / (10 + review_count)
+WHERE review_count > 0;
+"""
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0008_assignment_assignment_deadline_idx'),
+        ('reviews', '0002_review_review_created_keyset_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coursestats',
+            name='bayesian_score',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='coursestats',
+            name='rating_1',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='coursestats',
+            name='rating_2',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='coursestats',
+            name='rating_3',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='coursestats',
+            name='rating_4',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='coursestats',
+            name='rating_5',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='coursestats',
+            index=models.Index(fields=['-bayesian_score', 'course'], name='course_stats_bayesian_idx'),
+        ),
+        migrations.RunSQL(POPULATE_RATINGS, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0009_coursestats_ratings'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='course',
+            name='pending_delete',
+            field=models.BooleanField(db_default=False, default=False),
+        ),
+    ]
@@ -1,4 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Now
 
 from accounts.models import Teacher
 from dictionaries.models import AssignmentType, Category, CourseLevel, Language
@@ -14,7 +17,24 @@ class Course(models.Model):
     language = models.ForeignKey(Language, on_delete=models.PROTECT)
     category = models.ForeignKey(Category, on_delete=models.PROTECT)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
     teacher = models.ForeignKey(Teacher, on_delete=models.PROTECT, related_name="courses")
+    # Set while a deletion job removes the course; such courses are hidden.
+    pending_delete = models.BooleanField(default=False, db_default=False)
+    # Maintained by a database trigger from title, description, category name
+    # and teacher name (see migration 0004_course_search_vector).
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-created_at", "-course_id"], name="course_created_keyset_idx"),
+            GinIndex(fields=["search_vector"], name="course_search_vector_idx"),
+            GinIndex(fields=["title"], opclasses=["gin_trgm_ops"], name="course_title_trgm_idx"),
+            # Lets conditional GETs read updated_at with an index-only scan.
+            models.Index(
+                fields=["course_id"], include=["updated_at"], name="course_updated_at_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -28,14 +48,23 @@ class Lesson(models.Model):
     video_url = models.URLField(blank=True)
     duration_minutes = models.IntegerField(null=True, blank=True)
     lesson_order = models.IntegerField()
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
 
     class Meta:
         constraints = [
+            # Deferrable so a whole reordering can be applied in one UPDATE;
+            # the check then runs at the end of the statement, not per row.
             models.UniqueConstraint(
                 fields=["course", "lesson_order"],
                 name="unique_lesson_order_per_course",
+                deferrable=models.Deferrable.IMMEDIATE,
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["lesson_id"], include=["updated_at"], name="lesson_updated_at_idx"
+            ),
+        ]
         ordering = ["lesson_order"]
 
     def __str__(self) -> str:
@@ -50,6 +79,49 @@ class Assignment(models.Model):
     deadline = models.DateTimeField(null=True, blank=True)
     max_score = models.IntegerField()
     type = models.ForeignKey(AssignmentType, on_delete=models.PROTECT)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["assignment_id"], include=["updated_at"], name="assignment_updated_at_idx"
+            ),
+            models.Index(fields=["deadline", "assignment_id"], name="assignment_deadline_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
+
+
+class CourseStats(models.Model):
+    course = models.OneToOneField(
+        Course,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        db_column="course_id",
+        related_name="stats",
+    )
+    enrollment_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_1 = models.IntegerField(default=0)
+    rating_2 = models.IntegerField(default=0)
+    rating_3 = models.IntegerField(default=0)
+    rating_4 = models.IntegerField(default=0)
+    rating_5 = models.IntegerField(default=0)
+    # See courses.stats.bayesian_score_expression.
+    bayesian_score = models.FloatField(default=0)
+    lesson_count = models.IntegerField(default=0)
+    assignment_count = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-enrollment_count"], name="course_stats_popularity_idx"),
+            models.Index(
+                fields=["-bayesian_score", "course"], name="course_stats_bayesian_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Stats {self.course_id}"
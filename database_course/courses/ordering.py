@@ -0,0 +1,114 @@
+from django.db import connection, transaction
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import serializers
+
+from courses.models import Course, Lesson
+from database_course.cache import invalidate_tags
+
+
+# Distance between consecutive lesson orders after a reorder, so that a lesson
+# can later be placed between two others by updating only its own row.
+LESSON_ORDER_GAP = 1024
+
+REORDER_SQL = """
+UPDATE courses_lesson AS l
+SET lesson_order = v.lesson_order, updated_at = %s
+FROM (VALUES {values}) AS v(lesson_id, lesson_order)
+WHERE l.lesson_id = v.lesson_id AND l.course_id = %s
+"""
+
+
+def _lock_course(course_id):
+    # Serialises reorders of the same course.
+    return get_object_or_404(Course.objects.select_for_update(), course_id=course_id)
+
+
+def _current_order(course_id):
+    return list(
+        Lesson.objects.filter(course_id=course_id)
+        .order_by("lesson_order", "lesson_id")
+        .values_list("lesson_id", "lesson_order")
+    )
+
+
+def _write_orders(course_id, orders):
+    """
+    Applies {lesson_id: lesson_order} in one UPDATE. The unique constraint is
+    deferrable, so swaps inside the statement do not trip it.
+    """
+    if not orders:
+        return
+    values = ", ".join(["(%s, %s)"] * len(orders))
+    params = [timezone.now()]
+    for lesson_id, lesson_order in orders.items():
+        params.extend([lesson_id, lesson_order])
+    params.append(course_id)
+    with connection.cursor() as cursor:
+        cursor.execute(REORDER_SQL.format(values=values), params)
+    # The UPDATE bypasses the model signals.
+    invalidate_tags(
+        f"course:{course_id}", *(f"lesson:{lesson_id}" for lesson_id in orders)
+    )
+
+
+def _spaced(lesson_ids):
+    return {
+        lesson_id: (position + 1) * LESSON_ORDER_GAP
+        for position, lesson_id in enumerate(lesson_ids)
+    }
+
+
+def reorder_lessons(course_id, lesson_ids):
+    """
+    Replaces the order of all lessons of a course with the given sequence.
+    """
+    with transaction.atomic():
+        _lock_course(course_id)
+        current = [lesson_id for lesson_id, _ in _current_order(course_id)]
+        if len(set(lesson_ids)) != len(lesson_ids) or set(lesson_ids) != set(current):
+            raise serializers.ValidationError(
+                {"lesson_ids": ["Must list every lesson of the course exactly once."]}
+            )
+        _write_orders(course_id, _spaced(lesson_ids))
+
+
+def move_lesson(lesson_id, after_lesson_id=None):
+    """
+    Places a lesson right after another lesson of the same course, or first
+    when after_lesson_id is None. Only the moved row is updated unless the two
+    neighbours have no room left between them, in which case the course is
+    re-spaced in a single statement.
+    """
+    lesson = get_object_or_404(Lesson, lesson_id=lesson_id)
+    with transaction.atomic():
+        _lock_course(lesson.course_id)
+        rows = [row for row in _current_order(lesson.course_id) if row[0] != lesson_id]
+        if after_lesson_id is None:
+            position = 0
+        else:
+            ids = [row[0] for row in rows]
+            if after_lesson_id not in ids:
+                raise serializers.ValidationError(
+                    {"after_lesson_id": ["Must be another lesson of the same course."]}
+                )
+            position = ids.index(after_lesson_id) + 1
+
+        lower = rows[position - 1][1] if position > 0 else None
+        upper = rows[position][1] if position < len(rows) else None
+        if lower is None and upper is None:
+            new_order = LESSON_ORDER_GAP
+        elif lower is None:
+            new_order = upper - LESSON_ORDER_GAP
+        elif upper is None:
+            new_order = lower + LESSON_ORDER_GAP
+        elif upper - lower > 1:
+            new_order = (lower + upper) // 2
+        else:
+            ids = [row[0] for row in rows]
+            ids.insert(position, lesson_id)
+            _write_orders(lesson.course_id, _spaced(ids))
+            return lesson.course_id
+
+        _write_orders(lesson.course_id, {lesson_id: new_order})
+    return lesson.course_id
@@ -0,0 +1,39 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db.models import F, Q
+
+
+# Must match the configuration used by the search_vector trigger.
+SEARCH_CONFIG = "simple"
+
+
+def search_courses(queryset, text):
+    """
+    Ranks courses by full-text match on the stored search_vector. When nothing
+    matches (usually a typo) it falls back to trigram word similarity on the
+    title. Both paths are served by GIN indexes.
+    """
+    query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+    matches = queryset.filter(search_vector=query)
+    if matches.exists():
+        return matches.annotate(
+            rank=SearchRank(F("search_vector"), query)
+        ).order_by("-rank", "-course_id")
+    return (
+        queryset.filter(title__trigram_word_similar=text)
+        .annotate(rank=TrigramWordSimilarity(text, "title"))
+        .order_by("-rank", "-course_id")
+    )
+
+
+def filter_by_teacher_name(queryset, full_name):
+    """
+    Every word of the name has to match the teacher's first or last name.
+    Both columns carry trigram indexes on UPPER(...), which is what icontains
+    compiles to, so this stays an index lookup.
+    """
+    for term in full_name.split():
+        queryset = queryset.filter(
+            Q(teacher__user__first_name__icontains=term)
+            | Q(teacher__user__last_name__icontains=term)
+        )
+    return queryset
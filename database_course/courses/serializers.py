@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
 from accounts.models import Teacher
-from courses.models import Assignment, Course, Lesson
+from courses.models import Assignment, Course, CourseStats, Lesson
 from dictionaries.models import AssignmentType, Category, CourseLevel, Language
 
 
@@ -67,9 +67,18 @@ class CourseDetailSerializer(serializers.ModelSerializer):
             "teacher_id",
             "teacher_first_name",
             "teacher_last_name",
+            "updated_at",
         ]
 
 
+class CourseCloneSerializer(serializers.Serializer):
+    teacher_id = serializers.PrimaryKeyRelatedField(
+        source="teacher", queryset=Teacher.objects.all(), required=False
+    )
+    title = serializers.CharField(max_length=200, required=False)
+    deadline_shift = serializers.DurationField(required=False)
+
+
 class CourseListSerializer(serializers.ModelSerializer):
     level_code = serializers.CharField(source="level.code", read_only=True)
     language_code = serializers.CharField(source="language.code", read_only=True)
@@ -122,6 +131,25 @@ class LessonCreateSerializer(serializers.ModelSerializer):
         read_only_fields = ["lesson_id"]
 
 
+class LessonBulkItemSerializer(serializers.ModelSerializer):
+    # Foreign keys are checked for the whole batch at once, see courses.bulk.
+    course_id = serializers.IntegerField()
+
+    class Meta:
+        model = Lesson
+        fields = [
+            "lesson_id",
+            "course_id",
+            "title",
+            "content",
+            "video_url",
+            "duration_minutes",
+            "lesson_order",
+        ]
+        read_only_fields = ["lesson_id"]
+        validators = []
+
+
 class LessonListSerializer(serializers.ModelSerializer):
     course_id = serializers.IntegerField(read_only=True)
 
@@ -150,9 +178,18 @@ class LessonDetailSerializer(serializers.ModelSerializer):
             "video_url",
             "duration_minutes",
             "lesson_order",
+            "updated_at",
         ]
 
 
+class LessonReorderSerializer(serializers.Serializer):
+    lesson_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+
+class LessonMoveSerializer(serializers.Serializer):
+    after_lesson_id = serializers.IntegerField(allow_null=True)
+
+
 class AssignmentCreateSerializer(serializers.ModelSerializer):
     lesson_id = serializers.PrimaryKeyRelatedField(
         source="lesson", queryset=Lesson.objects.all()
@@ -175,6 +212,24 @@ class AssignmentCreateSerializer(serializers.ModelSerializer):
         read_only_fields = ["assignment_id"]
 
 
+class AssignmentBulkItemSerializer(serializers.ModelSerializer):
+    lesson_id = serializers.IntegerField()
+    type_id = serializers.IntegerField()
+
+    class Meta:
+        model = Assignment
+        fields = [
+            "assignment_id",
+            "lesson_id",
+            "title",
+            "description",
+            "deadline",
+            "max_score",
+            "type_id",
+        ]
+        read_only_fields = ["assignment_id"]
+
+
 class AssignmentListSerializer(serializers.ModelSerializer):
     lesson_id = serializers.IntegerField(read_only=True)
     type_code = serializers.CharField(source="type.code", read_only=True)
@@ -209,6 +264,7 @@ class AssignmentDetailSerializer(serializers.ModelSerializer):
             "max_score",
             "type_code",
             "type_name",
+            "updated_at",
         ]
 
 
@@ -225,6 +281,42 @@ class CourseStructureRowSerializer(serializers.Serializer):
     assignment_type = serializers.CharField(allow_null=True)
 
 
+class RatingHistogramField(serializers.Field):
+    """
+    Read-only {"1": n, ..., "5": n} built from the rating_<n> counters.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, stats):
+        return {str(rating): getattr(stats, f"rating_{rating}") for rating in range(1, 6)}
+
+
+class TopCourseSerializer(serializers.ModelSerializer):
+    title = serializers.CharField(source="course.title", read_only=True)
+    category_name = serializers.CharField(source="course.category.name", read_only=True)
+    avg_rating = serializers.SerializerMethodField()
+    rating_histogram = RatingHistogramField()
+
+    class Meta:
+        model = CourseStats
+        fields = [
+            "course_id",
+            "title",
+            "category_name",
+            "review_count",
+            "avg_rating",
+            "bayesian_score",
+            "rating_histogram",
+        ]
+
+    def get_avg_rating(self, stats):
+        return round(stats.rating_sum / stats.review_count, 2) if stats.review_count else None
+
+
 class CourseAnalyticsSerializer(serializers.Serializer):
     total_courses = serializers.IntegerField()
     total_students = serializers.IntegerField()
@@ -257,3 +349,4 @@ class CourseAnalyticsSerializer(serializers.Serializer):
         child=serializers.DictField(),
         required=False
     )
+    generated_at = serializers.DateTimeField(required=False)
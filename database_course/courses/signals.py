@@ -0,0 +1,298 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from courses.models import Assignment, Course, CourseStats, Lesson
+from courses.stats import RATINGS, apply_course_stats_delta
+from database_course.cache import invalidate_tags
+from learning.models import Enrollment
+from reviews.models import Review
+
+
+# Sent with course_ids by writes that bypass the lesson signals (bulk inserts,
+# cloning), so listeners indexing course content can catch up.
+course_content_changed = Signal()
+
+
+def previous_state(instance):
+    """
+    Column values a course, enrollment, review, lesson or assignment had before
+    the current save, read once by the pre_save receivers below so other apps'
+    post_save receivers need not query again; None for new rows. Course:
+    teacher_id, category_id, price. Enrollment: course_id, final_grade,
+    enroll_date, completion_date. Review: course_id, rating, created_at.
+    Lesson: course_id. Assignment: lesson_id, course_id, max_score.
+    """
+    return getattr(instance, "_previous_state", None)
+
+
+def _apply_change(before, after):
+    """
+    before/after are (course_id, counters) pairs describing what a row
+    contributed to the course stats; either side may be None.
+    """
+    if before and after and before[0] == after[0]:
+        course_id = after[0]
+        apply_course_stats_delta(
+            course_id,
+            **{
+                field: after[1].get(field, 0) - before[1].get(field, 0)
+                for field in after[1].keys() | before[1].keys()
+            },
+        )
+        return
+    if before:
+        apply_course_stats_delta(
+            before[0], **{field: -value for field, value in before[1].items()}
+        )
+    if after:
+        apply_course_stats_delta(after[0], **after[1])
+
+
+@receiver(post_save, sender=Course)
+def create_course_stats(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        CourseStats.objects.get_or_create(course=instance)
+
+
+@receiver(pre_save, sender=Course)
+def remember_course(sender, instance, raw=False, **kwargs):
+    instance._previous_state = None
+    if raw or instance._state.adding:
+        return
+    instance._previous_state = (
+        Course.objects.filter(pk=instance.pk)
+        .values("teacher_id", "category_id", "price")
+        .first()
+    )
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_course_cache(sender, instance, **kwargs):
+    previous = previous_state(instance)
+    previous_teacher_id = previous and previous["teacher_id"]
+    invalidate_tags(
+        "courses",
+        f"course:{instance.course_id}",
+        f"teacher:{instance.teacher_id}",
+        previous_teacher_id and f"teacher:{previous_teacher_id}",
+    )
+
+
+# Enrollment
+
+
+def _enrollment_contribution(course_id, final_grade):
+    return course_id, {
+        "enrollment_count": 1,
+        "completed_count": 1 if final_grade is not None else 0,
+    }
+
+
+@receiver(pre_save, sender=Enrollment)
+def remember_enrollment(sender, instance, raw=False, **kwargs):
+    instance._course_stats_before = None
+    instance._previous_state = None
+    if raw or instance._state.adding:
+        return
+    row = (
+        Enrollment.objects.filter(pk=instance.pk)
+        .values("course_id", "final_grade", "enroll_date", "completion_date")
+        .first()
+    )
+    instance._previous_state = row
+    if row:
+        instance._course_stats_before = _enrollment_contribution(
+            row["course_id"], row["final_grade"]
+        )
+
+
+@receiver(post_save, sender=Enrollment)
+def update_stats_on_enrollment_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _apply_change(
+        getattr(instance, "_course_stats_before", None),
+        _enrollment_contribution(instance.course_id, instance.final_grade),
+    )
+
+
+@receiver(post_delete, sender=Enrollment)
+def update_stats_on_enrollment_delete(sender, instance, **kwargs):
+    _apply_change(_enrollment_contribution(instance.course_id, instance.final_grade), None)
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def invalidate_enrollment_cache(sender, instance, **kwargs):
+    before = getattr(instance, "_course_stats_before", None)
+    invalidate_tags(
+        f"enrollment:{instance.enrollment_id}",
+        f"student:{instance.student_id}",
+        f"course:{instance.course_id}",
+        before and f"course:{before[0]}",
+    )
+
+
+# Review
+
+
+def _review_contribution(course_id, rating):
+    counters = {"review_count": 1, "rating_sum": rating}
+    if rating in RATINGS:
+        counters[f"rating_{rating}"] = 1
+    return course_id, counters
+
+
+def review_course_id(review):
+    return (
+        Enrollment.objects.filter(pk=review.enrollment_id)
+        .values_list("course_id", flat=True)
+        .first()
+    )
+
+
+@receiver(pre_save, sender=Review)
+def remember_review(sender, instance, raw=False, **kwargs):
+    instance._course_stats_before = None
+    instance._previous_state = None
+    if raw or instance._state.adding:
+        return
+    row = (
+        Review.objects.filter(pk=instance.pk)
+        .values("rating", "created_at", course_id=F("enrollment__course_id"))
+        .first()
+    )
+    instance._previous_state = row
+    if row:
+        instance._course_stats_before = _review_contribution(row["course_id"], row["rating"])
+
+
+@receiver(post_save, sender=Review)
+def update_stats_on_review_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _apply_change(
+        getattr(instance, "_course_stats_before", None),
+        _review_contribution(review_course_id(instance), instance.rating),
+    )
+
+
+@receiver(post_delete, sender=Review)
+def update_stats_on_review_delete(sender, instance, **kwargs):
+    _apply_change(_review_contribution(review_course_id(instance), instance.rating), None)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_review_cache(sender, instance, **kwargs):
+    before = getattr(instance, "_course_stats_before", None)
+    invalidate_tags(
+        f"review:{instance.review_id}",
+        f"enrollment:{instance.enrollment_id}",
+        f"course:{review_course_id(instance)}",
+        before and f"course:{before[0]}",
+    )
+
+
+# Lesson
+
+
+@receiver(pre_save, sender=Lesson)
+def remember_lesson(sender, instance, raw=False, **kwargs):
+    instance._course_stats_before = None
+    instance._previous_state = None
+    if raw or instance._state.adding:
+        return
+    instance._previous_state = Lesson.objects.filter(pk=instance.pk).values("course_id").first()
+    if instance._previous_state:
+        instance._course_stats_before = instance._previous_state["course_id"]
+
+
+@receiver(post_save, sender=Lesson)
+def update_stats_on_lesson_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous_course_id = getattr(instance, "_course_stats_before", None)
+    if created or previous_course_id is None:
+        apply_course_stats_delta(instance.course_id, lesson_count=1)
+    elif previous_course_id != instance.course_id:
+        # The lesson moved to another course and took its assignments along.
+        moved = {"lesson_count": 1, "assignment_count": instance.assignments.count()}
+        _apply_change((previous_course_id, moved), (instance.course_id, moved))
+
+
+@receiver(post_delete, sender=Lesson)
+def update_stats_on_lesson_delete(sender, instance, **kwargs):
+    # Assignments are removed by the cascade and subtract themselves.
+    apply_course_stats_delta(instance.course_id, lesson_count=-1)
+
+
+@receiver(post_save, sender=Lesson)
+@receiver(post_delete, sender=Lesson)
+def invalidate_lesson_cache(sender, instance, **kwargs):
+    previous_course_id = getattr(instance, "_course_stats_before", None)
+    invalidate_tags(
+        f"lesson:{instance.lesson_id}",
+        f"course:{instance.course_id}",
+        previous_course_id and f"course:{previous_course_id}",
+    )
+
+
+# Assignment
+
+
+def _assignment_course_id(assignment):
+    return (
+        Lesson.objects.filter(pk=assignment.lesson_id)
+        .values_list("course_id", flat=True)
+        .first()
+    )
+
+
+@receiver(pre_save, sender=Assignment)
+def remember_assignment(sender, instance, raw=False, **kwargs):
+    instance._course_stats_before = None
+    instance._previous_lesson_id = None
+    instance._previous_state = None
+    if raw or instance._state.adding:
+        return
+    row = (
+        Assignment.objects.filter(pk=instance.pk)
+        .values("lesson_id", "max_score", course_id=F("lesson__course_id"))
+        .first()
+    )
+    instance._previous_state = row
+    if row:
+        instance._previous_lesson_id = row["lesson_id"]
+        instance._course_stats_before = (row["course_id"], {"assignment_count": 1})
+
+
+@receiver(post_save, sender=Assignment)
+def update_stats_on_assignment_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    _apply_change(
+        getattr(instance, "_course_stats_before", None),
+        (_assignment_course_id(instance), {"assignment_count": 1}),
+    )
+
+
+@receiver(post_delete, sender=Assignment)
+def update_stats_on_assignment_delete(sender, instance, **kwargs):
+    _apply_change((_assignment_course_id(instance), {"assignment_count": 1}), None)
+
+
+@receiver(post_save, sender=Assignment)
+@receiver(post_delete, sender=Assignment)
+def invalidate_assignment_cache(sender, instance, **kwargs):
+    before = getattr(instance, "_course_stats_before", None)
+    previous_lesson_id = getattr(instance, "_previous_lesson_id", None)
+    invalidate_tags(
+        f"assignment:{instance.assignment_id}",
+        f"lesson:{instance.lesson_id}",
+        f"course:{_assignment_course_id(instance)}",
+        previous_lesson_id and f"lesson:{previous_lesson_id}",
+        before and f"course:{before[0]}",
+    )
@@ -0,0 +1,168 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Case, Count, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Cast
+from django.db.models.lookups import GreaterThan
+
+from courses.models import Assignment, Course, CourseStats, Lesson
+from learning.models import Enrollment
+from reviews.models import Review
+
+
+RATINGS = range(1, 6)
+RATING_FIELDS = [f"rating_{rating}" for rating in RATINGS]
+
+STAT_FIELDS = [
+    "enrollment_count",
+    "completed_count",
+    "review_count",
+    "rating_sum",
+    "lesson_count",
+    "assignment_count",
+    *RATING_FIELDS,
+]
+
+
+def _rating_prior():
+    return (
+        getattr(settings, "RATING_PRIOR_MEAN", 3.0),
+        getattr(settings, "RATING_PRIOR_WEIGHT", 10),
+    )
+
+
+def bayesian_score_expression(review_delta=0, rating_delta=0):
+    """
+    (C * m + rating_sum) / (C + review_count): the mean rating pulled towards
+    the prior mean m by C virtual reviews, so a few ratings cannot outrank
+    many. Courses without reviews score 0. The deltas let it be computed from
+    the pre-UPDATE counters.
+    """
+    mean, weight = _rating_prior()
+    return Case(
+        When(
+            GreaterThan(F("review_count") + review_delta, 0),
+            then=Cast(Value(weight * mean) + F("rating_sum") + rating_delta, FloatField())
+            / (Value(weight) + F("review_count") + review_delta),
+        ),
+        default=Value(0.0),
+    )
+
+
+def bayesian_score(review_count, rating_sum):
+    if not review_count:
+        return 0.0
+    mean, weight = _rating_prior()
+    return (weight * mean + rating_sum) / (weight + review_count)
+
+
+def apply_course_stats_delta(course_id, **deltas):
+    """
+    Adds the given deltas to the stats row of a course in a single UPDATE,
+    which also refreshes bayesian_score when the ratings changed. Missing rows
+    (e.g. a course that is being deleted) are left alone.
+    """
+    changes = {field: F(field) + value for field, value in deltas.items() if value}
+    if course_id is None or not changes:
+        return
+    if "review_count" in changes or "rating_sum" in changes:
+        changes["bayesian_score"] = bayesian_score_expression(
+            deltas.get("review_count", 0), deltas.get("rating_sum", 0)
+        )
+    CourseStats.objects.filter(course_id=course_id).update(**changes)
+
+
+def refresh_bayesian_scores(course_ids=None):
+    """
+    Recomputes bayesian_score in one UPDATE, e.g. after the prior changed.
+    """
+    stats = CourseStats.objects.all()
+    if course_ids is not None:
+        stats = stats.filter(course_id__in=course_ids)
+    return stats.update(bayesian_score=bayesian_score_expression())
+
+
+def compute_course_stats(course_ids=None):
+    """
+    Recomputes the counters from the source tables, one grouped query per table.
+    """
+    courses = Course.objects.all()
+    if course_ids is not None:
+        courses = courses.filter(course_id__in=course_ids)
+    stats = {
+        course_id: dict.fromkeys(STAT_FIELDS, 0)
+        for course_id in courses.values_list("course_id", flat=True)
+    }
+    if not stats:
+        return stats
+
+    enrollments = (
+        Enrollment.objects.filter(course_id__in=stats.keys())
+        .values("course_id")
+        .annotate(
+            enrollment_count=Count("enrollment_id"),
+            completed_count=Count("enrollment_id", filter=Q(final_grade__isnull=False)),
+        )
+    )
+    reviews = (
+        Review.objects.filter(enrollment__course_id__in=stats.keys())
+        .values(course_id=F("enrollment__course_id"))
+        .annotate(
+            review_count=Count("review_id"),
+            rating_sum=Sum("rating"),
+            **{
+                f"rating_{rating}": Count("review_id", filter=Q(rating=rating))
+                for rating in RATINGS
+            },
+        )
+    )
+    lessons = (
+        Lesson.objects.filter(course_id__in=stats.keys())
+        .values("course_id")
+        .annotate(lesson_count=Count("lesson_id"))
+    )
+    assignments = (
+        Assignment.objects.filter(lesson__course_id__in=stats.keys())
+        .values(course_id=F("lesson__course_id"))
+        .annotate(assignment_count=Count("assignment_id"))
+    )
+    for rows in (enrollments, reviews, lessons, assignments):
+        for row in rows:
+            course_id = row.pop("course_id")
+            stats[course_id].update({key: value or 0 for key, value in row.items()})
+    return stats
+
+
+def rebuild_course_stats(course_ids=None, dry_run=False):
+    """
+    Rebuilds the stats rows from scratch and returns the drift that was found as
+    a list of (course_id, field, stored, actual) tuples.
+    """
+    actual = compute_course_stats(course_ids)
+    stored = {
+        row["course_id"]: row
+        for row in CourseStats.objects.filter(course_id__in=actual.keys()).values(
+            "course_id", *STAT_FIELDS
+        )
+    }
+
+    drift = []
+    for course_id, values in actual.items():
+        current = stored.get(course_id, defaultdict(lambda: None))
+        for field in STAT_FIELDS:
+            if current[field] != values[field]:
+                drift.append((course_id, field, current[field], values[field]))
+
+    if not dry_run:
+        drifted = {course_id for course_id, *_ in drift}
+        CourseStats.objects.bulk_create(
+            [
+                CourseStats(course_id=course_id, **actual[course_id])
+                for course_id in drifted
+            ],
+            update_conflicts=True,
+            unique_fields=["course"],
+            update_fields=STAT_FIELDS,
+        )
+        refresh_bayesian_scores(course_ids)
+    return drift
@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from database_course.cache import versioned_key
+
+
+STRUCTURE_SQL = """
+SELECT json_build_object(
+    'course_id', c.course_id,
+    'title', c.title,
+    'lessons', COALESCE((
+        SELECT json_agg(json_build_object(
+            'lesson_id', l.lesson_id,
+            'lesson_order', l.lesson_order,
+            'title', l.title,
+            'video_url', l.video_url,
+            'duration_minutes', l.duration_minutes,
+            'assignments', COALESCE((
+                SELECT json_agg(json_build_object(
+                    'assignment_id', a.assignment_id,
+                    'title', a.title,
+                    'deadline', a.deadline,
+                    'max_score', a.max_score,
+                    'type_code', t.code
+                ) ORDER BY a.assignment_id)
+                FROM courses_assignment a
+                JOIN dictionaries_assignmenttype t ON t.type_id = a.type_id
+                WHERE a.lesson_id = l.lesson_id
+            ), '[]'::json)
+        ) ORDER BY l.lesson_order)
+        FROM courses_lesson l
+        WHERE l.course_id = c.course_id
+    ), '[]'::json)
+)::text
+FROM courses_course c
+WHERE c.course_id = %s
+"""
+
+
+def build_course_structure(course_id):
+    """
+    Renders course -> lessons[] -> assignments[] as JSON bytes in a single
+    statement. Returns None when the course does not exist.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(STRUCTURE_SQL, [course_id])
+        row = cursor.fetchone()
+    return row[0].encode() if row else None
+
+
+def get_course_structure(course_id):
+    """
+    Cached under the course's tag, so any change to the course, its lessons or
+    their assignments yields a fresh document.
+    """
+    key = versioned_key("course-structure", [f"course:{course_id}"], course_id)
+    document = cache.get(key)
+    if document is None:
+        document = build_course_structure(course_id)
+        if document is not None:
+            cache.set(key, document, getattr(settings, "RESPONSE_CACHE_TIMEOUT", 600))
+    return document
@@ -1,3 +1,63 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from accounts.models import Student, Teacher, User
+from courses.models import Course, CourseStats
+from dictionaries.models import Category, CourseLevel, Language, Role, UserStatus
+
+
+def create_user(email, role):
+    return User.objects.create(
+        email=email,
+        password_hash="!",
+        first_name="Ada",
+        last_name="Lovelace",
+        role=Role.objects.get_or_create(code=role, defaults={"name": role.title()})[0],
+        status=UserStatus.objects.get_or_create(code="active", defaults={"name": "Active"})[0],
+    )
+
+
+def create_teacher(email="teacher@example.com"):
+    return Teacher.objects.create(user=create_user(email, "teacher"))
+
+
+def create_student(email="student@example.com"):
+    return Student.objects.create(user=create_user(email, "student"))
+
+
+def create_course(teacher, **fields):
+    values = {
+        "title": "Intro to SQL",
+        "level": CourseLevel.objects.get_or_create(code="beginner", defaults={"name": "Beginner"})[0],
+        "language": Language.objects.get_or_create(code="en", defaults={"name": "English"})[0],
+        "category": Category.objects.get_or_create(name="Databases")[0],
+        "price": 10,
+        "teacher": teacher,
+    }
+    values.update(fields)
+    return Course.objects.create(**values)
+
+
+class TopCourseCursorTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        teacher = create_teacher()
+        # Two courses share a score so the primary key has to break the tie.
+        self.ranked = []
+        for score in (4.5, 4.0, 4.0, 3.0):
+            course = create_course(teacher)
+            CourseStats.objects.update_or_create(
+                course=course, defaults={"review_count": 1, "bayesian_score": score}
+            )
+            self.ranked.append(course.course_id)
+
+    def test_next_link_follows_the_ranking(self):
+        response = self.client.get("/api/courses/top/", {"pagination": "cursor", "limit": 3})
+        self.assertEqual(response.status_code, 200)
+        seen = [row["course_id"] for row in response.data["results"]]
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, 200)
+        seen += [row["course_id"] for row in response.data["results"]]
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(seen, self.ranked)
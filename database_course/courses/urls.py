@@ -16,25 +16,48 @@ urlpatterns = [
         views.CourseDeleteView.as_view(),
         name="course-delete",
     ),
+    path(
+        "<int:course_id>/clone/",
+        views.CourseCloneView.as_view(),
+        name="course-clone",
+    ),
     path("list/", views.CourseListView.as_view(), name="course-list"),
+    path("export/", views.CourseExportView.as_view(), name="course-export"),
+    path("top/", views.TopCourseListView.as_view(), name="course-top"),
     path(
         "<int:course_id>/structure/",
         views.CourseStructureView.as_view(),
         name="course-structure",
     ),
+    path(
+        "<int:course_id>/structure/tree/",
+        views.CourseStructureTreeView.as_view(),
+        name="course-structure-tree",
+    ),
     path(
         "teachers/<int:teacher_id>/courses/",
         views.CourseTeacherListView.as_view(),
         name="teacher-courses",
     ),
     path("<int:course_id>/lessons/", views.LessonListView.as_view(), name="lesson-list"),
+    path(
+        "<int:course_id>/lessons/reorder/",
+        views.LessonReorderView.as_view(),
+        name="lesson-reorder",
+    ),
     path("lessons/", views.LessonCreateView.as_view(), name="lesson-create"),
+    path("lessons/bulk/", views.LessonBulkCreateView.as_view(), name="lesson-bulk-create"),
     path("lessons/<int:lesson_id>/", views.LessonDetailView.as_view(), name="lesson-detail"),
     path(
         "lessons/<int:lesson_id>/update/",
         views.LessonUpdateView.as_view(),
         name="lesson-update",
     ),
+    path(
+        "lessons/<int:lesson_id>/move/",
+        views.LessonMoveView.as_view(),
+        name="lesson-move",
+    ),
     path(
         "lessons/<int:lesson_id>/delete/",
         views.LessonDeleteView.as_view(),
@@ -46,6 +69,11 @@ urlpatterns = [
         name="assignment-list",
     ),
     path("assignments/", views.AssignmentCreateView.as_view(), name="assignment-create"),
+    path(
+        "assignments/bulk/",
+        views.AssignmentBulkCreateView.as_view(),
+        name="assignment-bulk-create",
+    ),
     path("assignments/<int:assignment_id>/", views.AssignmentDetailView.as_view(), name="assignment-detail"),
     path(
         "assignments/<int:assignment_id>/update/",
@@ -1,15 +1,23 @@
-from django.db.models import F, Count, Avg, Sum
-from rest_framework import generics
+from django.db.models import F
+from django.http import Http404, HttpResponse
+from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from accounts.models import Student
-from courses.models import Assignment, Course, Lesson
+from analytics.snapshots import get_course_analytics, refresh_course_analytics
+from database_course.cache import CachedResponseMixin
+from database_course.conditional import ConditionalRetrieveMixin
+from database_course.export import ExportView
+from database_course.pagination import KeysetOrLimitOffsetPagination
+from jobs.mixins import ScheduledDestroyMixin
+from jobs.models import DeletionJob
+from courses.models import Assignment, Course, CourseStats, Lesson
 from courses.serializers import (
     AssignmentCreateSerializer,
     AssignmentDetailSerializer,
     AssignmentListSerializer,
     CourseAnalyticsSerializer,
+    CourseCloneSerializer,
     CourseCreateSerializer,
     CourseDetailSerializer,
     CourseListSerializer,
@@ -18,7 +26,30 @@ from courses.serializers import (
     LessonCreateSerializer,
     LessonDetailSerializer,
     LessonListSerializer,
+    LessonMoveSerializer,
+    LessonReorderSerializer,
+    TopCourseSerializer,
 )
+from courses.bulk import bulk_create_assignments, bulk_create_lessons
+from courses.cloning import clone_course
+from courses.facets import get_course_facets
+from courses.ordering import move_lesson, reorder_lessons
+from courses.search import filter_by_teacher_name, search_courses
+from courses.structure import get_course_structure
+
+
+def bulk_create_response(results):
+    failed = sum(1 for result in results if "errors" in result)
+    if not failed:
+        response_status = status.HTTP_201_CREATED
+    elif failed == len(results):
+        response_status = status.HTTP_400_BAD_REQUEST
+    else:
+        response_status = status.HTTP_207_MULTI_STATUS
+    return Response(
+        {"created": len(results) - failed, "failed": failed, "results": results},
+        status=response_status,
+    )
 
 
 class CourseCreateView(generics.CreateAPIView):
@@ -32,31 +63,71 @@ class CourseUpdateView(generics.UpdateAPIView):
     lookup_field = "course_id"
 
 
-class CourseDeleteView(generics.DestroyAPIView):
+class CourseDeleteView(ScheduledDestroyMixin, generics.DestroyAPIView):
     queryset = Course.objects.all()
     lookup_field = "course_id"
+    deletion_target = DeletionJob.TARGET_COURSE
+
+
+class CourseCloneView(generics.GenericAPIView):
+    """
+    Copies a course with its lessons and assignments, optionally for another
+    teacher and with deadlines shifted by deadline_shift.
+    """
+
+    serializer_class = CourseCloneSerializer
 
+    def post(self, request, course_id, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        clone = clone_course(course_id, **serializer.validated_data)
+        return Response(CourseDetailSerializer(clone).data, status=status.HTTP_201_CREATED)
 
-class CourseDetailView(generics.RetrieveAPIView):
-    queryset = Course.objects.select_related(
+
+class CourseDetailView(
+    CachedResponseMixin, ConditionalRetrieveMixin, generics.RetrieveAPIView
+):
+    queryset = Course.objects.filter(pending_delete=False).select_related(
         "level", "language", "category", "teacher__user"
     )
     serializer_class = CourseDetailSerializer
     lookup_field = "course_id"
+    etag_related_fields = (
+        "level__code",
+        "level__name",
+        "language__code",
+        "language__name",
+        "category__name",
+        "teacher__user__first_name",
+        "teacher__user__last_name",
+    )
 
+    def get_cache_tags(self):
+        return [f"course:{self.kwargs['course_id']}", "dictionaries"]
 
-class CourseListView(generics.ListAPIView):
+    def get_object(self):
+        course = super().get_object()
+        self.add_cache_tags(f"teacher:{course.teacher_id}")
+        return course
+
+
+class CourseListView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = CourseListSerializer
+    pagination_class = KeysetOrLimitOffsetPagination
+
+    def get_cache_tags(self):
+        return ["courses"]
 
     def get_queryset(self):
-        queryset = Course.objects.select_related(
+        queryset = Course.objects.filter(pending_delete=False).select_related(
             "level", "language", "category", "teacher__user"
-        ).order_by("-created_at")
+        ).order_by("-created_at", "-course_id")
         category_id = self.request.query_params.get("category_id")
         level_id = self.request.query_params.get("level_id")
         language_id = self.request.query_params.get("language_id")
         teacher_id = self.request.query_params.get("teacher_id")
         teacher_full_name = self.request.query_params.get("teacher_full_name")
+        search = self.request.query_params.get("q")
 
         if category_id:
             queryset = queryset.filter(category_id=category_id)
@@ -67,20 +138,73 @@ class CourseListView(generics.ListAPIView):
         if teacher_id:
             queryset = queryset.filter(teacher_id=teacher_id)
         if teacher_full_name:
-            queryset = queryset.filter(
-                teacher__user__first_name__icontains=teacher_full_name
-            ) | queryset.filter(
-                teacher__user__last_name__icontains=teacher_full_name
-            )
+            queryset = filter_by_teacher_name(queryset, teacher_full_name)
+        if search:
+            queryset = search_courses(queryset, search)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("facets") in {"1", "true"}:
+            return Response(get_course_facets(self.get_queryset(), request.query_params))
+        return super().list(request, *args, **kwargs)
+
+
+class CourseExportView(ExportView):
+    export_name = "courses"
+    export_fields = (
+        "course_id",
+        "title",
+        "description",
+        "price",
+        "duration_hours",
+        "created_at",
+        "updated_at",
+        "teacher_id",
+        "category_id",
+        "level_id",
+        "language_id",
+    )
+    export_expressions = {
+        "category_name": F("category__name"),
+        "level_code": F("level__code"),
+        "language_code": F("language__code"),
+    }
+
+    def get_export_queryset(self):
+        return Course.objects.filter(pending_delete=False).order_by("course_id")
+
+
+class TopCourseListView(generics.ListAPIView):
+    """
+    Reviewed courses ranked by their precomputed Bayesian-average rating, so a
+    single 5-star review does not outrank hundreds of 4.8s. Reads the
+    (bayesian_score, course) index in order; ?category_id= narrows it.
+    """
+
+    serializer_class = TopCourseSerializer
+    pagination_class = KeysetOrLimitOffsetPagination
+
+    def get_queryset(self):
+        queryset = CourseStats.objects.filter(
+            review_count__gt=0, course__pending_delete=False
+        ).select_related("course__category").order_by("-bayesian_score", "course_id")
+        category_id = self.request.query_params.get("category_id")
+        if category_id:
+            queryset = queryset.filter(course__category_id=category_id)
         return queryset
 
 
-class CourseTeacherListView(generics.ListAPIView):
+class CourseTeacherListView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = CourseTeacherListSerializer
 
+    def get_cache_tags(self):
+        return [f"teacher:{self.kwargs['teacher_id']}"]
+
     def get_queryset(self):
         teacher_id = self.kwargs["teacher_id"]
-        return Course.objects.filter(teacher_id=teacher_id).order_by("-created_at")
+        return Course.objects.filter(teacher_id=teacher_id, pending_delete=False).order_by(
+            "-created_at"
+        )
 
 
 class LessonCreateView(generics.CreateAPIView):
@@ -88,6 +212,15 @@ class LessonCreateView(generics.CreateAPIView):
     serializer_class = LessonCreateSerializer
 
 
+class LessonBulkCreateView(APIView):
+    """
+    Creates an array of lessons in one transaction and reports every item.
+    """
+
+    def post(self, request, *args, **kwargs):
+        return bulk_create_response(bulk_create_lessons(request.data))
+
+
 class LessonUpdateView(generics.UpdateAPIView):
     queryset = Lesson.objects.all()
     serializer_class = LessonCreateSerializer
@@ -99,25 +232,72 @@ class LessonDeleteView(generics.DestroyAPIView):
     lookup_field = "lesson_id"
 
 
-class LessonListView(generics.ListAPIView):
+class LessonListView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = LessonListSerializer
 
+    def get_cache_tags(self):
+        return [f"course:{self.kwargs['course_id']}"]
+
     def get_queryset(self):
         course_id = self.kwargs["course_id"]
         return Lesson.objects.filter(course_id=course_id).order_by("lesson_order")
 
 
-class LessonDetailView(generics.RetrieveAPIView):
+class LessonReorderView(generics.GenericAPIView):
+    """
+    Applies a complete new lesson order for a course in a single statement.
+    """
+
+    serializer_class = LessonReorderSerializer
+
+    def post(self, request, course_id, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reorder_lessons(course_id, serializer.validated_data["lesson_ids"])
+        lessons = Lesson.objects.filter(course_id=course_id).order_by("lesson_order")
+        return Response(LessonListSerializer(lessons, many=True).data)
+
+
+class LessonMoveView(generics.GenericAPIView):
+    """
+    Moves one lesson after another (or first), normally touching only its row.
+    """
+
+    serializer_class = LessonMoveSerializer
+
+    def post(self, request, lesson_id, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        course_id = move_lesson(lesson_id, serializer.validated_data["after_lesson_id"])
+        lessons = Lesson.objects.filter(course_id=course_id).order_by("lesson_order")
+        return Response(LessonListSerializer(lessons, many=True).data)
+
+
+class LessonDetailView(
+    CachedResponseMixin, ConditionalRetrieveMixin, generics.RetrieveAPIView
+):
     queryset = Lesson.objects.all()
     serializer_class = LessonDetailSerializer
     lookup_field = "lesson_id"
 
+    def get_cache_tags(self):
+        return [f"lesson:{self.kwargs['lesson_id']}"]
+
 
 class AssignmentCreateView(generics.CreateAPIView):
     queryset = Assignment.objects.all()
     serializer_class = AssignmentCreateSerializer
 
 
+class AssignmentBulkCreateView(APIView):
+    """
+    Creates an array of assignments in one transaction and reports every item.
+    """
+
+    def post(self, request, *args, **kwargs):
+        return bulk_create_response(bulk_create_assignments(request.data))
+
+
 class AssignmentUpdateView(generics.UpdateAPIView):
     queryset = Assignment.objects.all()
     serializer_class = AssignmentCreateSerializer
@@ -129,9 +309,12 @@ class AssignmentDeleteView(generics.DestroyAPIView):
     lookup_field = "assignment_id"
 
 
-class AssignmentListView(generics.ListAPIView):
+class AssignmentListView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = AssignmentListSerializer
 
+    def get_cache_tags(self):
+        return [f"lesson:{self.kwargs['lesson_id']}", "dictionaries"]
+
     def get_queryset(self):
         lesson_id = self.kwargs["lesson_id"]
         return Assignment.objects.select_related("type").filter(lesson_id=lesson_id).order_by(
@@ -139,15 +322,24 @@ class AssignmentListView(generics.ListAPIView):
         )
 
 
-class AssignmentDetailView(generics.RetrieveAPIView):
+class AssignmentDetailView(
+    CachedResponseMixin, ConditionalRetrieveMixin, generics.RetrieveAPIView
+):
     queryset = Assignment.objects.select_related("type")
     serializer_class = AssignmentDetailSerializer
     lookup_field = "assignment_id"
+    etag_related_fields = ("type__code", "type__name")
 
+    def get_cache_tags(self):
+        return [f"assignment:{self.kwargs['assignment_id']}", "dictionaries"]
 
-class CourseStructureView(generics.ListAPIView):
+
+class CourseStructureView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = CourseStructureRowSerializer
 
+    def get_cache_tags(self):
+        return [f"course:{self.kwargs['course_id']}", "dictionaries"]
+
     def get_queryset(self):
         course_id = self.kwargs["course_id"]
         return (
@@ -178,144 +370,35 @@ class CourseStructureView(generics.ListAPIView):
         )
 
 
+class CourseStructureTreeView(APIView):
+    """
+    Nested course -> lessons -> assignments document, rendered by the database
+    and cached per course until one of its lessons or assignments changes.
+    """
+
+    def get(self, request, course_id, *args, **kwargs):
+        document = get_course_structure(course_id)
+        if document is None:
+            raise Http404("Course not found")
+        return HttpResponse(document, content_type="application/json")
+
+
 class CourseAnalyticsView(APIView):
     """
     View to provide analytics and aggregations for the course platform.
+    Serves the precomputed snapshot; POST forces a rebuild.
     """
 
     def get(self, request, *args, **kwargs):
-        from django.db.models import F, Count, Avg, Sum, Case, When, IntegerField
-        from learning.models import Enrollment
-        from submissions.models import Submission
-        from reviews.models import Review
-
-        # Basic analytics
-        total_courses = Course.objects.count()
-        total_students = Student.objects.count()
-        avg_price = Course.objects.aggregate(avg_price=Avg('price'))['avg_price'] or 0
-        total_assignments = Assignment.objects.count()
-
-        # Enhanced analytics
-        # 1. Top performing teachers by average course ratings
-        top_teachers = []
-        try:
-            top_teachers = Course.objects.select_related('teacher__user').values(
-                'teacher_id'
-            ).annotate(
-                teacher_user_first_name=F('teacher__user__first_name'),
-                teacher_user_last_name=F('teacher__user__last_name'),
-                avg_rating=Avg('enrollments__review__rating'),
-                course_count=Count('course_id')
-            ).filter(
-                avg_rating__isnull=False
-            ).order_by('-avg_rating')[:5]
-        except Exception as e:
-            print(f"Error in top_teachers query: {e}")
-
-        # 2. Most popular courses by enrollment count
-        popular_courses = []
-        try:
-            popular_courses = Course.objects.select_related('teacher__user', 'category').values(
-                'course_id',
-                'title'
-            ).annotate(
-                teacher_user_first_name=F('teacher__user__first_name'),
-                teacher_user_last_name=F('teacher__user__last_name'),
-                category_name=F('category__name'),
-                enrollment_count=Count('enrollments')
-            ).order_by('-enrollment_count')[:5]
-        except Exception as e:
-            print(f"Error in popular_courses query: {e}")
-
-        # 3. Student success rates by course completion
-        course_completion_stats = []
-        try:
-            course_completion_stats = Enrollment.objects.values(
-                'course_id'
-            ).annotate(
-                course_title=F('course__title'),
-                total_enrollments=Count('enrollment_id'),
-                completed_count=Count(Case(
-                    When(final_grade__isnull=False, then=1),
-                    output_field=IntegerField()
-                )),
-                completion_rate=Avg(Case(
-                    When(final_grade__isnull=False, then=100),
-                    default=0,
-                    output_field=IntegerField()
-                ))
-            ).order_by('-completion_rate')[:5]
-        except Exception as e:
-            print(f"Error in course_completion_stats query: {e}")
-
-        # 4. Assignment completion statistics
-        assignment_stats = []
-        try:
-            assignment_stats = Assignment.objects.values(
-                'lesson__course_id'
-            ).annotate(
-                course_title=F('lesson__course__title'),
-                total_assignments=Count('assignment_id'),
-                submitted_count=Count('submissions'),
-                submission_rate=Avg(Case(
-                    When(submissions__isnull=False, then=100),
-                    default=0,
-                    output_field=IntegerField()
-                ))
-            ).order_by('-submission_rate')
-        except Exception as e:
-            print(f"Error in assignment_stats query: {e}")
-
-        # 5. Revenue analytics by course category
-        revenue_by_category = []
-        try:
-            revenue_by_category = Course.objects.values().annotate(
-                category_name=F('category__name'),
-                total_revenue=Sum('price'),
-                course_count=Count('course_id')
-            ).order_by('-total_revenue')
-        except Exception as e:
-            print(f"Error in revenue_by_category query: {e}")
-
-        # 6. Course completion rates
-        overall_completion_rate = Enrollment.objects.aggregate(
-            completion_percentage=Avg(Case(
-                When(final_grade__isnull=False, then=100),
-                default=0,
-                output_field=IntegerField()
-            ))
-        )['completion_percentage'] or 0
-
-        # 7. Teacher activity metrics
-        teacher_activity = []
-        try:
-            teacher_activity = Course.objects.select_related('teacher__user').values(
-                'teacher_id'
-            ).annotate(
-                teacher_user_first_name=F('teacher__user__first_name'),
-                teacher_user_last_name=F('teacher__user__last_name'),
-                course_count=Count('course_id'),
-                total_students=Count('enrollments__student_id', distinct=True),
-                avg_course_rating=Avg('enrollments__review__rating')
-            ).order_by('-course_count')
-        except Exception as e:
-            print(f"Error in teacher_activity query: {e}")
-
-        data = {
-            'total_courses': total_courses,
-            'total_students': total_students,
-            'average_course_price': round(float(avg_price), 2),
-            'total_assignments': total_assignments,
-
-            # Enhanced analytics
-            'top_teachers': list(top_teachers),
-            'popular_courses': list(popular_courses),
-            'course_completion_stats': list(course_completion_stats),
-            'assignment_stats': list(assignment_stats),
-            'revenue_by_category': list(revenue_by_category),
-            'overall_completion_rate': round(float(overall_completion_rate), 2),
-            'teacher_activity': list(teacher_activity),
-        }
-
-        serializer = CourseAnalyticsSerializer(data)
+        snapshot = get_course_analytics()
+        serializer = CourseAnalyticsSerializer(
+            {**snapshot.payload, "generated_at": snapshot.generated_at}
+        )
+        return Response(serializer.data)
+
+    def post(self, request, *args, **kwargs):
+        snapshot = refresh_course_analytics()
+        serializer = CourseAnalyticsSerializer(
+            {**snapshot.payload, "generated_at": snapshot.generated_at}
+        )
         return Response(serializer.data)
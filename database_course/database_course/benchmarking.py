@@ -0,0 +1,36 @@
+import re
+import time
+from contextlib import contextmanager
+
+from django.db import transaction
+
+
+@contextmanager
+def rolled_back():
+    """
+    Runs the block in a transaction that is always rolled back, so synthetic
+    benchmark data never reaches the real tables.
+    """
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+@contextmanager
+def timed(stdout, label):
+    started = time.perf_counter()
+    yield
+    stdout.write(f"{label}: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+
+def explain(queryset):
+    """
+    Returns (execution_ms, plan) from EXPLAIN ANALYZE of the queryset.
+    """
+    plan = queryset.explain(analyze=True, buffers=True)
+    match = re.search(r"Execution Time: ([\d.]+) ms", plan)
+    return (float(match.group(1)) if match else None), plan
+
+
+def seq_scans(plan, table):
+    return f"Seq Scan on {table} " in plan
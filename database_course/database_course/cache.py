@@ -0,0 +1,182 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+
+
+TAG_PREFIX = "cache-tag:"
+HITS_KEY = "response-cache:hits"
+MISSES_KEY = "response-cache:misses"
+
+
+def _incr(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def cache_is_shared():
+    """
+    Whether the default cache is seen by every process. Per-process backends
+    cannot carry tag bumps or other marks from one worker to the others.
+    """
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def tag_versions(tags):
+    """
+    Returns the current version of every tag. Cache keys embed these versions,
+    so bumping a tag makes every entry that depends on it unreachable.
+    """
+    keys = {tag: f"{TAG_PREFIX}{tag}" for tag in tags}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for tag, key in keys.items():
+        if key not in found:
+            cache.add(key, 1, None)
+            found[key] = cache.get(key, 1)
+        versions[tag] = found[key]
+    return versions
+
+
+def versioned_key(prefix, tags, *parts):
+    versions = tag_versions(tags)
+    stamp = ",".join(f"{tag}={versions[tag]}" for tag in sorted(versions))
+    digest = hashlib.md5("|".join([stamp, *map(str, parts)]).encode()).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def invalidate_tags(*tags):
+    """
+    Bumps the given tags once the current transaction commits, so a concurrent
+    reader cannot repopulate the cache with rows that are about to change.
+    """
+    tags = {tag for tag in tags if tag}
+    if not tags:
+        return
+
+    def bump():
+        for tag in tags:
+            _incr(f"{TAG_PREFIX}{tag}")
+
+    transaction.on_commit(bump)
+
+
+def get_cache_stats():
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else 0.0,
+    }
+
+
+class CachedResponseMixin:
+    """
+    Caches successful GET responses of a DRF view. The key is derived from the
+    path, the sorted query parameters, the Accept header and the versions of
+    the tags returned by get_cache_tags(); writes invalidate by bumping tags.
+    Tags only known once the rows are read, such as the teacher of a course,
+    are passed to add_cache_tags() and checked on every hit.
+
+    Only use it on views whose response does not depend on the current user.
+    Tag bumps reach other processes only through a shared cache backend (see
+    cache_is_shared()), as the default one is; with a per-process backend each
+    worker may serve its own stale copy until RESPONSE_CACHE_TIMEOUT.
+    """
+
+    cache_timeout = None
+    cached_headers = ("ETag", "Last-Modified")
+
+    def get_cache_tags(self):
+        return []
+
+    def get_response_cache_key(self, request):
+        query = sorted(request.GET.lists())
+        return versioned_key(
+            "response-cache",
+            self.get_cache_tags(),
+            request.path,
+            query,
+            request.META.get("HTTP_ACCEPT", ""),
+        )
+
+    def add_cache_tags(self, *tags):
+        """
+        Tags of rows the response renders. Their versions are stored with the
+        entry, which stops being served once any of them moves.
+        """
+        self.rendered_cache_tags.update(tags)
+
+    def initial(self, request, *args, **kwargs):
+        # Authentication, permissions and throttling apply to cache hits too.
+        super().initial(request, *args, **kwargs)
+        self.rendered_cache_tags = set()
+        if request.method != "GET":
+            return
+        self.response_cache_key = self.get_response_cache_key(request)
+        cached = cache.get(self.response_cache_key)
+        tags = cached and cached.get("tags")
+        if tags and tag_versions(tags) != tags:
+            cached = None
+        if cached is None:
+            _incr(MISSES_KEY)
+            return
+        _incr(HITS_KEY)
+        # Shadows the handler for this request only, as View.setup() does
+        # with head, so views that define their own get() are cached too.
+        self.get = lambda *args, **kwargs: self.build_cached_response(request, cached)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "response_cache_key", None)
+        if key is None or response.has_header("X-Cache"):
+            return response
+        if response.status_code == 200 and not response.streaming:
+            if hasattr(response, "render"):
+                response.render()
+            cache.set(
+                key,
+                {
+                    "content": response.content,
+                    "content_type": response["Content-Type"],
+                    "headers": {
+                        name: response[name]
+                        for name in self.cached_headers
+                        if response.has_header(name)
+                    },
+                    # Read after the rows, so a write committing in between
+                    # can leave this entry stale until it expires.
+                    "tags": tag_versions(self.rendered_cache_tags),
+                },
+                self.cache_timeout
+                if self.cache_timeout is not None
+                else getattr(settings, "RESPONSE_CACHE_TIMEOUT", 600),
+            )
+        response["X-Cache"] = "MISS"
+        return response
+
+    def build_cached_response(self, request, cached):
+        headers = cached["headers"]
+        last_modified = parse_http_date_safe(headers.get("Last-Modified", ""))
+        response = None
+        if "ETag" in headers or last_modified:
+            response = get_conditional_response(
+                request, etag=headers.get("ETag"), last_modified=last_modified
+            )
+        if response is None:
+            response = HttpResponse(cached["content"], content_type=cached["content_type"])
+        for name, value in headers.items():
+            response[name] = value
+        response["X-Cache"] = "HIT"
+        return response
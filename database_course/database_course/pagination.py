@@ -0,0 +1,202 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetOrLimitOffsetPagination(LimitOffsetPagination):
+    """
+    LimitOffsetPagination that switches to keyset (cursor) pagination when the
+    request carries ``?pagination=cursor`` or a ``cursor`` returned earlier.
+
+    The keyset is the queryset's own ``order_by()`` with the primary key
+    appended as a tiebreaker, so pages are stable under concurrent inserts,
+    and no COUNT(*) is issued in cursor mode.
+    """
+
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == "cursor"
+        )
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.ordering = self.get_keyset_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request, queryset)
+        if position is not None:
+            queryset = queryset.filter(self.keyset_filter(position))
+
+        rows = list(queryset[:self.limit + 1])
+        self.has_next = len(rows) > self.limit
+        rows = rows[:self.limit]
+        self.last_position = (
+            [self.get_value(rows[-1], field) for field in self.ordering] if rows else None
+        )
+        return rows
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_cursor_link(),
+            'results': data,
+        })
+
+    def get_keyset_ordering(self, queryset):
+        ordering = [
+            field for field in queryset.query.order_by if isinstance(field, str)
+        ]
+        if not ordering or len(ordering) != len(queryset.query.order_by):
+            raise ImproperlyConfigured(
+                "Keyset pagination needs a queryset ordered by plain field names."
+            )
+        # The column name, so a one-to-one primary key such as
+        # CourseStats.course is compared and encoded as its id, not the object.
+        pk = queryset.model._meta.pk
+        pk_name = pk.attname
+        ordering = [
+            ("-" if field.startswith("-") else "") + pk_name
+            if field.lstrip("-") in ("pk", pk.name, pk.attname) else field
+            for field in ordering
+        ]
+        if ordering[-1].lstrip("-") != pk_name:
+            descending = ordering[-1].startswith("-")
+            ordering.append(f"-{pk_name}" if descending else pk_name)
+        return ordering
+
+    def keyset_filter(self, position):
+        """
+        Builds (f1, f2, ...) > (v1, v2, ...) honouring each field's direction:
+        f1 > v1 OR (f1 = v1 AND f2 > v2) OR ...
+        """
+        condition = Q()
+        for index in reversed(range(len(self.ordering))):
+            field = self.ordering[index].lstrip("-")
+            lookup = "lt" if self.ordering[index].startswith("-") else "gt"
+            step = Q(**{f"{field}__{lookup}": position[index]})
+            if index < len(self.ordering) - 1:
+                step |= Q(**{field: position[index]}) & condition
+            condition = step
+        return condition
+
+    def get_value(self, obj, field):
+        return getattr(obj, field.lstrip("-"))
+
+    def get_field(self, queryset, name):
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return queryset.model._meta.get_field(name)
+
+    def decode_cursor(self, request, queryset):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            if len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self.get_field(queryset, field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, values):
+        # str() keeps full microsecond precision for datetimes, unlike
+        # DjangoJSONEncoder, and to_python() parses it back.
+        payload = json.dumps(values, default=str, separators=(",", ":"))
+        return urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+
+    def get_next_cursor_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        url = remove_query_param(url, self.mode_query_param)
+        url = remove_query_param(url, self.offset_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.last_position)
+        )
+
+
+def estimated_count(queryset, exact_limit):
+    """
+    Exact count when the queryset has at most ``exact_limit`` rows (counted
+    with a LIMIT, so never more than that many are read), otherwise the
+    planner's row estimate from EXPLAIN, which reads no rows at all.
+    """
+    queryset = queryset.order_by()
+    exact = queryset[:exact_limit + 1].count()
+    if exact <= exact_limit:
+        return exact, False
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return max(int(plan[0]["Plan"]["Plan Rows"]), exact), True
+
+
+class EstimatedCountPagination(KeysetOrLimitOffsetPagination):
+    """
+    Adds ``?count=estimate`` to limit/offset mode for large admin tables:
+    ``count`` comes from the planner instead of COUNT(*) and the response
+    says so with ``count_estimated``. The count is raised to cover the rows
+    actually seen and is exact on the last page, so next links stay right.
+    """
+
+    count_query_param = "count"
+    exact_count_limit = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.estimated = False
+        if (
+            request.query_params.get(self.count_query_param) != "estimate"
+            or self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == "cursor"
+        ):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.keyset = False
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+        self.offset = self.get_offset(request)
+
+        rows = list(queryset[self.offset:self.offset + self.limit + 1])
+        has_next = len(rows) > self.limit
+        rows = rows[:self.limit]
+        seen = self.offset + len(rows)
+        if has_next:
+            count, self.estimated = estimated_count(queryset, self.exact_count_limit)
+            self.count = max(count, seen + 1)
+        else:
+            self.count = seen
+        return rows
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if not self.keyset:
+            response.data["count_estimated"] = self.estimated
+        return response
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import tempfile
+from datetime import timedelta
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -37,6 +39,7 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'rest_framework',
     'drf_spectacular',
@@ -54,12 +57,80 @@ INSTALLED_APPS = [
     'learning',       
     'submissions',    
     'reviews',       
+    'analytics',
+    'jobs',
+    'recommendations',
 ]
 
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.LimitOffsetPagination',
     'PAGE_SIZE': 20,
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'accounts.authentication.ClaimsJWTAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
+    ],
+}
+
+# last_login touches are buffered per process and written in one statement at
+# least this often (seconds), or as soon as this many users are pending.
+LAST_LOGIN_FLUSH_INTERVAL = 5
+LAST_LOGIN_MAX_PENDING = 5000
+
+SIMPLE_JWT = {
+    'USER_ID_FIELD': 'user_id',
+    'USER_ID_CLAIM': 'user_id',
+    # Also how long a blocked user's revocation mark is kept in the cache.
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
+}
+
+# Seconds a precomputed analytics snapshot is served before it is rebuilt.
+ANALYTICS_SNAPSHOT_MAX_AGE = 300
+
+# Bayesian average used to rank courses: ratings are pulled towards
+# RATING_PRIOR_MEAN by RATING_PRIOR_WEIGHT virtual reviews. After changing
+# either, run rebuild_course_stats to recompute the stored scores.
+RATING_PRIOR_MEAN = 3.0
+RATING_PRIOR_WEIGHT = 10
+
+# Seconds before a request for revenue slices triggers a background cube rebuild.
+REVENUE_CUBE_MAX_AGE = 900
+
+# Seconds facet counts for one filter combination stay cached.
+COURSE_FACETS_CACHE_TIMEOUT = 300
+
+# Rows fetched per server-side cursor round trip and per streamed chunk in exports.
+EXPORT_CHUNK_SIZE = 2000
+
+# CSV rows validated and COPY-ed into the staging table at a time by user imports.
+IMPORT_CHUNK_SIZE = 5000
+
+# Neighbours stored per course by refresh_recommendations.
+RECOMMENDATIONS_TOP_K = 10
+
+# Hashed buckets per content vector (float32) and neighbours served by /similar/.
+CONTENT_VECTOR_DIMENSIONS = 512
+CONTENT_SIMILAR_TOP_K = 10
+
+# Root rows per transaction when a deletion job empties a table.
+DELETION_BATCH_SIZE = 500
+
+# Seconds a cached GET response lives; tag invalidation usually retires it earlier.
+RESPONSE_CACHE_TIMEOUT = 600
+
+# A directory in the system temp dir, shared by every worker on the host:
+# response-cache invalidation and JWT revocation marks have to reach every
+# process. Across several hosts point BACKEND at Redis or Memcached instead.
+# A per-process backend (locmem) works too, but then JWT auth falls back to a
+# status query per request.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': Path(tempfile.gettempdir()) / 'database-course-cache',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
 }
 
 SPECTACULAR_SETTINGS = {
@@ -18,6 +18,8 @@ from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from database_course.views import CacheStatsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
@@ -25,7 +27,11 @@ urlpatterns = [
     path('api/dictionaries/', include('dictionaries.urls')),
     path('api/accounts/', include('accounts.urls')),
     path('api/courses/', include('courses.urls')),
+    path('api/courses/', include('recommendations.urls')),
+    path('api/analytics/', include('analytics.urls')),
     path('api/learning/', include('learning.urls')),
     path('api/submissions/', include('submissions.urls')),
     path('api/reviews/', include('reviews.urls')),
+    path('api/jobs/', include('jobs.urls')),
+    path('api/cache/stats/', CacheStatsView.as_view(), name='cache-stats'),
 ]
@@ -0,0 +1,18 @@
+from django.core.cache import cache
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from database_course.cache import HITS_KEY, MISSES_KEY, get_cache_stats
+
+
+class CacheStatsView(APIView):
+    """
+    Hit/miss counters of the response cache; DELETE resets them.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_cache_stats())
+
+    def delete(self, request, *args, **kwargs):
+        cache.delete_many([HITS_KEY, MISSES_KEY])
+        return Response(get_cache_stats())
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class DictionariesConfig(AppConfig):
     name = 'dictionaries'
+
+    def ready(self):
+        from dictionaries import signals  # noqa: F401
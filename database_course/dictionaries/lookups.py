@@ -0,0 +1,16 @@
+from django.core.cache import cache
+
+from database_course.cache import versioned_key
+
+
+def dictionary_codes(model):
+    """
+    {pk: code} of a dictionary table, cached until the "dictionaries" tag
+    moves, so lists can render codes without joining the table.
+    """
+    key = versioned_key("dictionary-codes", ["dictionaries"], model._meta.label_lower)
+    codes = cache.get(key)
+    if codes is None:
+        codes = dict(model.objects.values_list("pk", "code"))
+        cache.set(key, codes)
+    return codes
@@ -0,0 +1,32 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from database_course.cache import invalidate_tags
+from dictionaries.models import (
+    AssignmentType,
+    Category,
+    CourseLevel,
+    EnrollmentStatus,
+    Language,
+    Role,
+    UserStatus,
+)
+
+
+@receiver(post_save, sender=UserStatus)
+@receiver(post_save, sender=Role)
+@receiver(post_save, sender=CourseLevel)
+@receiver(post_save, sender=AssignmentType)
+@receiver(post_save, sender=EnrollmentStatus)
+@receiver(post_save, sender=Language)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=UserStatus)
+@receiver(post_delete, sender=Role)
+@receiver(post_delete, sender=CourseLevel)
+@receiver(post_delete, sender=AssignmentType)
+@receiver(post_delete, sender=EnrollmentStatus)
+@receiver(post_delete, sender=Language)
+@receiver(post_delete, sender=Category)
+def invalidate_dictionary_cache(sender, raw=False, **kwargs):
+    if not raw:
+        invalidate_tags("dictionaries", "courses")
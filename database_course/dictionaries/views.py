@@ -1,5 +1,6 @@
 from rest_framework import generics
 
+from database_course.cache import CachedResponseMixin
 from dictionaries.models import (
     AssignmentType,
     Category,
@@ -18,31 +19,36 @@ from dictionaries.serializers import (
 )
 
 
-class UserStatusListView(generics.ListAPIView):
+class DictionaryListView(CachedResponseMixin, generics.ListAPIView):
+    def get_cache_tags(self):
+        return ["dictionaries"]
+
+
+class UserStatusListView(DictionaryListView):
     queryset = UserStatus.objects.all().order_by("status_id")
     serializer_class = UserStatusSerializer
 
 
-class CourseLevelListView(generics.ListAPIView):
+class CourseLevelListView(DictionaryListView):
     queryset = CourseLevel.objects.all().order_by("level_id")
     serializer_class = CourseLevelSerializer
 
 
-class AssignmentTypeListView(generics.ListAPIView):
+class AssignmentTypeListView(DictionaryListView):
     queryset = AssignmentType.objects.all().order_by("type_id")
     serializer_class = AssignmentTypeSerializer
 
 
-class EnrollmentStatusListView(generics.ListAPIView):
+class EnrollmentStatusListView(DictionaryListView):
     queryset = EnrollmentStatus.objects.all().order_by("status_id")
     serializer_class = EnrollmentStatusSerializer
 
 
-class LanguageListView(generics.ListAPIView):
+class LanguageListView(DictionaryListView):
     queryset = Language.objects.all().order_by("language_id")
     serializer_class = LanguageSerializer
 
 
-class CategoryListView(generics.ListAPIView):
+class CategoryListView(DictionaryListView):
     queryset = Category.objects.all().order_by("name")
     serializer_class = CategorySerializer
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from jobs.models import DeletionJob
+from jobs.runner import run_deletion_job
+
+
+class Command(BaseCommand):
+    help = (
+        "Runs deletion jobs that were interrupted (e.g. by a restart) to "
+        "completion; --failed also retries failed jobs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--failed", action="store_true")
+
+    def handle(self, *args, **options):
+        statuses = list(DeletionJob.ACTIVE_STATUSES)
+        if options["failed"]:
+            statuses.append(DeletionJob.STATUS_FAILED)
+        for job_id in DeletionJob.objects.filter(status__in=statuses).order_by(
+            "job_id"
+        ).values_list("job_id", flat=True):
+            job = run_deletion_job(job_id)
+            self.stdout.write(f"job {job.job_id}: {job.status}, {job.deleted_rows} rows")
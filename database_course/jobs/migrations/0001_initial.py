@@ -0,0 +1,33 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionJob',
+            fields=[
+                ('job_id', models.AutoField(primary_key=True, serialize=False)),
+                ('target_type', models.CharField(choices=[('course', 'Course'), ('user', 'User')], max_length=20)),
+                ('target_id', models.IntegerField()),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('progress', models.JSONField(default=dict)),
+                ('deleted_rows', models.IntegerField(default=0)),
+                ('current_step', models.CharField(blank=True, max_length=100)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['target_type', 'target_id'], name='deletion_job_target_idx'), models.Index(fields=['status'], name='deletion_job_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+
+from jobs.runner import schedule_deletion
+from jobs.serializers import DeletionJobSerializer
+
+
+class ScheduledDestroyMixin:
+    """
+    Replaces the synchronous cascade of a DestroyAPIView with a deletion job:
+    the row is marked pending_delete, a 202 with the job is returned and the
+    dependent rows are removed in batches in the background.
+    """
+
+    deletion_target = None
+
+    def destroy(self, request, *args, **kwargs):
+        job = schedule_deletion(self.deletion_target, self.get_object())
+        location = reverse("deletion-job-detail", kwargs={"job_id": job.job_id})
+        return Response(
+            DeletionJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED,
+            headers={"Location": request.build_absolute_uri(location)},
+        )
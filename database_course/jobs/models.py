@@ -0,0 +1,41 @@
+from django.db import models
+
+
+class DeletionJob(models.Model):
+    TARGET_COURSE = "course"
+    TARGET_USER = "user"
+    TARGET_CHOICES = [(TARGET_COURSE, "Course"), (TARGET_USER, "User")]
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+    ACTIVE_STATUSES = [STATUS_PENDING, STATUS_RUNNING]
+
+    job_id = models.AutoField(primary_key=True)
+    target_type = models.CharField(max_length=20, choices=TARGET_CHOICES)
+    target_id = models.IntegerField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    # Rows deleted so far per table, e.g. {"learning.enrollment": 1200}.
+    progress = models.JSONField(default=dict)
+    deleted_rows = models.IntegerField(default=0)
+    current_step = models.CharField(max_length=100, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["target_type", "target_id"], name="deletion_job_target_idx"),
+            models.Index(fields=["status"], name="deletion_job_status_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"delete {self.target_type} {self.target_id} ({self.status})"
@@ -0,0 +1,154 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from jobs.models import DeletionJob
+
+
+logger = logging.getLogger(__name__)
+
+
+def _course_paths():
+    from courses.models import Assignment, Lesson
+    from learning.models import Enrollment
+    from reviews.models import Review
+    from submissions.models import Submission, SubmissionFile
+
+    # Leaf tables first, each with its lookup path to the owning course.
+    return [
+        (SubmissionFile, "submission__assignment__lesson__course", "submission__student"),
+        (Submission, "assignment__lesson__course", "student"),
+        (Review, "enrollment__course", "enrollment__student"),
+        (Enrollment, "course", "student"),
+        (Assignment, "lesson__course", None),
+        (Lesson, "course", None),
+    ]
+
+
+def deletion_plan(job):
+    """
+    Returns the (model, condition) steps that empty the tables below the job's
+    root row, leaf tables first, followed by the root itself.
+    """
+    from accounts.models import User
+    from courses.models import Course
+
+    target_id = job.target_id
+    if job.target_type == DeletionJob.TARGET_COURSE:
+        steps = [
+            (model, Q(**{f"{course_path}_id": target_id}))
+            for model, course_path, _ in _course_paths()
+        ]
+        return steps + [(Course, Q(course_id=target_id))]
+
+    steps = []
+    for model, course_path, student_path in _course_paths():
+        condition = Q(**{f"{course_path}__teacher_id": target_id})
+        if student_path:
+            condition |= Q(**{f"{student_path}_id": target_id})
+        steps.append((model, condition))
+    steps.append((Course, Q(teacher_id=target_id)))
+    return steps + [(User, Q(user_id=target_id))]
+
+
+def _delete_batch(model, condition, batch_size):
+    """
+    Deletes up to batch_size matching rows through the ORM, so signal receivers
+    (course stats, cache tags) see every row. Returns {label: count}.
+    """
+    pks = list(
+        model.objects.filter(condition).order_by("pk").values_list("pk", flat=True)[:batch_size]
+    )
+    if not pks:
+        return {}
+    _, per_model = model.objects.filter(pk__in=pks).delete()
+    return {label.lower(): count for label, count in per_model.items() if count}
+
+
+def run_deletion_job(job_id):
+    """
+    Works through the plan in short transactions of at most
+    DELETION_BATCH_SIZE root rows each, recording progress after every batch.
+    Safe to re-run: finished steps simply find nothing left to delete.
+    """
+    job = DeletionJob.objects.get(job_id=job_id)
+    if job.status == DeletionJob.STATUS_DONE:
+        return job
+    batch_size = getattr(settings, "DELETION_BATCH_SIZE", 500)
+
+    job.status = DeletionJob.STATUS_RUNNING
+    job.started_at = job.started_at or timezone.now()
+    job.error = ""
+    job.save(update_fields=["status", "started_at", "error"])
+
+    try:
+        for model, condition in deletion_plan(job):
+            step = model._meta.label_lower
+            DeletionJob.objects.filter(job_id=job_id).update(current_step=step)
+            while True:
+                with transaction.atomic():
+                    deleted = _delete_batch(model, condition, batch_size)
+                    if not deleted:
+                        break
+                    job.refresh_from_db(fields=["progress"])
+                    for label, count in deleted.items():
+                        job.progress[label] = job.progress.get(label, 0) + count
+                    DeletionJob.objects.filter(job_id=job_id).update(
+                        progress=job.progress,
+                        deleted_rows=F("deleted_rows") + sum(deleted.values()),
+                    )
+    except Exception as exc:
+        logger.exception("Deletion job %s failed", job_id)
+        DeletionJob.objects.filter(job_id=job_id).update(
+            status=DeletionJob.STATUS_FAILED, error=str(exc)
+        )
+    else:
+        DeletionJob.objects.filter(job_id=job_id).update(
+            status=DeletionJob.STATUS_DONE, current_step="", finished_at=timezone.now()
+        )
+    job.refresh_from_db()
+    return job
+
+
+def _run_in_thread(job_id):
+    try:
+        run_deletion_job(job_id)
+    finally:
+        connection.close()
+
+
+def schedule_deletion(target_type, instance):
+    """
+    Marks the root row as pending deletion, records a job and starts it in a
+    background thread once the transaction commits. An active job for the same
+    row is returned instead of starting a second one.
+    """
+    with transaction.atomic():
+        # Locking the root row serialises concurrent requests for it; locking
+        # the job rows alone would lock nothing before the first job exists.
+        type(instance).objects.select_for_update().get(pk=instance.pk)
+        job = (
+            DeletionJob.objects
+            .filter(
+                target_type=target_type,
+                target_id=instance.pk,
+                status__in=DeletionJob.ACTIVE_STATUSES,
+            )
+            .first()
+        )
+        if job is not None:
+            return job
+
+        instance.pending_delete = True
+        instance.save(update_fields=["pending_delete"])
+        job = DeletionJob.objects.create(target_type=target_type, target_id=instance.pk)
+        transaction.on_commit(
+            lambda: threading.Thread(
+                target=_run_in_thread, args=(job.job_id,), daemon=True
+            ).start()
+        )
+    return job
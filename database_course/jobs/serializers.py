@@ -0,0 +1,21 @@
+from rest_framework import serializers
+
+from jobs.models import DeletionJob
+
+
+class DeletionJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = DeletionJob
+        fields = [
+            "job_id",
+            "target_type",
+            "target_id",
+            "status",
+            "current_step",
+            "deleted_rows",
+            "progress",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from jobs import views
+
+
+urlpatterns = [
+    path(
+        "deletions/<int:job_id>/",
+        views.DeletionJobDetailView.as_view(),
+        name="deletion-job-detail",
+    ),
+]
@@ -0,0 +1,10 @@
+from rest_framework import generics
+
+from jobs.models import DeletionJob
+from jobs.serializers import DeletionJobSerializer
+
+
+class DeletionJobDetailView(generics.RetrieveAPIView):
+    queryset = DeletionJob.objects.all()
+    serializer_class = DeletionJobSerializer
+    lookup_field = "job_id"
@@ -0,0 +1,20 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_user_registered_keyset_idx'),
+        ('courses', '0003_course_course_created_keyset_idx'),
+        ('dictionaries', '0007_auto_20260117_1421'),
+        ('learning', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['course', '-enroll_date', '-enrollment_id'], name='enrollment_course_keyset_idx'),
+        ),
+    ]
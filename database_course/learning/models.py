@@ -21,6 +21,12 @@ class Enrollment(models.Model):
                 name="unique_enrollment_per_student_course",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["course", "-enroll_date", "-enrollment_id"],
+                name="enrollment_course_keyset_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.student_id}:{self.course_id}"
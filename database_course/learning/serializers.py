@@ -1,7 +1,7 @@
 from rest_framework import serializers
 
 from accounts.models import Student
-from courses.models import Course
+from courses.models import Assignment, Course
 from dictionaries.models import EnrollmentStatus
 from learning.models import Enrollment
 
@@ -102,3 +102,25 @@ class CourseStudentListSerializer(serializers.ModelSerializer):
             "completion_date",
             "final_grade",
         ]
+
+
+class UpcomingDeadlineSerializer(serializers.ModelSerializer):
+    lesson_id = serializers.IntegerField(read_only=True)
+    lesson_title = serializers.CharField(source="lesson.title", read_only=True)
+    course_id = serializers.IntegerField(source="lesson.course_id", read_only=True)
+    course_title = serializers.CharField(source="lesson.course.title", read_only=True)
+    type_code = serializers.CharField(source="type.code", read_only=True)
+
+    class Meta:
+        model = Assignment
+        fields = [
+            "assignment_id",
+            "title",
+            "deadline",
+            "max_score",
+            "type_code",
+            "lesson_id",
+            "lesson_title",
+            "course_id",
+            "course_title",
+        ]
@@ -5,6 +5,11 @@ from learning import views
 
 urlpatterns = [
     path("enrollments/", views.EnrollmentCreateView.as_view(), name="enrollment-create"),
+    path(
+        "enrollments/export/",
+        views.EnrollmentExportView.as_view(),
+        name="enrollment-export",
+    ),
     path(
         "enrollments/student/<int:student_id>/course/<int:course_id>/status/",
         views.EnrollmentStatusUpdateView.as_view(),
@@ -20,6 +25,11 @@ urlpatterns = [
         views.StudentCourseListView.as_view(),
         name="student-courses",
     ),
+    path(
+        "students/<int:student_id>/deadlines/",
+        views.UpcomingDeadlineListView.as_view(),
+        name="student-deadlines",
+    ),
     path(
         "courses/<int:course_id>/students/",
         views.CourseStudentListView.as_view(),
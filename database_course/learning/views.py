@@ -1,7 +1,12 @@
+from django.db.models import Exists, F, OuterRef
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import generics
 
+from courses.models import Assignment
+from database_course.cache import CachedResponseMixin
+from database_course.export import ExportView
+from database_course.pagination import KeysetOrLimitOffsetPagination
 from learning.models import Enrollment
 from learning.serializers import (
     CourseStudentListSerializer,
@@ -9,7 +14,9 @@ from learning.serializers import (
     EnrollmentCreateSerializer,
     EnrollmentStatusUpdateSerializer,
     StudentCourseListSerializer,
+    UpcomingDeadlineSerializer,
 )
+from submissions.models import Submission
 
 
 class EnrollmentCreateView(generics.CreateAPIView):
@@ -44,9 +51,12 @@ class EnrollmentCompleteView(generics.UpdateAPIView):
         serializer.save(completion_date=timezone.now())
 
 
-class StudentCourseListView(generics.ListAPIView):
+class StudentCourseListView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = StudentCourseListSerializer
 
+    def get_cache_tags(self):
+        return [f"student:{self.kwargs['student_id']}", "courses", "dictionaries"]
+
     def get_queryset(self):
         student_id = self.kwargs["student_id"]
         return Enrollment.objects.select_related("course", "status").filter(
@@ -54,11 +64,72 @@ class StudentCourseListView(generics.ListAPIView):
         ).order_by("-enroll_date")
 
 
-class CourseStudentListView(generics.ListAPIView):
+class CourseStudentListView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = CourseStudentListSerializer
+    pagination_class = KeysetOrLimitOffsetPagination
+
+    def get_cache_tags(self):
+        return [f"course:{self.kwargs['course_id']}", "dictionaries"]
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        self.add_cache_tags(*(f"student:{row.student_id}" for row in page or queryset))
+        return page
 
     def get_queryset(self):
         course_id = self.kwargs["course_id"]
         return Enrollment.objects.select_related("student__user", "status").filter(
             course_id=course_id
-        ).order_by("-enroll_date")
+        ).order_by("-enroll_date", "-enrollment_id")
+
+
+class UpcomingDeadlineListView(generics.ListAPIView):
+    """
+    A student's not yet submitted assignments with an upcoming deadline across
+    their active enrollments, soonest first. Walks assignment_deadline_idx in
+    order with a semi-join on the enrollment and an anti-join on submissions,
+    so ``?pagination=cursor`` pages stay cheap however far the feed goes.
+    """
+
+    serializer_class = UpcomingDeadlineSerializer
+    pagination_class = KeysetOrLimitOffsetPagination
+
+    def get_queryset(self):
+        student_id = self.kwargs["student_id"]
+        enrolled = Enrollment.objects.filter(
+            student_id=student_id,
+            course_id=OuterRef("lesson__course_id"),
+            status__code="active",
+        )
+        submitted = Submission.objects.filter(
+            student_id=student_id, assignment_id=OuterRef("assignment_id")
+        )
+        return (
+            Assignment.objects.select_related("lesson__course", "type")
+            .filter(
+                Exists(enrolled),
+                ~Exists(submitted),
+                deadline__gte=timezone.now(),
+                lesson__course__pending_delete=False,
+            )
+            .order_by("deadline", "assignment_id")
+        )
+
+
+class EnrollmentExportView(ExportView):
+    export_name = "enrollments"
+    export_fields = (
+        "enrollment_id",
+        "student_id",
+        "course_id",
+        "enroll_date",
+        "completion_date",
+        "final_grade",
+        "status_id",
+    )
+    export_expressions = {"status_code": F("status__code")}
+
+    def get_export_queryset(self):
+        return Enrollment.objects.filter(
+            course__pending_delete=False, student__user__pending_delete=False
+        ).order_by("enrollment_id")
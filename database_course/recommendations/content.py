@@ -0,0 +1,192 @@
+import math
+import re
+import threading
+import zlib
+from collections import defaultdict
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from courses.models import Course, Lesson
+from database_course.cache import invalidate_tags, tag_versions
+from recommendations.models import CourseContentVector
+
+
+VECTORS_TAG = "content-vectors"
+TITLE_WEIGHT = 2
+BLOCK_SIZE = 10000
+# Rows written by a transaction that committed just after a sync started.
+SYNC_OVERLAP = timedelta(seconds=30)
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def _dimensions():
+    return getattr(settings, "CONTENT_VECTOR_DIMENSIONS", 512)
+
+
+def hashed_term_vector(texts):
+    """
+    Signed feature hashing of (text, weight) pairs into a float32 vector with
+    sublinear term frequencies. CRC32 keeps the buckets stable across processes.
+    """
+    dimensions = _dimensions()
+    counts = defaultdict(float)
+    for text, weight in texts:
+        for token in TOKEN_RE.findall(text.lower()):
+            counts[token] += weight
+
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for token, count in counts.items():
+        digest = zlib.crc32(token.encode())
+        sign = 1.0 if digest & 0x80000000 else -1.0
+        vector[digest % dimensions] += sign * (1.0 + math.log(count))
+    return vector
+
+
+def update_course_vectors(course_ids):
+    """
+    Recomputes and upserts the term vectors of the given courses from their
+    title, description and lesson titles. Deleted courses are skipped.
+    """
+    course_ids = set(course_ids)
+    courses = Course.objects.filter(course_id__in=course_ids).values_list(
+        "course_id", "title", "description"
+    )
+    lesson_titles = defaultdict(list)
+    for course_id, title in Lesson.objects.filter(course_id__in=course_ids).values_list(
+        "course_id", "title"
+    ):
+        lesson_titles[course_id].append(title)
+
+    now = timezone.now()
+    vectors = [
+        CourseContentVector(
+            course_id=course_id,
+            vector=hashed_term_vector(
+                [(title, TITLE_WEIGHT), (description, 1)]
+                + [(lesson, 1) for lesson in lesson_titles[course_id]]
+            ).tobytes(),
+            updated_at=now,
+        )
+        for course_id, title, description in courses
+    ]
+    CourseContentVector.objects.bulk_create(
+        vectors,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["course"],
+        update_fields=["vector", "updated_at"],
+    )
+    invalidate_tags(VECTORS_TAG)
+    return len(vectors)
+
+
+def schedule_vector_update(*course_ids):
+    course_ids = {course_id for course_id in course_ids if course_id is not None}
+    if course_ids:
+        transaction.on_commit(lambda: update_course_vectors(course_ids))
+
+
+class ContentIndex:
+    """
+    Process-local copy of all course vectors with TF-IDF weighting applied.
+    It syncs lazily: when the vectors tag moves, only the rows updated since
+    the previous sync are read, plus the id list to drop deleted courses.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        self.synced_at = None
+        self.course_ids = np.empty(0, dtype=np.int64)
+        self.term_vectors = np.empty((0, _dimensions()), dtype=np.float32)
+        self.weighted = self.term_vectors
+
+    def sync(self):
+        version = tag_versions([VECTORS_TAG])[VECTORS_TAG]
+        with self.lock:
+            if version == self.version:
+                return
+            started = timezone.now()
+            changed = CourseContentVector.objects.all()
+            if self.synced_at is not None:
+                changed = changed.filter(updated_at__gte=self.synced_at - SYNC_OVERLAP)
+            vectors = dict(zip(self.course_ids.tolist(), self.term_vectors))
+            vectors.update(
+                (course_id, np.frombuffer(vector, dtype=np.float32))
+                for course_id, vector in changed.values_list("course_id", "vector").iterator()
+            )
+            course_ids = np.array(
+                sorted(CourseContentVector.objects.values_list("course_id", flat=True)),
+                dtype=np.int64,
+            )
+            term_vectors = np.empty((len(course_ids), _dimensions()), dtype=np.float32)
+            for row, course_id in enumerate(course_ids.tolist()):
+                term_vectors[row] = vectors[course_id]
+
+            self.course_ids = course_ids
+            self.term_vectors = term_vectors
+            self.weighted = _tf_idf(term_vectors)
+            self.version = version
+            self.synced_at = started
+
+    def nearest(self, course_ids, top_k):
+        """
+        Returns {course_id: [(neighbour_id, score), ...]} for a batch of courses,
+        scored against the whole index in blocks of BLOCK_SIZE rows. Courses
+        missing from the index get no entry.
+        """
+        self.sync()
+        index_ids, weighted = self.course_ids, self.weighted
+        course_ids = np.asarray(sorted(set(course_ids)), dtype=np.int64)
+        positions = np.searchsorted(index_ids, course_ids)
+        found = positions < len(index_ids)
+        found[found] = index_ids[positions[found]] == course_ids[found]
+        positions = positions[found]
+        if not len(positions):
+            return {}
+
+        queries = weighted[positions]
+        scores = np.empty((len(positions), len(index_ids)), dtype=np.float32)
+        for start in range(0, len(index_ids), BLOCK_SIZE):
+            scores[:, start:start + BLOCK_SIZE] = queries @ weighted[start:start + BLOCK_SIZE].T
+        scores[np.arange(len(positions)), positions] = -np.inf
+
+        top_k = min(top_k, len(index_ids) - 1)
+        result = {}
+        for row, position in enumerate(positions.tolist()):
+            if top_k <= 0:
+                result[int(index_ids[position])] = []
+                continue
+            best = np.argpartition(-scores[row], top_k - 1)[:top_k]
+            best = best[np.lexsort((index_ids[best], -scores[row, best]))]
+            result[int(index_ids[position])] = [
+                (int(index_ids[column]), float(scores[row, column]))
+                for column in best
+                if scores[row, column] > 0
+            ]
+        return result
+
+
+def _tf_idf(term_vectors):
+    """
+    Weights hashed buckets by inverse document frequency and L2-normalises
+    the rows, so a dot product is the cosine similarity.
+    """
+    frequency = np.count_nonzero(term_vectors, axis=0)
+    idf = np.log((1 + len(term_vectors)) / (1 + frequency)).astype(np.float32) + 1
+    weighted = term_vectors * idf
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    return weighted / np.maximum(norms, np.float32(1e-12))
+
+
+content_index = ContentIndex()
+
+
+def similar_courses(course_id, top_k=None):
+    top_k = top_k or getattr(settings, "CONTENT_SIMILAR_TOP_K", 10)
+    return content_index.nearest([course_id], top_k).get(course_id, [])
@@ -0,0 +1,159 @@
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from scipy import sparse
+
+from database_course.cache import invalidate_tags
+from courses.models import CourseStats
+from learning.models import Enrollment
+from recommendations.models import CourseRecommendation, DirtyCourse
+
+
+BLOCK_SIZE = 1000
+
+
+def load_enrollment_matrix(course_ids=None):
+    """
+    Returns (course_ids, X) where X is the binary students x courses CSR matrix
+    and course_ids maps its columns back to courses. By default all
+    enrollments are read; with ``course_ids`` only the full enrollment rows of
+    the students of those courses, which is all their neighbours depend on.
+    """
+    enrollments = Enrollment.objects.all()
+    if course_ids is not None:
+        enrollments = enrollments.filter(
+            student_id__in=Enrollment.objects.filter(course_id__in=course_ids).values("student_id")
+        )
+    pairs = np.fromiter(
+        (
+            value
+            for row in enrollments.values_list("student_id", "course_id")
+            .order_by()
+            .iterator(chunk_size=10000)
+            for value in row
+        ),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    _, student_index = np.unique(pairs[:, 0], return_inverse=True)
+    course_ids, course_index = np.unique(pairs[:, 1], return_inverse=True)
+    matrix = sparse.csr_matrix(
+        (np.ones(len(pairs), dtype=np.float32), (student_index, course_index)),
+        shape=(student_index.max(initial=-1) + 1, len(course_ids)),
+    )
+    return course_ids, matrix
+
+
+def top_neighbours(matrix, columns, top_k, sizes=None):
+    """
+    Yields (column, neighbour_columns, scores, common_counts) for the given
+    columns, using cosine similarity of the co-enrollment counts:
+    |A & B| / sqrt(|A| * |B|). Rows are computed in blocks of sparse products.
+    ``sizes`` gives every column's student count when the matrix holds only
+    part of the students; by default the column sums are used.
+    """
+    by_course = matrix.tocsc()
+    if sizes is None:
+        sizes = np.asarray(by_course.sum(axis=0)).ravel()
+
+    for start in range(0, len(columns), BLOCK_SIZE):
+        block = np.asarray(columns[start:start + BLOCK_SIZE])
+        common = (by_course[:, block].T @ by_course).tocsr()
+        for row, column in enumerate(block):
+            begin, end = common.indptr[row], common.indptr[row + 1]
+            neighbours = common.indices[begin:end]
+            counts = common.data[begin:end]
+            values = counts / np.sqrt(sizes[column] * sizes[neighbours])
+            keep = neighbours != column
+            neighbours, values, counts = neighbours[keep], values[keep], counts[keep]
+            if len(values) > top_k:
+                best = np.argpartition(-values, top_k)[:top_k]
+                neighbours, values, counts = neighbours[best], values[best], counts[best]
+            order = np.lexsort((neighbours, -values))
+            yield column, neighbours[order], values[order], counts[order]
+
+
+def refresh_recommendations(full=False):
+    """
+    Recomputes the stored neighbours. Incrementally, only the dirty courses,
+    the courses sharing a student with them and the courses whose stored
+    neighbours include them (they may have lost that shared student) are
+    recomputed, since no other pair's score can have changed. Only the
+    enrollments of those courses' students are read. Returns the number of
+    courses rewritten.
+    """
+    top_k = getattr(settings, "RECOMMENDATIONS_TOP_K", 10)
+    marks = list(DirtyCourse.objects.values_list("course_id", "marked_at"))
+    dirty = [course_id for course_id, _ in marks]
+    if not full and not dirty:
+        return 0
+
+    if full:
+        course_ids, matrix = load_enrollment_matrix()
+        columns = np.arange(len(course_ids))
+        sizes = None
+    else:
+        affected = set(dirty)
+        affected.update(
+            Enrollment.objects.filter(
+                student_id__in=Enrollment.objects.filter(course_id__in=dirty).values("student_id")
+            )
+            .order_by()
+            .values_list("course_id", flat=True)
+            .distinct()
+        )
+        affected.update(
+            CourseRecommendation.objects.filter(recommended_course_id__in=dirty).values_list(
+                "course_id", flat=True
+            )
+        )
+        course_ids, matrix = load_enrollment_matrix(affected)
+        columns = np.flatnonzero(np.isin(course_ids, list(affected)))
+        # The matrix holds only some students of the neighbouring courses.
+        stored_sizes = dict(
+            CourseStats.objects.filter(course_id__in=course_ids.tolist()).values_list(
+                "course_id", "enrollment_count"
+            )
+        )
+        column_sums = np.asarray(matrix.sum(axis=0)).ravel()
+        sizes = np.array(
+            [
+                max(stored_sizes.get(course_id, 0), column_sum)
+                for course_id, column_sum in zip(course_ids.tolist(), column_sums)
+            ],
+            dtype=np.float64,
+        )
+
+    rows = []
+    for column, neighbours, scores, counts in top_neighbours(matrix, columns, top_k, sizes):
+        rows.extend(
+            CourseRecommendation(
+                course_id=int(course_ids[column]),
+                recommended_course_id=int(course_ids[neighbour]),
+                rank=rank,
+                score=float(score),
+                common_students=int(count),
+            )
+            for rank, (neighbour, score, count) in enumerate(
+                zip(neighbours, scores, counts), start=1
+            )
+        )
+
+    rewritten = {int(course_ids[column]) for column in columns}
+    if not full:
+        # Affected courses without enrollments left lose their rows too.
+        rewritten |= affected
+    with transaction.atomic():
+        stale = CourseRecommendation.objects.all()
+        if not full:
+            stale = stale.filter(course_id__in=rewritten)
+        stale.delete()
+        CourseRecommendation.objects.bulk_create(rows, batch_size=5000)
+        if marks:
+            # Courses marked again while this refresh ran stay dirty for the next one.
+            DirtyCourse.objects.filter(
+                course_id__in=dirty, marked_at__lte=max(marked_at for _, marked_at in marks)
+            ).delete()
+        invalidate_tags(
+            *(f"recommendations:{course_id}" for course_id in rewritten | set(dirty))
+        )
+    return len(rewritten)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from courses.models import Course
+from database_course.benchmarking import timed
+from recommendations.content import content_index, similar_courses, update_course_vectors
+
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the content vectors of every course (needed once after "
+        "deploying, and after changing CONTENT_VECTOR_DIMENSIONS), then times "
+        "loading the index and one nearest-neighbour query."
+    )
+
+    def handle(self, *args, **options):
+        course_ids = list(Course.objects.order_by("course_id").values_list("course_id", flat=True))
+        with timed(self.stdout, f"vectorise {len(course_ids)} courses"):
+            for start in range(0, len(course_ids), BATCH_SIZE):
+                update_course_vectors(course_ids[start:start + BATCH_SIZE])
+        with timed(self.stdout, "load index"):
+            content_index.sync()
+        if course_ids:
+            with timed(self.stdout, "query"):
+                similar_courses(course_ids[0])
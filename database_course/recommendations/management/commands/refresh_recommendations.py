@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from database_course.benchmarking import timed
+from recommendations.engine import refresh_recommendations
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes co-enrollment recommendations for courses whose enrollments "
+        "changed since the last run (schedule it, e.g. every few minutes); "
+        "--full rebuilds every course."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true")
+
+    def handle(self, *args, **options):
+        with timed(self.stdout, "refresh"):
+            count = refresh_recommendations(full=options["full"])
+        self.stdout.write(f"Rewrote recommendations for {count} courses.")
@@ -0,0 +1,23 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0008_assignment_assignment_deadline_idx'),
+        ('recommendations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseContentVector',
+            fields=[
+                ('course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to='courses.course')),
+                ('vector', models.BinaryField()),
+                ('updated_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
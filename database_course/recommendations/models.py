@@ -0,0 +1,48 @@
+from django.db import models
+
+from courses.models import Course
+
+
+class CourseRecommendation(models.Model):
+    """
+    Top-K co-enrollment neighbours of a course, rebuilt by
+    ``refresh_recommendations``.
+    """
+
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+    recommended_course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="+")
+    rank = models.SmallIntegerField()
+    score = models.FloatField()
+    common_students = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["course", "rank"], name="unique_recommendation_rank_per_course"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.course_id} -> {self.recommended_course_id} ({self.score:.3f})"
+
+
+class DirtyCourse(models.Model):
+    """
+    Courses whose enrollments changed since the last refresh.
+    """
+
+    course_id = models.IntegerField(primary_key=True)
+    marked_at = models.DateTimeField(auto_now=True)
+
+
+class CourseContentVector(models.Model):
+    """
+    Hashed term-frequency vector (float32 bytes) of a course's title,
+    description and lesson titles; see ``recommendations.content``.
+    """
+
+    course = models.OneToOneField(
+        Course, on_delete=models.CASCADE, primary_key=True, related_name="+"
+    )
+    vector = models.BinaryField()
+    updated_at = models.DateTimeField(db_index=True)
@@ -0,0 +1,18 @@
+from rest_framework import serializers
+
+from recommendations.models import CourseRecommendation
+
+
+class CourseRecommendationSerializer(serializers.ModelSerializer):
+    course_id = serializers.IntegerField(source="recommended_course_id", read_only=True)
+    title = serializers.CharField(source="recommended_course.title", read_only=True)
+
+    class Meta:
+        model = CourseRecommendation
+        fields = ["course_id", "title", "rank", "score", "common_students"]
+
+
+class SimilarCourseSerializer(serializers.Serializer):
+    course_id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    score = serializers.FloatField(read_only=True)
@@ -0,0 +1,52 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from courses.models import Course, Lesson
+from courses.signals import course_content_changed, previous_state
+from learning.models import Enrollment
+from recommendations.content import schedule_vector_update
+from recommendations.models import DirtyCourse
+
+
+def _mark_dirty(course_id):
+    DirtyCourse.objects.bulk_create(
+        [DirtyCourse(course_id=course_id)],
+        update_conflicts=True,
+        unique_fields=["course_id"],
+        update_fields=["marked_at"],
+    )
+
+
+@receiver(post_save, sender=Enrollment)
+def mark_course_on_enroll(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        _mark_dirty(instance.course_id)
+
+
+@receiver(post_delete, sender=Enrollment)
+def mark_course_on_unenroll(sender, instance, **kwargs):
+    _mark_dirty(instance.course_id)
+
+
+# Content vectors
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def update_vector_on_course_change(sender, instance, raw=False, **kwargs):
+    # A deleted course writes nothing but still moves the index version.
+    if not raw:
+        schedule_vector_update(instance.course_id)
+
+
+@receiver(post_save, sender=Lesson)
+@receiver(post_delete, sender=Lesson)
+def update_vector_on_lesson_change(sender, instance, raw=False, **kwargs):
+    if not raw:
+        previous = previous_state(instance)
+        schedule_vector_update(instance.course_id, previous and previous["course_id"])
+
+
+@receiver(course_content_changed)
+def update_vectors_on_bulk_change(sender, course_ids, **kwargs):
+    schedule_vector_update(*course_ids)
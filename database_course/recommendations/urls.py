@@ -0,0 +1,17 @@
+from django.urls import path
+
+from recommendations import views
+
+
+urlpatterns = [
+    path(
+        "<int:course_id>/recommendations/",
+        views.CourseRecommendationListView.as_view(),
+        name="course-recommendations",
+    ),
+    path(
+        "<int:course_id>/similar/",
+        views.SimilarCourseListView.as_view(),
+        name="course-similar",
+    ),
+]
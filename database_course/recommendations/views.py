@@ -0,0 +1,61 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import generics
+from rest_framework.response import Response
+
+from courses.models import Course
+from database_course.cache import CachedResponseMixin
+from recommendations.content import VECTORS_TAG, similar_courses
+from recommendations.models import CourseRecommendation
+from recommendations.serializers import CourseRecommendationSerializer, SimilarCourseSerializer
+
+
+class CourseRecommendationListView(CachedResponseMixin, generics.ListAPIView):
+    """
+    "Students who took this also took": served from the precomputed
+    neighbours in a single indexed lookup.
+    """
+
+    serializer_class = CourseRecommendationSerializer
+    pagination_class = None
+
+    def get_cache_tags(self):
+        return [f"recommendations:{self.kwargs['course_id']}", "courses"]
+
+    def get_queryset(self):
+        return (
+            CourseRecommendation.objects.select_related("recommended_course")
+            .filter(
+                course_id=self.kwargs["course_id"],
+                recommended_course__pending_delete=False,
+            )
+            .order_by("rank")
+        )
+
+
+class SimilarCourseListView(CachedResponseMixin, generics.GenericAPIView):
+    """
+    Courses whose title, description and lesson titles read alike, ranked by
+    cosine similarity of their TF-IDF vectors. Works for courses that have
+    no enrollments yet.
+    """
+
+    serializer_class = SimilarCourseSerializer
+
+    def get_cache_tags(self):
+        return [VECTORS_TAG, "courses"]
+
+    def get(self, request, course_id):
+        course = get_object_or_404(Course, course_id=course_id, pending_delete=False)
+        neighbours = similar_courses(course.course_id)
+        titles = dict(
+            Course.objects.filter(
+                course_id__in=[neighbour_id for neighbour_id, _ in neighbours],
+                pending_delete=False,
+            ).values_list("course_id", "title")
+        )
+        results = [
+            {"course_id": neighbour_id, "title": titles[neighbour_id], "score": score}
+            for neighbour_id, score in neighbours
+            if neighbour_id in titles
+        ]
+        return Response(self.get_serializer(results, many=True).data)
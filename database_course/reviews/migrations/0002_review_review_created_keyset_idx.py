@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('learning', '0002_enrollment_enrollment_course_keyset_idx'),
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['-created_at', '-review_id'], name='review_created_keyset_idx'),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 from learning.models import Enrollment
@@ -8,7 +9,7 @@ class Review(models.Model):
     enrollment = models.ForeignKey(
         Enrollment, on_delete=models.CASCADE, related_name="reviews"
     )
-    rating = models.IntegerField()
+    rating = models.IntegerField(validators=[MinValueValidator(1), MaxValueValidator(5)])
     comment = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -19,6 +20,9 @@ class Review(models.Model):
                 name="unique_review_per_enrollment",
             )
         ]
+        indexes = [
+            models.Index(fields=["-created_at", "-review_id"], name="review_created_keyset_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.enrollment_id}"
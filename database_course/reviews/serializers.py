@@ -58,3 +58,5 @@ class ReviewListSerializer(serializers.ModelSerializer):
 class ReviewAggregateSerializer(serializers.Serializer):
     reviews_count = serializers.IntegerField()
     avg_rating = serializers.DecimalField(max_digits=10, decimal_places=2)
+    bayesian_score = serializers.FloatField()
+    rating_histogram = serializers.DictField(child=serializers.IntegerField())
@@ -1,3 +1,50 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
+
+from analytics.models import DailyRollup
+from analytics.rollups import rebuild_rollups
+from courses.tests import create_course, create_student, create_teacher
+from dictionaries.models import EnrollmentStatus
+from learning.models import Enrollment
+from reviews.models import Review
+
+
+def rollup_rows():
+    return sorted(
+        DailyRollup.objects.exclude(enrollments=0, completions=0, reviews=0, revenue=0)
+        .values_list("scope", "scope_id", "day", "enrollments", "completions", "reviews", "revenue")
+    )
+
+
+class ReviewRollupTests(TestCase):
+    def setUp(self):
+        course = create_course(create_teacher())
+        enrollment = Enrollment.objects.create(
+            student=create_student(),
+            course=course,
+            status=EnrollmentStatus.objects.get_or_create(code="active", defaults={"name": "Active"})[0],
+        )
+        self.review = Review.objects.create(enrollment=enrollment, rating=4)
+        Review.objects.filter(pk=self.review.pk).update(
+            created_at=timezone.now() - timedelta(days=3)
+        )
+        self.review.refresh_from_db()
+        rebuild_rollups()
+
+    def assert_matches_rebuild(self):
+        incremental = rollup_rows()
+        rebuild_rollups()
+        self.assertEqual(incremental, rollup_rows())
+
+    def test_edited_review_moves_to_its_new_day(self):
+        # As ReviewByEnrollmentView.perform_update does.
+        self.review.rating = 5
+        self.review.created_at = timezone.now()
+        self.review.save()
+        self.assert_matches_rebuild()
 
-# Create your tests here.
+        self.review.delete()
+        self.assert_matches_rebuild()
+        self.assertFalse(DailyRollup.objects.filter(reviews__lt=0).exists())
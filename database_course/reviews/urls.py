@@ -6,6 +6,7 @@ from reviews import views
 urlpatterns = [
     path("", views.ReviewCreateView.as_view(), name="review-create"),
     path("<int:review_id>/", views.ReviewDetailView.as_view(), name="review-detail"),
+    path("export/", views.ReviewExportView.as_view(), name="review-export"),
     path(
         "<int:review_id>/update/",
         views.ReviewUpdateView.as_view(),
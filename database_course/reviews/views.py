@@ -1,9 +1,16 @@
-from django.db.models import Avg, Count
+from decimal import Decimal
+
+from django.db.models import F
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import generics
 from rest_framework.response import Response
 
+from courses.models import CourseStats
+from courses.stats import RATING_FIELDS, RATINGS
+from database_course.cache import CachedResponseMixin
+from database_course.export import ExportView
+from database_course.pagination import KeysetOrLimitOffsetPagination
 from reviews.models import Review
 from reviews.serializers import (
     ReviewAggregateSerializer,
@@ -25,16 +32,22 @@ class ReviewUpdateView(generics.UpdateAPIView):
     lookup_field = "review_id"
 
 
-class ReviewDetailView(generics.RetrieveAPIView):
+class ReviewDetailView(CachedResponseMixin, generics.RetrieveAPIView):
     queryset = Review.objects.all()
     serializer_class = ReviewDetailSerializer
     lookup_field = "review_id"
 
+    def get_cache_tags(self):
+        return [f"review:{self.kwargs['review_id']}"]
+
 
-class ReviewByEnrollmentView(generics.RetrieveUpdateAPIView):
+class ReviewByEnrollmentView(CachedResponseMixin, generics.RetrieveUpdateAPIView):
     queryset = Review.objects.all()
     serializer_class = ReviewDetailSerializer
 
+    def get_cache_tags(self):
+        return [f"enrollment:{self.kwargs['enrollment_id']}"]
+
     def get_object(self):
         return get_object_or_404(
             Review,
@@ -50,8 +63,19 @@ class ReviewByEnrollmentView(generics.RetrieveUpdateAPIView):
         serializer.save(created_at=timezone.now())
 
 
-class ReviewListView(generics.ListAPIView):
+class ReviewListView(CachedResponseMixin, generics.ListAPIView):
     serializer_class = ReviewListSerializer
+    pagination_class = KeysetOrLimitOffsetPagination
+
+    def get_cache_tags(self):
+        return [f"course:{self.kwargs['course_id']}"]
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        self.add_cache_tags(
+            *(f"student:{review.enrollment.student_id}" for review in page or queryset)
+        )
+        return page
 
     def get_queryset(self):
         course_id = self.kwargs["course_id"]
@@ -59,18 +83,47 @@ class ReviewListView(generics.ListAPIView):
             "enrollment__student__user"
         ).filter(
             enrollment__course_id=course_id
-        ).order_by("-created_at")
+        ).order_by("-created_at", "-review_id")
 
 
-class ReviewAggregateView(generics.GenericAPIView):
+class ReviewAggregateView(CachedResponseMixin, generics.GenericAPIView):
     serializer_class = ReviewAggregateSerializer
 
+    def get_cache_tags(self):
+        return [f"course:{self.kwargs['course_id']}"]
+
     def get(self, request, *args, **kwargs):
         course_id = self.kwargs["course_id"]
-        data = Review.objects.filter(enrollment__course_id=course_id).aggregate(
-            reviews_count=Count("review_id"), avg_rating=Avg("rating")
-        )
-        data["reviews_count"] = int(data["reviews_count"] or 0)
-        data["avg_rating"] = data["avg_rating"] or 0
+        stats = (
+            CourseStats.objects.filter(course_id=course_id)
+            .values("review_count", "rating_sum", "bayesian_score", *RATING_FIELDS)
+            .first()
+        ) or dict.fromkeys(["review_count", "rating_sum", "bayesian_score", *RATING_FIELDS], 0)
+        reviews_count = stats["review_count"]
+        data = {
+            "reviews_count": reviews_count,
+            "avg_rating": (
+                Decimal(stats["rating_sum"]) / reviews_count if reviews_count else 0
+            ),
+            "bayesian_score": stats["bayesian_score"],
+            "rating_histogram": {
+                str(rating): stats[f"rating_{rating}"] for rating in RATINGS
+            },
+        }
         serializer = self.get_serializer(data)
         return Response(serializer.data)
+
+
+class ReviewExportView(ExportView):
+    export_name = "reviews"
+    export_fields = ("review_id", "enrollment_id", "rating", "comment", "created_at")
+    export_expressions = {
+        "course_id": F("enrollment__course_id"),
+        "student_id": F("enrollment__student_id"),
+    }
+
+    def get_export_queryset(self):
+        return Review.objects.filter(
+            enrollment__course__pending_delete=False,
+            enrollment__student__user__pending_delete=False,
+        ).order_by("review_id")
@@ -0,0 +1,19 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_user_registered_keyset_idx'),
+        ('courses', '0003_course_course_created_keyset_idx'),
+        ('submissions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['assignment', '-submitted_at', '-submission_id'], name='submission_assign_keyset_idx'),
+        ),
+    ]
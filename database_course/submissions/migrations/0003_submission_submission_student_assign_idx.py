@@ -0,0 +1,19 @@
+# Generated by Django 6.1.2 on 2026-10-18 14:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_user_pending_delete'),
+        ('courses', '0008_assignment_assignment_deadline_idx'),
+        ('submissions', '0002_submission_submission_assign_keyset_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['student', 'assignment'], name='submission_student_assign_idx'),
+        ),
+    ]
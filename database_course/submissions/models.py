@@ -19,6 +19,13 @@ class Submission(models.Model):
                 name="unique_submission_per_assignment_student",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["assignment", "-submitted_at", "-submission_id"],
+                name="submission_assign_keyset_idx",
+            ),
+            models.Index(fields=["student", "assignment"], name="submission_student_assign_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.assignment_id}:{self.student_id}"
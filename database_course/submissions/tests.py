@@ -1,3 +1,45 @@
 from django.test import TestCase
 
-# Create your tests here.
+from analytics.grades import rebuild_grade_stats
+from analytics.models import GradeStats
+from courses.models import Assignment, Lesson
+from courses.tests import create_course, create_student, create_teacher
+from dictionaries.models import AssignmentType
+from submissions.models import Submission
+
+
+def assignment_stats(assignment):
+    return GradeStats.objects.values_list("count", "mean", "m2", "histogram").get(
+        scope=GradeStats.SCOPE_ASSIGNMENT, scope_id=assignment.pk
+    )
+
+
+class AssignmentGradeStatsTests(TestCase):
+    def test_max_score_change_rescales_the_stats(self):
+        lesson = Lesson.objects.create(
+            course=create_course(create_teacher()), title="Joins", lesson_order=1
+        )
+        assignment = Assignment.objects.create(
+            lesson=lesson,
+            title="Homework",
+            max_score=10,
+            type=AssignmentType.objects.get_or_create(code="homework", defaults={"name": "Homework"})[0],
+        )
+        for index, score in enumerate((4, 7, 10)):
+            Submission.objects.create(
+                assignment=assignment,
+                student=create_student(f"student{index}@example.com"),
+                score=score,
+            )
+
+        assignment.max_score = 20
+        assignment.save()
+        incremental = assignment_stats(assignment)
+        rebuild_grade_stats()
+        count, mean, m2, histogram = assignment_stats(assignment)
+
+        self.assertEqual(incremental[0], count)
+        self.assertAlmostEqual(incremental[1], mean)
+        self.assertAlmostEqual(incremental[2], m2)
+        self.assertEqual(incremental[3], histogram)
+        self.assertAlmostEqual(mean, 0.35)
@@ -5,6 +5,7 @@ from submissions import views
 
 urlpatterns = [
     path("", views.SubmissionCreateView.as_view(), name="submission-create"),
+    path("export/", views.SubmissionExportView.as_view(), name="submission-export"),
     path(
         "<int:submission_id>/",
         views.SubmissionDetailView.as_view(),
@@ -1,5 +1,8 @@
+from django.db.models import F
 from rest_framework import generics
 
+from database_course.export import ExportView
+from database_course.pagination import KeysetOrLimitOffsetPagination
 from submissions.models import Submission, SubmissionFile
 from submissions.serializers import (
     SubmissionCourseListSerializer,
@@ -31,12 +34,13 @@ class SubmissionDetailView(generics.RetrieveAPIView):
 
 class SubmissionListByAssignmentView(generics.ListAPIView):
     serializer_class = SubmissionListByAssignmentSerializer
+    pagination_class = KeysetOrLimitOffsetPagination
 
     def get_queryset(self):
         assignment_id = self.kwargs["assignment_id"]
         return Submission.objects.select_related("student__user").filter(
             assignment_id=assignment_id
-        ).order_by("-submitted_at")
+        ).order_by("-submitted_at", "-submission_id")
 
 
 class SubmissionCourseListView(generics.ListAPIView):
@@ -74,3 +78,22 @@ class SubmissionFileListView(generics.ListAPIView):
 class SubmissionFileDeleteView(generics.DestroyAPIView):
     queryset = SubmissionFile.objects.all()
     lookup_field = "file_id"
+
+
+class SubmissionExportView(ExportView):
+    export_name = "submissions"
+    export_fields = (
+        "submission_id",
+        "assignment_id",
+        "student_id",
+        "submitted_at",
+        "score",
+        "feedback",
+    )
+    export_expressions = {"course_id": F("assignment__lesson__course_id")}
+
+    def get_export_queryset(self):
+        return Submission.objects.filter(
+            assignment__lesson__course__pending_delete=False,
+            student__user__pending_delete=False,
+        ).order_by("submission_id")